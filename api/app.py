@@ -1,6 +1,10 @@
 import logging
+import os
 import time
+import uuid
+import weakref
 from pathlib import Path
+from typing import Optional
 
 from flask import Flask, current_app, g, jsonify, redirect, request, send_file
 from flask_cors import CORS
@@ -12,20 +16,50 @@ from werkzeug.middleware.proxy_fix import ProxyFix
 
 from config import get_config
 from extensions import db, migrate
-from logging_config import configure_logging
-from observability import MetricsFormatter, ObservabilityMetrics
+from logging_config import ACCESS_LOG_FLAG, configure_logging
+from observability import (
+    PRE_PING_STRATEGIES,
+    MetricsFormatter,
+    ObservabilityMetrics,
+    RuntimeCollector,
+    configure_pre_ping,
+    instrument_pool,
+    instrument_sqlalchemy,
+    instrumented_engine_options,
+    repeated_statements,
+    request_db_stats,
+)
 from blueprints import register_blueprints
-from seeds import bootstrap_seed_data
 import models  # noqa: F401  # Ensure models are registered before migrations
+from services.article_export import register_export_command
+from services.database_bootstrap import (
+    BOOTSTRAP_MODES,
+    bootstrap_on_startup,
+    register_bootstrap_command,
+    run_database_bootstrap,
+)
 from services.keycloak_client import init_keycloak_client
+from services.fragment_cache import init_fragment_cache
+from services.read_model import init_read_model
+from services.read_replicas import init_read_replicas
+from services.result_cache import init_result_cache
 
 
-def create_app() -> Flask:
+def create_app(config_overrides: Optional[dict] = None) -> Flask:
     config_class = get_config()
-    configure_logging(config_class.LOG_DIR, config_class.LOG_LEVEL)
+    configure_logging(
+        config_class.LOG_DIR,
+        config_class.LOG_LEVEL,
+        json_lines=config_class.LOG_JSON,
+        access_sample_rate=config_class.LOG_ACCESS_SAMPLE_RATE,
+        sql_level=config_class.LOG_SQL_LEVEL,
+        sql_sample_rate=config_class.LOG_SQL_SAMPLE_RATE,
+        per_process_files=config_class.LOG_FILE_PER_PROCESS,
+    )
 
     app = Flask(__name__)
     app.config.from_object(config_class)
+    app.config.update(config_overrides or {})
     app.wsgi_app = ProxyFix(app.wsgi_app)  # type: ignore
 
     CORS(
@@ -34,29 +68,97 @@ def create_app() -> Flask:
         supports_credentials=False,
     )
 
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = instrumented_engine_options(
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"]
+    )
     db.init_app(app)
+    init_read_replicas(app)
     migrate.init_app(app, db)
+    instrument_sqlalchemy()
     FlaskInstrumentor().instrument_app(app)
 
     observability = ObservabilityMetrics(
         service_name=config_class.SERVICE_NAME,
         namespace=getattr(config_class, "OPENAPI_SERVICE_NAMESPACE", "python-demo"),
+        multiprocess_dir=getattr(config_class, "METRICS_MULTIPROC_DIR", None),
+        latency_buckets=getattr(config_class, "METRICS_LATENCY_BUCKETS", None),
+        exemplar_min_seconds=getattr(config_class, "METRICS_EXEMPLAR_MIN_SECONDS", None),
+    )
+    observability.register_runtime_collector(
+        RuntimeCollector(
+            config_class.SERVICE_NAME,
+            pools_provider=lambda: engine_pools(app),
+            read_model_provider=lambda: app.extensions.get("read_model"),
+        ),
+        publish_interval=config_class.RUNTIME_METRICS_INTERVAL_SECONDS,
     )
     app.extensions["observability_metrics"] = observability
+    configure_pools(app, observability)
 
     register_swagger(app)
     register_error_handlers(app, observability)
     register_request_hooks(app, observability)
     register_blueprints(app)
     init_keycloak_client(app)
-
-    if not app.config.get("TESTING"):
+    init_result_cache(app, observability)
+    init_read_model(app)
+    init_fragment_cache(app, observability)
+
+    register_bootstrap_command(app)
+    register_export_command(app)
+    dispose_engines_after_fork(app)
+
+    bootstrap_mode = app.config["DB_BOOTSTRAP"]
+    if bootstrap_mode not in BOOTSTRAP_MODES:
+        raise ValueError(f"DB_BOOTSTRAP must be one of {', '.join(BOOTSTRAP_MODES)}, got {bootstrap_mode!r}")
+    if bootstrap_on_startup(app.config):
         with app.app_context():
             run_database_bootstrap()
 
     return app
 
 
+def configure_pools(app: Flask, metrics: ObservabilityMetrics) -> None:
+    strategy = app.config["DB_POOL_PRE_PING"]
+    if strategy not in PRE_PING_STRATEGIES:
+        raise ValueError(f"DB_POOL_PRE_PING must be one of {', '.join(PRE_PING_STRATEGIES)}, got {strategy!r}")
+    for name, engine in app_engines(app).items():
+        configure_pre_ping(engine, strategy, app.config["DB_POOL_PRE_PING_IDLE_SECONDS"])
+        instrument_pool(engine, name, metrics)
+
+
+def app_engines(app: Flask):
+    """Primary engine(s) plus read replicas, by pool name."""
+    with app.app_context():
+        engines = {bind or "default": engine for bind, engine in db.engines.items()}
+    return {**engines, **app.extensions.get("read_replicas", {})}
+
+
+# Apps built in this process; weak so that discarded apps (tests, CLI) can go away
+_apps_with_pools: "weakref.WeakSet[Flask]" = weakref.WeakSet()
+
+
+def dispose_engines_after_fork(app: Flask) -> None:
+    # With gunicorn's preload_app the master opens pooled connections while
+    # bootstrapping; forked workers must start with empty pools instead of sharing them.
+    _apps_with_pools.add(app)
+
+
+def _reset_pools_after_fork() -> None:
+    for app in list(_apps_with_pools):
+        for engine in app_engines(app).values():
+            engine.dispose(close=False)
+
+
+# One hook per process: os.register_at_fork hooks cannot be unregistered
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+def engine_pools(app: Flask):
+    return {name: engine.pool for name, engine in app_engines(app).items()}
+
+
 def register_swagger(app: Flask) -> None:
     spec_path: Path = app.config["SWAGGER_SPEC_PATH"]
     swagger_ui_blueprint = get_swaggerui_blueprint(
@@ -79,6 +181,7 @@ def register_request_hooks(app: Flask, metrics: ObservabilityMetrics) -> None:
     @app.before_request
     def start_timer():
         g.request_started_at = time.perf_counter()
+        g.request_id = (request.headers.get("X-Request-ID") or uuid.uuid4().hex)[:64]
 
     @app.after_request
     def record_metrics(response):
@@ -91,15 +194,40 @@ def register_request_hooks(app: Flask, metrics: ObservabilityMetrics) -> None:
             path=request.path,
             status=response.status_code,
             duration_seconds=duration,
+            request_id=getattr(g, "request_id", None),
+        )
+        db_stats = request_db_stats()
+        metrics.record_db_usage(
+            method=request.method,
+            path=request.path,
+            queries=db_stats.queries,
+            duration_seconds=db_stats.seconds,
         )
         g.metrics_recorded = True
+        if getattr(g, "request_id", None):
+            response.headers["X-Request-ID"] = g.request_id
         current_app.logger.info(
-            "HTTP %s %s -> %s (%.4fs)",
+            "HTTP %s %s -> %s (%.4fs, %d queries, %.4fs db)",
             request.method,
             request.path,
             response.status_code,
             duration,
+            db_stats.queries,
+            db_stats.seconds,
+            extra={
+                ACCESS_LOG_FLAG: True,
+                "status": response.status_code,
+                "request_id": getattr(g, "request_id", None),
+            },
         )
+        for statement, count in repeated_statements(current_app.config.get("SQL_N_PLUS_ONE_THRESHOLD", 0)):
+            current_app.logger.warning(
+                "Possible N+1 on %s %s: statement executed %d times: %s",
+                request.method,
+                request.path,
+                count,
+                " ".join(statement.split())[:200],
+            )
         return response
 
 
@@ -123,6 +251,7 @@ def register_error_handlers(app: Flask, metrics: ObservabilityMetrics) -> None:
             path=request.path,
             status=500,
             duration_seconds=duration,
+            request_id=getattr(g, "request_id", None),
         )
         g.metrics_recorded = True
         return jsonify({"errors": [str(error)]}), 500
@@ -144,13 +273,6 @@ def _flatten_errors(messages):
     return [str(messages)]
 
 
-def run_database_bootstrap():
-    from flask_migrate import upgrade
-
-    upgrade()
-    bootstrap_seed_data()
-
-
 app = create_app()
 
 
@@ -0,0 +1,79 @@
+"""Cold vs warm bearer-token verification throughput of ``KeycloakClient.decode_token``.
+
+Run from ``api/``: ``python -m benchmarks.keycloak_claims_cache [iterations]``
+"""
+
+import sys
+import time
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+from services.keycloak_client import KeycloakClient
+
+
+class _StaticResponse:
+    ok = True
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class _StaticSession:
+    def __init__(self, jwks):
+        self._jwks = jwks
+
+    def get(self, url, timeout=None):
+        if url.endswith("openid-configuration"):
+            return _StaticResponse({"jwks_uri": "http://keycloak/certs"})
+        return _StaticResponse(self._jwks)
+
+
+def _signed_token():
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk["kid"] = "bench"
+    claims = {
+        "preferred_username": "admin",
+        "realm_access": {"roles": ["admin", "author"]},
+        "exp": int(time.time()) + 3600,
+    }
+    token = jwt.encode(claims, private_pem.decode("ascii"), algorithm="RS256", headers={"kid": "bench"})
+    return token, {"keys": [public_jwk]}
+
+
+def _throughput(client: KeycloakClient, token: str, iterations: int) -> float:
+    client.decode_token(token)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        client.decode_token(token)
+    return iterations / (time.perf_counter() - started)
+
+
+def main(iterations: int = 2000) -> None:
+    token, jwks = _signed_token()
+    cold = KeycloakClient("http://keycloak", "bench", "api", session=_StaticSession(jwks), claims_cache_size=0)
+    warm = KeycloakClient("http://keycloak", "bench", "api", session=_StaticSession(jwks))
+
+    cold_rate = _throughput(cold, token, iterations)
+    warm_rate = _throughput(warm, token, iterations)
+    print(f"cold (signature verified every call): {cold_rate:10.0f} decodes/s")
+    print(f"warm (claims cache hit):              {warm_rate:10.0f} decodes/s")
+    print(f"speedup: {warm_rate / cold_rate:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,117 @@
+"""marshmallow ``dump`` over ORM objects vs the compiled Core-row serializers for list endpoints.
+
+Run from ``api/``: ``python -m benchmarks.list_serializers [rows]`` (defaults to 10k rows
+in an in-memory SQLite database; both paths include the SELECT).
+"""
+
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+os.environ.setdefault("FLASK_ENV", "testing")
+os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from app import create_app  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Article, Author, Social  # noqa: E402
+from schemas import ArticleSchema, AuthorSchema, compile_serializer  # noqa: E402
+
+
+def _seed(rows: int) -> None:
+    now = datetime(2025, 1, 1)
+    authors = max(rows // 10, 1)
+    db.session.execute(
+        insert(Author),
+        [
+            {
+                "name": f"Author {index}",
+                "birthdate": date(1990, 1, 1),
+                "photo_url": "https://example.com/photo.jpg",
+                "public_key": "ssh-ed25519 AAAA",
+                "bio": "Developer",
+                "created_at": now,
+                "updated_at": now,
+            }
+            for index in range(authors)
+        ],
+    )
+    db.session.execute(
+        insert(Social),
+        [
+            {
+                "slug": f"social-{index}",
+                "profile_link": "https://example.com/profile",
+                "description": "Perfil",
+                "author_id": index % authors + 1,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for index in range(rows)
+        ],
+    )
+    db.session.execute(
+        insert(Article),
+        [
+            {
+                "title": f"Article {index}",
+                "slug": f"article-{index}",
+                "published_label": "Jan 1, 2025",
+                "post_entry": "Lorem ipsum dolor sit amet. " * 40,
+                "excerpt": "Lorem ipsum dolor sit amet.",
+                "tags": ["python", "flask"],
+                "author_id": index % authors + 1,
+                "created_at": now + timedelta(seconds=index),
+                "updated_at": now + timedelta(seconds=index),
+            }
+            for index in range(rows)
+        ],
+    )
+    db.session.commit()
+
+
+def _best_of(function, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        db.session.expunge_all()
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def _report(label: str, orm_seconds: float, compiled_seconds: float) -> None:
+    print(f"{label}")
+    print(f"  marshmallow over ORM objects: {orm_seconds * 1000:9.1f} ms")
+    print(f"  compiled over Core rows:      {compiled_seconds * 1000:9.1f} ms")
+    print(f"  speedup: {orm_seconds / compiled_seconds:.1f}x")
+
+
+def main(rows: int = 10_000) -> None:
+    app = create_app()
+    with app.app_context():
+        db.create_all()
+        _seed(rows)
+
+        article_schema = ArticleSchema(many=True)
+        article_serializer = compile_serializer(ArticleSchema(), Article)
+        orm = _best_of(
+            lambda: article_schema.dump(Article.query.options(selectinload(Article.author)).all())
+        )
+        compiled = _best_of(lambda: article_serializer.dump(db.session, article_serializer.statement()))
+        _report(f"GET /articles ({rows} articles)", orm, compiled)
+
+        author_schema = AuthorSchema(exclude=("articles",), many=True)
+        author_serializer = compile_serializer(AuthorSchema(exclude=("articles",)), Author)
+        orm = _best_of(
+            lambda: author_schema.dump(Author.query.options(selectinload(Author.socials)).all())
+        )
+        compiled = _best_of(lambda: author_serializer.dump(db.session, author_serializer.statement()))
+        _report(f"GET /authors ({rows // 10} authors, {rows} socials)", orm, compiled)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10_000)
@@ -0,0 +1,126 @@
+"""Write-path throughput before/after caching the request schemas.
+
+Run from ``api/``: ``python -m benchmarks.write_path [requests]``
+
+Measures payload loading on its own (a new schema per call, as the routes used
+to do; the shared schema; the precompiled flat validator) and then full
+``POST /articles`` + ``PATCH /authors/<id>`` requests through the test client
+against in-memory SQLite.
+"""
+
+import os
+import sys
+import time
+from datetime import date
+
+os.environ.setdefault("FLASK_ENV", "testing")
+os.environ.setdefault("DATABASE_URL", "sqlite+pysqlite:///:memory:")
+
+import blueprints.utils as blueprint_utils  # noqa: E402
+from app import create_app  # noqa: E402
+from extensions import db  # noqa: E402
+from models import Author  # noqa: E402
+from schemas import ArticleSchema, AuthorSchema, cached_schema, payload_loader  # noqa: E402
+
+ARTICLE = {
+    "title": "Benchmark",
+    "published_label": "Jan 1, 2025",
+    "post_entry": "Lorem ipsum dolor sit amet. " * 20,
+    "tags": ["python", "flask"],
+}
+AUTHOR = {
+    "name": "Bench",
+    "birthdate": "1990-01-01",
+    "photo_url": "https://example.com/photo.jpg",
+    "public_key": "ssh-ed25519 AAAA",
+    "bio": "Developer",
+}
+
+
+class _PerCallLoader:
+    """What the routes did before: ``SchemaClass(partial=partial)`` for every payload."""
+
+    def __init__(self, schema_class, partial):
+        self.schema_class = schema_class
+        self.partial = partial
+
+    def load(self, data):
+        return self.schema_class(partial=self.partial).load(data)
+
+
+def _per_call_loader(schema_class, partial=False, fast=True, **options):
+    return _PerCallLoader(schema_class, partial)
+
+
+def _rate(function, iterations: int) -> float:
+    function(0)
+    started = time.perf_counter()
+    for index in range(iterations):
+        function(index)
+    return iterations / (time.perf_counter() - started)
+
+
+def _loading(iterations: int) -> None:
+    article = {**ARTICLE, "slug": "bench", "author_id": 1}
+    loaders = {
+        "new schema per call": lambda schema_class, partial: _PerCallLoader(schema_class, partial),
+        "shared schema": lambda schema_class, partial: cached_schema(schema_class, partial),
+        "flat validator": lambda schema_class, partial: payload_loader(schema_class, partial),
+    }
+    print(f"payload loading ({iterations} loads each)")
+    for label, factory in loaders.items():
+        post = factory(ArticleSchema, False)
+        patch = factory(AuthorSchema, True)
+
+        def load(index):
+            post.load(article)
+            patch.load({"bio": "Atualizado"})
+
+        print(f"  {label:<22} {_rate(load, iterations):10.0f} loads/s")
+
+
+def _requests(app, iterations: int) -> None:
+    client = app.test_client()
+    with app.app_context():
+        db.create_all()
+        # Articles go to one author and the PATCH to another, so its response stays small
+        authors = [
+            Author(**{**AUTHOR, "name": name, "birthdate": date(1990, 1, 1)})
+            for name in ("Bench", "Patched")
+        ]
+        db.session.add_all(authors)
+        db.session.commit()
+        author_id, patched_id = (author.id for author in authors)
+
+    counter = iter(range(10**9))
+
+    def write(_index):
+        number = next(counter)
+        article = {**ARTICLE, "slug": f"bench-{number}", "author_id": author_id}
+        client.post("/articles", json={"article": article})
+        client.patch(f"/authors/{patched_id}", json={"author": {"bio": f"Bio {number}"}})
+
+    print(f"POST /articles + PATCH /authors ({iterations} pairs each)")
+    original = blueprint_utils.payload_loader
+    try:
+        blueprint_utils.payload_loader = _per_call_loader
+        before = _rate(write, iterations)
+    finally:
+        blueprint_utils.payload_loader = original
+    app.config["FAST_PAYLOAD_VALIDATION"] = False
+    shared = _rate(write, iterations)
+    app.config["FAST_PAYLOAD_VALIDATION"] = True
+    fast = _rate(write, iterations)
+    print(f"  before (new schema per request) {before * 2:8.0f} req/s")
+    print(f"  shared schema                   {shared * 2:8.0f} req/s")
+    print(f"  shared schema + flat validator  {fast * 2:8.0f} req/s")
+
+
+def main(iterations: int = 500) -> None:
+    app = create_app()
+    _loading(iterations * 5)
+    _requests(app, iterations)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
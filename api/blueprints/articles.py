@@ -1,35 +1,109 @@
-from flask import Blueprint, request
+from flask import Blueprint, Response, current_app, request, stream_with_context
 from marshmallow import ValidationError
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
 
 from extensions import db
 from models import Article, Author
-from schemas import ArticleSchema
-from .utils import error_response, to_json
+from models.article import build_excerpt
+from schemas import ArticleSchema, ArticleSummarySchema, cached_schema, compile_serializer
+from services.article_export import NDJSON_MIMETYPE, execute_export, iter_article_ndjson
+from services.article_import import import_articles_ndjson
+from services.fragment_cache import article_fragments, json_list, json_page
+from services.read_model import current_catalog
+from services.read_replicas import use_read_replica
+from services.result_cache import cached_result
+from .bulk import (
+    SLUG_TAKEN,
+    BulkOutcome,
+    bulk_items,
+    insert_bulk,
+    load_authors,
+    load_items,
+    load_targets,
+    reject_missing_authors,
+    reject_taken_values,
+    split_ids,
+    update_bulk,
+)
+from .conditional import conditional_get
+from .pagination import (
+    catalog_page,
+    keyset_window,
+    pagination_requested,
+    parse_limit,
+    parse_view,
+    split_page,
+)
+from .utils import error_response, load_payload, loader_options, to_json, to_json_bytes
 
 
 bp = Blueprint("articles", __name__, url_prefix="/articles")
 
 article_schema = ArticleSchema()
-article_list_schema = ArticleSchema(many=True)
+# List endpoints serialize straight from Core rows; output matches the schemas above
+article_list_serializer = compile_serializer(ArticleSchema(), Article)
+article_summary_serializer = compile_serializer(ArticleSummarySchema(), Article)
 
 
 @bp.get("")
+@use_read_replica
+@conditional_get(Article, Author)
 def list_articles():
-    articles = (
-        Article.query.options(selectinload(Article.author))
-        .order_by(Article.created_at.desc())
-        .all()
-    )
-    return to_json(article_list_schema.dump(articles))
+    catalog = current_catalog(Article, Author)
+    if catalog is not None:
+        summary = parse_view() == "summary"
+        if pagination_requested():
+            records, next_cursor = catalog_page(catalog, parse_limit(), request.args.get("cursor"))
+            return to_json_bytes(json_page(article_fragments(catalog, records, summary), next_cursor))
+        records = catalog.articles_before(None, catalog.count_articles())
+        return to_json_bytes(json_list(article_fragments(catalog, records, summary)))
+
+    if parse_view() == "summary":
+        serializer = article_summary_serializer
+    else:
+        serializer = article_list_serializer
+
+    if pagination_requested():
+        limit = parse_limit()
+        statement = keyset_window(serializer.statement(), Article, limit, request.args.get("cursor"))
+        rows, next_cursor = split_page(db.session.execute(statement).all(), limit)
+        return to_json(
+            {"data": serializer.dump_rows(db.session, rows), "next_cursor": next_cursor}
+        )
+
+    statement = serializer.statement().order_by(Article.created_at.desc(), Article.id.desc())
+    return to_json(serializer.dump(db.session, statement))
+
+
+@bp.get("/export")
+@use_read_replica
+def export_articles():
+    # Executed here so the query is routed like any read; rows are fetched while streaming
+    result = execute_export(db.session)
+
+    def generate():
+        try:
+            yield from iter_article_ndjson(result)
+        finally:
+            result.close()
+
+    return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
 
 
 @bp.get("/<int:article_id>")
+@use_read_replica
+@conditional_get(Article, Author)
 def get_article(article_id: int):
+    catalog = current_catalog(Article, Author)
+    if catalog is not None:
+        record = catalog.article(article_id)
+        if record is None:
+            return error_response("Artigo não encontrado.", status=404)
+        return to_json_bytes(article_fragments(catalog, [record])[0])
+
     article = (
-        Article.query.options(selectinload(Article.author))
+        Article.query.options(*loader_options(article_schema, Article))
         .filter_by(id=article_id)
         .first()
     )
@@ -41,26 +115,91 @@ def get_article(article_id: int):
 @bp.post("")
 def create_article():
     payload = _load_article_payload()
-    _ensure_author_exists(payload["author_id"])
+    author = _ensure_author_exists(payload["author_id"])
 
-    article = Article(**payload)
+    article = Article(**payload, author=author)
     db.session.add(article)
     db.session.flush()
     return _commit_and_respond(article_schema.dump(article), status=201)
 
 
+@bp.post("/bulk")
+def create_articles_bulk():
+    items = bulk_items("article")
+    outcome = BulkOutcome(len(items))
+    loaded = load_items(cached_schema(ArticleSchema), items, outcome)
+    reject_missing_authors(loaded, outcome)
+    reject_taken_values(Article.slug, loaded, outcome, SLUG_TAKEN)
+    if outcome.errors:
+        return outcome.error_response()
+
+    # Core inserts skip the model's @validates hook that fills the excerpt
+    rows = {
+        index: {**data, "excerpt": build_excerpt(data["post_entry"])}
+        for index, data in loaded.items()
+    }
+    return insert_bulk(
+        outcome,
+        Article,
+        Article.slug,
+        rows,
+        article_schema,
+        lambda: reject_taken_values(Article.slug, loaded, outcome, SLUG_TAKEN),
+        *loader_options(article_schema, Article),
+    )
+
+
+@bp.patch("/bulk")
+def update_articles_bulk():
+    items = bulk_items("article")
+    outcome = BulkOutcome(len(items))
+    ids, items = split_ids(items, outcome)
+    valid = load_items(cached_schema(ArticleSchema, partial=True), items, outcome)
+    loaded = {index: data for index, data in valid.items() if index in ids}
+    articles = load_targets(
+        Article, ids, outcome, "Artigo não encontrado.", *loader_options(article_schema, Article)
+    )
+    authors = load_authors(loaded, outcome, *_author_options())
+    reject_taken_values(Article.slug, loaded, outcome, SLUG_TAKEN, ids)
+    if outcome.errors:
+        return outcome.error_response()
+
+    for index, data in loaded.items():
+        article = articles[index]
+        for key, value in data.items():
+            setattr(article, key, value)
+        if "author_id" in data:
+            article.author = authors[data["author_id"]]
+    return update_bulk(
+        outcome,
+        articles,
+        article_schema,
+        lambda: reject_taken_values(Article.slug, loaded, outcome, SLUG_TAKEN, ids),
+    )
+
+
+@bp.post("/import")
+def import_articles():
+    # request.stream is read line by line; the body is never held in memory whole
+    report = import_articles_ndjson(
+        db.session, request.stream, batch_size=current_app.config["ARTICLE_IMPORT_BATCH_SIZE"]
+    )
+    return to_json(report.to_dict(), status=200)
+
+
 @bp.patch("/<int:article_id>")
 def update_article(article_id: int):
     payload = _load_article_payload(partial=True)
-    article = Article.query.get(article_id)
+    article = db.session.get(
+        Article, article_id, options=loader_options(article_schema, Article)
+    )
     if not article:
         return error_response("Artigo não encontrado.", status=404)
 
-    if "author_id" in payload:
-        _ensure_author_exists(payload["author_id"])
-
     for key, value in payload.items():
         setattr(article, key, value)
+    if "author_id" in payload:
+        article.author = _ensure_author_exists(payload["author_id"])
 
     return _commit_and_respond(article_schema.dump(article))
 
@@ -76,6 +215,9 @@ def delete_article(article_id: int):
 
 
 @bp.get("/count_by_author")
+@use_read_replica
+@conditional_get(Article, Author)
+@cached_result(Article, Author)
 def count_by_author():
     results = (
         db.session.query(
@@ -105,14 +247,19 @@ def _load_article_payload(partial: bool = False):
     if "article" not in body:
         raise ValidationError({"article": ["é obrigatório"]})
 
-    schema = ArticleSchema(partial=partial)
-    return schema.load(body["article"])
+    return load_payload(ArticleSchema, body["article"], partial=partial)
+
+
+def _author_options():
+    # Just what the nested ``author`` of an article renders
+    return loader_options(article_schema.fields["author"].schema, Author)
 
 
 def _ensure_author_exists(author_id: int):
-    exists = Author.query.filter_by(id=author_id).first()
-    if not exists:
+    author = db.session.get(Author, author_id, options=_author_options())
+    if not author:
         raise ValidationError({"author_id": ["Author must exist"]})
+    return author
 
 
 def _commit_and_respond(payload, status=200):
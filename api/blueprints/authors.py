@@ -1,68 +1,176 @@
 from flask import Blueprint, request
 from marshmallow import ValidationError
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import selectinload
 
 from extensions import db
-from models import Author
-from schemas import AuthorSchema
-from .utils import error_response, not_found, to_json
+from models import Article, Author, Social
+from schemas import (
+    ArticleSchema,
+    ArticleSummarySchema,
+    AuthorSchema,
+    cached_schema,
+    compile_serializer,
+)
+from services.fragment_cache import (
+    article_fragments,
+    author_fragments,
+    encode,
+    json_list,
+    json_page,
+    prepend_members,
+)
+from services.read_model import current_catalog
+from services.read_replicas import use_read_replica
+from .bulk import (
+    NAME_TAKEN,
+    BulkOutcome,
+    bulk_items,
+    insert_bulk,
+    load_items,
+    reject_taken_values,
+)
+from .conditional import conditional_get
+from .pagination import (
+    DEFAULT_PAGE_SIZE,
+    catalog_page,
+    keyset_window,
+    parse_limit,
+    parse_view,
+    split_page,
+)
+from .utils import error_response, load_payload, loader_options, not_found, to_json, to_json_bytes
 
 
 bp = Blueprint("authors", __name__, url_prefix="/authors")
 
 author_schema = AuthorSchema()
-author_list_schema = AuthorSchema(exclude=("articles",), many=True)
+# GET /authors/<id> embeds one page of articles instead of the whole collection
+author_detail_schema = AuthorSchema(exclude=("articles",))
+author_article_serializers = {
+    "full": compile_serializer(ArticleSchema(exclude=("author",)), Article),
+    "summary": compile_serializer(ArticleSummarySchema(exclude=("author",)), Article),
+}
+author_list_serializer = compile_serializer(AuthorSchema(exclude=("articles",)), Author)
 
 
 @bp.get("")
+@use_read_replica
+@conditional_get(Author, Social)
 def list_authors():
-    authors = (
-        Author.query.options(
-            selectinload(Author.socials),
-            selectinload(Author.articles),
-        )
-        .order_by(Author.name.asc())
-        .all()
-    )
-    return to_json(author_list_schema.dump(authors))
+    catalog = current_catalog(Author, Social)
+    if catalog is not None:
+        return to_json_bytes(json_list(author_fragments(catalog, catalog.authors_by_name())))
+
+    statement = author_list_serializer.statement().order_by(Author.name.asc())
+    return to_json(author_list_serializer.dump(db.session, statement))
 
 
 @bp.get("/<int:author_id>")
+@use_read_replica
+@conditional_get(Author, Social, Article)
 def get_author(author_id: int):
-    author = (
-        Author.query.options(
-            selectinload(Author.socials),
-            selectinload(Author.articles),
+    catalog = current_catalog(Author, Social, Article)
+    if catalog is not None:
+        record = catalog.author(author_id)
+        if record is None:
+            not_found("Autor")
+        articles, next_cursor = catalog_page(catalog, DEFAULT_PAGE_SIZE, author_id=author_id)
+        # The articles* keys sort ahead of every AuthorSchema key, as jsonify orders them
+        body = prepend_members(
+            author_fragments(catalog, [record])[0],
+            {
+                "articles": json_list(article_fragments(catalog, articles, author=False)),
+                "articles_count": encode(catalog.count_articles(author_id)),
+                "articles_next_cursor": encode(next_cursor),
+            },
         )
-        .filter_by(id=author_id)
-        .first()
+        return to_json_bytes(body)
+
+    articles_count = (
+        select(func.count(Article.id)).where(Article.author_id == Author.id).scalar_subquery()
     )
-    if not author:
+    row = db.session.execute(
+        select(Author, articles_count)
+        .options(*loader_options(author_detail_schema, Author))
+        .where(Author.id == author_id)
+    ).first()
+    if not row:
+        not_found("Autor")
+
+    author, total = row
+    return to_json(_author_payload(author, total))
+
+
+@bp.get("/<int:author_id>/articles")
+@use_read_replica
+@conditional_get(Author, Article)
+def list_author_articles(author_id: int):
+    catalog = current_catalog(Author, Article)
+    if catalog is not None:
+        if catalog.author(author_id) is None:
+            not_found("Autor")
+        summary = parse_view() == "summary"
+        records, next_cursor = catalog_page(
+            catalog, parse_limit(), request.args.get("cursor"), author_id
+        )
+        fragments = article_fragments(catalog, records, summary, author=False)
+        return to_json_bytes(json_page(fragments, next_cursor))
+
+    if db.session.scalar(select(Author.id).where(Author.id == author_id)) is None:
         not_found("Autor")
-    return to_json(author_schema.dump(author))
+
+    articles, next_cursor = _article_page(
+        author_id, parse_view(), parse_limit(), request.args.get("cursor")
+    )
+    return to_json({"data": articles, "next_cursor": next_cursor})
 
 
 @bp.post("")
 def create_author():
     payload = _load_author_payload()
-    author = Author(**payload)
+    # A new author has no socials or articles: nothing to load for the response
+    author = Author(**payload, socials=[], articles=[])
     db.session.add(author)
     db.session.flush()
-    return _commit_and_respond(author_schema.dump(author), status=201)
+    return _commit_and_respond(_author_payload(author, 0), status=201)
+
+
+@bp.post("/bulk")
+def create_authors_bulk():
+    items = bulk_items("author")
+    outcome = BulkOutcome(len(items))
+    schema = cached_schema(AuthorSchema, exclude=("socials", "articles"))
+    loaded = load_items(schema, items, outcome)
+    reject_taken_values(Author.name, loaded, outcome, NAME_TAKEN)
+    if outcome.errors:
+        return outcome.error_response()
+
+    return insert_bulk(
+        outcome,
+        Author,
+        Author.name,
+        loaded,
+        author_schema,
+        lambda: reject_taken_values(Author.name, loaded, outcome, NAME_TAKEN),
+        *loader_options(author_schema, Author),
+    )
 
 
 @bp.patch("/<int:author_id>")
 def update_author(author_id: int):
     payload = _load_author_payload(partial=True)
-    author = Author.query.get(author_id)
+    author = db.session.get(
+        Author, author_id, options=loader_options(author_detail_schema, Author)
+    )
     if not author:
         not_found("Autor")
 
     for key, value in payload.items():
         setattr(author, key, value)
 
-    return _commit_and_respond(author_schema.dump(author))
+    total = db.session.scalar(select(func.count(Article.id)).where(Article.author_id == author_id))
+    return _commit_and_respond(_author_payload(author, total))
 
 
 @bp.delete("/<int:author_id>")
@@ -75,13 +183,39 @@ def delete_author(author_id: int):
     return _commit_and_respond({}, status=204)
 
 
+def _author_payload(author: Author, articles_count: int) -> dict:
+    """``author_detail_schema`` plus the first page of articles and the total count."""
+
+    articles, next_cursor = [], None
+    if articles_count:
+        articles, next_cursor = _article_page(author.id, "full", DEFAULT_PAGE_SIZE)
+    payload = author_detail_schema.dump(author)
+    payload.update(
+        articles=articles, articles_count=articles_count, articles_next_cursor=next_cursor
+    )
+    return payload
+
+
+def _article_page(author_id: int, view: str, limit: int, cursor: str = None):
+    """One keyset page of the author's articles, newest first.
+
+    ``ix_articles_author_created_at_id`` lets the database seek straight to the page.
+    """
+
+    serializer = author_article_serializers[view]
+    statement = keyset_window(
+        serializer.statement().where(Article.author_id == author_id), Article, limit, cursor
+    )
+    rows, next_cursor = split_page(db.session.execute(statement).all(), limit)
+    return serializer.dump_rows(db.session, rows), next_cursor
+
+
 def _load_author_payload(partial: bool = False):
     body = request.get_json(silent=True) or {}
     if "author" not in body:
         raise ValidationError({"author": ["é obrigatório"]})
 
-    schema = AuthorSchema(partial=partial)
-    return schema.load(body["author"])
+    return load_payload(AuthorSchema, body["author"], partial=partial)
 
 
 def _commit_and_respond(payload, status=200):
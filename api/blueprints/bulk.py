@@ -0,0 +1,225 @@
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+from flask import current_app, request
+from marshmallow import Schema, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+
+from extensions import db
+from models import Author
+from services.article_import import AUTHOR_MISSING, SLUG_TAKEN, existing_author_ids
+from .utils import to_json
+
+Messages = Dict[str, List[str]]
+
+NAME_TAKEN = "Name has already been taken"
+
+
+class BulkOutcome:
+    """Per-item errors of a bulk request; the batch is only committed when there are none."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.errors: Dict[int, Messages] = {}
+
+    def reject(self, index: int, messages: Messages) -> None:
+        item_errors = self.errors.setdefault(index, {})
+        for field, field_messages in messages.items():
+            item_errors.setdefault(field, []).extend(field_messages)
+
+    def error_response(self):
+        # Nothing was applied: valid items are reported as skipped so callers can resend them
+        results = [
+            {"index": index, "status": "invalid", "errors": self.errors[index]}
+            if index in self.errors
+            else {"index": index, "status": "skipped"}
+            for index in range(self.size)
+        ]
+        return to_json({"results": results}, status=422)
+
+
+def bulk_items(root_key: str) -> list:
+    """The array under ``root_key`` of the JSON body (same root keys as the single-item routes)."""
+
+    body = request.get_json(silent=True) or {}
+    items = body.get(root_key)
+    if not isinstance(items, list) or not items:
+        raise ValidationError({root_key: ["deve ser uma lista não vazia"]})
+    limit = current_app.config["BULK_MAX_ITEMS"]
+    if len(items) > limit:
+        raise ValidationError({root_key: [f"no máximo {limit} itens por requisição"]})
+    return items
+
+
+def load_items(schema: Schema, items: list, outcome: BulkOutcome) -> Dict[int, dict]:
+    """Validate every item in one ``schema.load(many=True)``; returns the valid ones by index."""
+
+    try:
+        loaded = schema.load(items, many=True)
+        invalid: Dict[int, Messages] = {}
+    except ValidationError as error:
+        loaded = error.valid_data or []
+        invalid = error.messages if isinstance(error.messages, dict) else {}
+
+    valid: Dict[int, dict] = {}
+    for index in range(len(items)):
+        if index in invalid:
+            messages = invalid[index]
+            if not isinstance(messages, dict):
+                messages = {"_item": list(messages)}
+            outcome.reject(index, messages)
+        else:
+            valid[index] = loaded[index]
+    return valid
+
+
+def reject_missing_authors(loaded: Dict[int, dict], outcome: BulkOutcome) -> None:
+    """One ``IN`` query for every ``author_id`` referenced by the batch."""
+
+    referenced = {data["author_id"] for data in loaded.values() if "author_id" in data}
+    found = existing_author_ids(db.session, referenced)
+    for index, data in loaded.items():
+        if "author_id" in data and data["author_id"] not in found:
+            outcome.reject(index, {"author_id": [AUTHOR_MISSING]})
+
+
+def load_authors(loaded: Dict[int, dict], outcome: BulkOutcome, *options) -> Dict[int, Author]:
+    """Like :func:`reject_missing_authors`, returning the referenced authors by id."""
+
+    referenced = {data["author_id"] for data in loaded.values() if "author_id" in data}
+    authors: Dict[int, Author] = {}
+    if referenced:
+        statement = select(Author).where(Author.id.in_(referenced)).options(*options)
+        authors = {author.id: author for author in db.session.scalars(statement)}
+    for index, data in loaded.items():
+        if "author_id" in data and data["author_id"] not in authors:
+            outcome.reject(index, {"author_id": [AUTHOR_MISSING]})
+    return authors
+
+
+def split_ids(items: list, outcome: BulkOutcome) -> Tuple[Dict[int, int], list]:
+    """The ``id`` each PATCH item must carry, by item index, and the items without it.
+
+    The items are copied, so the parsed request body keeps its ``id`` keys.
+    """
+
+    ids: Dict[int, int] = {}
+    stripped = []
+    for index, item in enumerate(items):
+        item_id = None
+        if isinstance(item, dict):
+            item_id = item.get("id")
+            item = {key: value for key, value in item.items() if key != "id"}
+        if isinstance(item_id, int) and not isinstance(item_id, bool):
+            ids[index] = item_id
+        else:
+            outcome.reject(index, {"id": ["é obrigatório"]})
+        stripped.append(item)
+    return ids, stripped
+
+
+def load_targets(
+    model, ids: Dict[int, int], outcome: BulkOutcome, message: str, *options
+) -> Dict[int, object]:
+    """The rows addressed by a PATCH batch, fetched with a single ``IN`` query."""
+
+    rows = {}
+    if ids:
+        statement = select(model).where(model.id.in_(set(ids.values()))).options(*options)
+        rows = {row.id: row for row in db.session.scalars(statement)}
+    targets = {}
+    for index, item_id in ids.items():
+        if item_id in rows:
+            targets[index] = rows[item_id]
+        else:
+            outcome.reject(index, {"id": [message]})
+    return targets
+
+
+def reject_taken_values(
+    column,
+    loaded: Dict[int, dict],
+    outcome: BulkOutcome,
+    message: str,
+    ids: Optional[Dict[int, int]] = None,
+) -> None:
+    """Flag items whose unique ``column`` value repeats inside the batch or belongs to another row.
+
+    ``ids`` maps item index to the row being updated (PATCH), so a row keeping
+    its own value is not a collision.
+    """
+
+    field = column.key
+    values = {index: data[field] for index, data in loaded.items() if field in data}
+    repeated = {value for value, count in Counter(values.values()).items() if count > 1}
+    owners: Dict[object, int] = {}
+    if values:
+        statement = select(column, column.class_.id).where(column.in_(set(values.values())))
+        owners = dict(db.session.execute(statement).all())
+    for index, value in values.items():
+        owner = owners.get(value)
+        if value in repeated or (owner is not None and owner != (ids or {}).get(index)):
+            outcome.reject(index, {field: [message]})
+
+
+def insert_bulk(
+    outcome: BulkOutcome,
+    model,
+    key,
+    rows: Dict[int, dict],
+    schema: Schema,
+    recheck: Callable[[], None],
+    *options,
+):
+    """Insert the batch with one executemany ``INSERT`` and read it back by its unique ``key``.
+
+    The ORM would send one ``INSERT`` per object to learn each primary key
+    (MySQL has no ``RETURNING``), so rows go through Core and are selected back
+    in a single query for the response.
+    """
+
+    def apply():
+        db.session.execute(insert(model), list(rows.values()))
+        values = [row[key.key] for row in rows.values()]
+        statement = select(model).where(key.in_(values)).options(*options)
+        created = {getattr(obj, key.key): obj for obj in db.session.scalars(statement)}
+        return {index: created[row[key.key]] for index, row in rows.items()}
+
+    return _commit_batch(outcome, apply, schema, "created", 201, recheck)
+
+
+def update_bulk(
+    outcome: BulkOutcome,
+    targets: Dict[int, object],
+    schema: Schema,
+    recheck: Callable[[], None],
+):
+    """Flush the changes already applied to ``targets`` and commit them together."""
+
+    def apply():
+        db.session.flush()
+        return targets
+
+    return _commit_batch(outcome, apply, schema, "updated", 200, recheck)
+
+
+def _commit_batch(outcome, apply, schema, state, status, recheck):
+    # On IntegrityError everything is rolled back and ``recheck`` re-runs the uniqueness
+    # checks, which pins a collision with a concurrent writer to the offending items.
+    try:
+        objects = apply()
+        results = [
+            {"index": index, "status": state, "data": schema.dump(obj)}
+            for index, obj in sorted(objects.items())
+        ]
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        outcome.errors.clear()
+        recheck()
+        if not outcome.errors:
+            for index in range(outcome.size):
+                outcome.reject(index, {"_item": ["Não foi possível salvar o lote."]})
+        return outcome.error_response()
+    return to_json({"results": results}, status=status)
@@ -0,0 +1,57 @@
+import hashlib
+from functools import wraps
+
+from flask import current_app, g, make_response, request
+
+from services.table_version import REQUEST_VERSIONS_KEY, fetch_table_versions
+
+
+def conditional_get(*models):
+    """Answer ``304 Not Modified`` when the client's ETag matches the tables' version.
+
+    The ETag is derived from the request URL and the ``data_versions`` counter of
+    every table the response is built from, so the check costs one primary-key
+    lookup and the view (ORM query plus marshmallow dump) only runs when the data
+    actually changed. ``Last-Modified`` is informational only: HTTP dates have
+    whole-second precision, so revalidation is done exclusively through
+    ``If-None-Match``.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            versions = fetch_table_versions(*models)
+            etag = _build_etag(versions)
+            last_modified = max(
+                (version.changed_at for version in versions if version.changed_at),
+                default=None,
+            )
+
+            if request.if_none_match.contains_weak(etag):
+                response = current_app.response_class(status=304)
+            else:
+                # Shared with current_table_versions for the duration of the view
+                setattr(g, REQUEST_VERSIONS_KEY, {version.table: version for version in versions})
+                try:
+                    response = make_response(view(*args, **kwargs))
+                finally:
+                    g.pop(REQUEST_VERSIONS_KEY, None)
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag)
+            if last_modified is not None:
+                response.last_modified = last_modified
+            response.headers["Cache-Control"] = "no-cache"
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _build_etag(versions) -> str:
+    digest = hashlib.sha1(request.full_path.encode("utf-8"))
+    for version in versions:
+        digest.update(f"|{version.table}:{version.version}".encode("utf-8"))
+    return digest.hexdigest()
@@ -1,4 +1,4 @@
-from flask import Blueprint, current_app
+from flask import Blueprint, current_app, request
 
 from observability import MetricsFormatter, ObservabilityMetrics
 
@@ -10,7 +10,14 @@ bp = Blueprint("metrics", __name__)
 def metrics_endpoint():
     metrics_service: ObservabilityMetrics = current_app.extensions["observability_metrics"]
     data = metrics_service.scrape()
-    formatter = MetricsFormatter(data)
+    formatter = MetricsFormatter(
+        data,
+        metrics_service.shared_samples(),
+        metrics_service.exemplars(),
+    )
+    if "application/openmetrics-text" in request.headers.get("Accept", ""):
+        payload = formatter.to_text(openmetrics=True)
+        return current_app.response_class(payload, content_type=MetricsFormatter.OPENMETRICS_CONTENT_TYPE)
     payload = formatter.to_text()
     return current_app.response_class(payload, mimetype="text/plain; version=0.0.4")
 
@@ -0,0 +1,89 @@
+import base64
+import json
+from datetime import datetime
+
+from flask import request
+from marshmallow import ValidationError
+from sqlalchemy import and_, or_
+
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+LIST_VIEWS = ("full", "summary")
+
+
+def pagination_requested() -> bool:
+    return "limit" in request.args or "cursor" in request.args
+
+
+def parse_limit(default: int = DEFAULT_PAGE_SIZE, maximum: int = MAX_PAGE_SIZE) -> int:
+    raw = request.args.get("limit")
+    if raw is None or raw == "":
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise ValidationError({"limit": ["deve ser um número inteiro"]})
+    if limit < 1:
+        raise ValidationError({"limit": ["deve ser maior que zero"]})
+    return min(limit, maximum)
+
+
+def parse_view(views=LIST_VIEWS) -> str:
+    view = request.args.get("view", views[0])
+    if view not in views:
+        raise ValidationError({"view": [f"deve ser um de: {', '.join(views)}"]})
+    return view
+
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValidationError({"cursor": ["inválido"]})
+
+
+def keyset_window(statement, model, limit: int, cursor: str = None):
+    """Order ``statement`` by ``(created_at, id)`` descending and seek past ``cursor``.
+
+    Works on both ``Query`` and Core ``select()``; one row more than ``limit``
+    is requested so :func:`split_page` can tell whether there is a next page.
+    Keyset pagination keeps the cost of every page constant: the database seeks
+    the composite index straight to the cursor position instead of scanning and
+    discarding ``OFFSET`` rows.
+    """
+
+    statement = statement.order_by(model.created_at.desc(), model.id.desc())
+    if cursor:
+        created_at, record_id = decode_cursor(cursor)
+        statement = statement.filter(
+            or_(
+                model.created_at < created_at,
+                and_(model.created_at == created_at, model.id < record_id),
+            )
+        )
+    return statement.limit(limit + 1)
+
+
+def split_page(rows, limit: int):
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return rows, next_cursor
+
+
+def catalog_page(catalog, limit: int, cursor: str = None, author_id: int = None):
+    """:func:`keyset_window` plus :func:`split_page` over the read model's in-memory ordering."""
+
+    position = decode_cursor(cursor) if cursor else None
+    return split_page(catalog.articles_before(position, limit + 1, author_id), limit)
+
@@ -1,11 +1,23 @@
 from flask import Blueprint, request
 from marshmallow import ValidationError
+from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
 
 from extensions import db
 from models import Author, Social
-from schemas import SocialSchema
-from .utils import error_response, to_json
+from schemas import SocialSchema, cached_schema
+from services.read_replicas import use_read_replica
+from .bulk import (
+    SLUG_TAKEN,
+    BulkOutcome,
+    bulk_items,
+    insert_bulk,
+    load_items,
+    reject_missing_authors,
+    reject_taken_values,
+)
+from .conditional import conditional_get
+from .utils import error_response, load_payload, loader_options, to_json
 
 
 bp = Blueprint("socials", __name__, url_prefix="/socials")
@@ -15,14 +27,22 @@ social_list_schema = SocialSchema(many=True)
 
 
 @bp.get("")
+@use_read_replica
+@conditional_get(Social)
 def list_socials():
-    socials = Social.query.order_by(Social.slug.asc()).all()
+    socials = (
+        Social.query.options(*loader_options(social_schema, Social))
+        .order_by(Social.slug.asc())
+        .all()
+    )
     return to_json(social_list_schema.dump(socials))
 
 
 @bp.get("/<int:social_id>")
+@use_read_replica
+@conditional_get(Social)
 def get_social(social_id: int):
-    social = Social.query.get(social_id)
+    social = db.session.get(Social, social_id, options=loader_options(social_schema, Social))
     if not social:
         return error_response("Social não encontrado.", status=404)
     return to_json(social_schema.dump(social))
@@ -39,10 +59,30 @@ def create_social():
     return _commit_and_respond(social_schema.dump(social), status=201)
 
 
+@bp.post("/bulk")
+def create_socials_bulk():
+    items = bulk_items("social")
+    outcome = BulkOutcome(len(items))
+    loaded = load_items(cached_schema(SocialSchema), items, outcome)
+    reject_missing_authors(loaded, outcome)
+    reject_taken_values(Social.slug, loaded, outcome, SLUG_TAKEN)
+    if outcome.errors:
+        return outcome.error_response()
+
+    return insert_bulk(
+        outcome,
+        Social,
+        Social.slug,
+        loaded,
+        social_schema,
+        lambda: reject_taken_values(Social.slug, loaded, outcome, SLUG_TAKEN),
+    )
+
+
 @bp.patch("/<int:social_id>")
 def update_social(social_id: int):
     payload = _load_social_payload(partial=True)
-    social = Social.query.get(social_id)
+    social = db.session.get(Social, social_id, options=loader_options(social_schema, Social))
     if not social:
         return error_response("Social não encontrado.", status=404)
 
@@ -69,13 +109,12 @@ def _load_social_payload(partial: bool = False):
     body = request.get_json(silent=True) or {}
     if "social" not in body:
         raise ValidationError({"social": ["é obrigatório"]})
-    schema = SocialSchema(partial=partial)
-    return schema.load(body["social"])
+    return load_payload(SocialSchema, body["social"], partial=partial)
 
 
 def _ensure_author_exists(author_id: int):
-    exists = Author.query.filter_by(id=author_id).first()
-    if not exists:
+    exists = db.session.scalar(select(Author.id).where(Author.id == author_id))
+    if exists is None:
         raise ValidationError({"author_id": ["Author must exist"]})
 
 
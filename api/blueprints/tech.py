@@ -1,6 +1,7 @@
 from flask import Blueprint, make_response
 
 from services.tech_report import TechReport
+from .utils import to_json
 
 
 bp = Blueprint("tech", __name__)
@@ -14,3 +15,7 @@ def tech_report():
     response.headers["Content-Type"] = "text/html"
     return response
 
+
+@bp.get("/tech.json")
+def tech_report_json():
+    return to_json(TechReport().to_dict())
@@ -1,11 +1,19 @@
-from flask import jsonify
+from flask import current_app, jsonify
 from werkzeug.exceptions import NotFound
 
+from schemas import payload_loader, plan_loading
+
 
 def to_json(payload, status=200):
     return jsonify(payload), status
 
 
+def to_json_bytes(body: bytes, status=200):
+    """``to_json`` for a payload already encoded with ``services.fragment_cache``."""
+
+    return current_app.response_class(body + b"\n", status=status, mimetype=current_app.json.mimetype)
+
+
 def not_found(resource: str = "Resource"):
     raise NotFound(f"{resource} não encontrado.")
 
@@ -15,3 +23,16 @@ def error_response(messages, status=422):
         messages = [messages]
     return jsonify({"errors": messages}), status
 
+
+def load_payload(schema_class, data, partial=False, **options):
+    """``schema_class(partial=partial, **options).load(data)`` through the shared validators."""
+
+    fast = current_app.config["FAST_PAYLOAD_VALIDATION"]
+    return payload_loader(schema_class, partial=partial, fast=fast, **options).load(data)
+
+
+def loader_options(schema, model, **kwargs):
+    """``plan_loading`` for this app: unplanned loads raise when ``EAGER_LOADING_RAISE`` is set."""
+
+    strict = current_app.config["EAGER_LOADING_RAISE"]
+    return plan_loading(schema, model, raise_unplanned=strict, **kwargs)
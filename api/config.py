@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 
@@ -15,13 +16,43 @@ class BaseConfig:
             "mysql+pymysql://ruby-demo:2u8y-c0d3@db:3306/ruby_demo_development",
         )
     )
+    # Each gunicorn worker owns one pool: size it for the worker's threads
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "4"))
+    DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "4"))
+    DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+    DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+    # always: ping on every checkout; idle: only after DB_POOL_PRE_PING_IDLE_SECONDS unused; never
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "idle").lower()
+    DB_POOL_PRE_PING_IDLE_SECONDS = float(os.getenv("DB_POOL_PRE_PING_IDLE_SECONDS", "30"))
     SQLALCHEMY_ENGINE_OPTIONS = {
-        "pool_pre_ping": True,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_POOL_MAX_OVERFLOW,
+        "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+        "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+        "pool_pre_ping": DB_POOL_PRE_PING == "always",
     }
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Comma-separated DSNs; GET handlers marked with use_read_replica read from them round-robin
+    DATABASE_REPLICA_URLS = [
+        url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()
+    ]
+
+    # auto: migrate + seed while building the app (under a cross-process lock);
+    # skip: leave it to `flask bootstrap-db` or the gunicorn master (preload_app)
+    DB_BOOTSTRAP = os.getenv("DB_BOOTSTRAP", "auto").lower()
+    DB_BOOTSTRAP_LOCK_FILE = Path(
+        os.getenv("DB_BOOTSTRAP_LOCK_FILE", Path(tempfile.gettempdir()) / "python-demo-bootstrap.lock")
+    )
+    DB_BOOTSTRAP_LOCK_TIMEOUT_SECONDS = float(os.getenv("DB_BOOTSTRAP_LOCK_TIMEOUT_SECONDS", "300"))
 
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR = Path(os.getenv("LOG_DIR", Path(__file__).resolve().parent / "logs"))
+    LOG_JSON = os.getenv("LOG_FORMAT", "text").lower() == "json"
+    LOG_ACCESS_SAMPLE_RATE = float(os.getenv("LOG_ACCESS_SAMPLE_RATE", "1.0"))
+    # Per-statement SQL logs cost formatting and I/O on every query: opt in with INFO
+    LOG_SQL_LEVEL = os.getenv("LOG_SQL_LEVEL", "WARNING")
+    LOG_SQL_SAMPLE_RATE = float(os.getenv("LOG_SQL_SAMPLE_RATE", "1.0"))
+    LOG_FILE_PER_PROCESS = os.getenv("LOG_FILE_PER_PROCESS", "0") == "1"
 
     SWAGGER_UI_ROUTE = "/api-docs"
     SWAGGER_SPEC_PATH = Path(__file__).parent / "swagger" / "v1" / "swagger.yaml"
@@ -29,13 +60,52 @@ class BaseConfig:
     OPENAPI_SERVICE_NAME = SERVICE_NAME
     OPENAPI_SERVICE_NAMESPACE = "python-demo"
 
+    SQL_N_PLUS_ONE_THRESHOLD = int(os.getenv("SQL_N_PLUS_ONE_THRESHOLD", "10"))
+
+    # POST /articles/import validates, inserts and commits this many lines at a time
+    ARTICLE_IMPORT_BATCH_SIZE = int(os.getenv("ARTICLE_IMPORT_BATCH_SIZE", "500"))
+
+    # Flat write payloads are checked by the precompiled FlatValidator before marshmallow
+    FAST_PAYLOAD_VALIDATION = os.getenv("FAST_PAYLOAD_VALIDATION", "1") == "1"
+
+    # Loader plans add raiseload for everything a response does not render (on in tests)
+    EAGER_LOADING_RAISE = os.getenv("EAGER_LOADING_RAISE", "0") == "1"
+
+    # Upper bound on items per POST/PATCH /<resource>/bulk request
+    BULK_MAX_ITEMS = int(os.getenv("BULK_MAX_ITEMS", "500"))
+
+    # GET /articles* and /authors* are served from a per-worker in-memory snapshot
+    READ_MODEL_ENABLED = os.getenv("READ_MODEL_ENABLED", "1") == "1"
+
+    # Encoded JSON of each entity served from the read model, LRU-bounded by size (0 disables)
+    FRAGMENT_CACHE_MAX_BYTES = int(os.getenv("FRAGMENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+    RESULT_CACHE_TTL_SECONDS = float(os.getenv("RESULT_CACHE_TTL_SECONDS", "30"))
+    RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "256"))
+
     OTEL_EXPORT_INTERVAL_MS = int(os.getenv("OTEL_EXPORT_INTERVAL_MS", "60000"))
+    METRICS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    METRICS_LATENCY_BUCKETS = tuple(
+        float(bound)
+        for bound in os.getenv(
+            "METRICS_LATENCY_BUCKETS", "0.005,0.01,0.025,0.05,0.1,0.25,0.5,1,2.5,5,10"
+        ).split(",")
+        if bound.strip()
+    )
+    METRICS_EXEMPLAR_MIN_SECONDS = (
+        float(os.environ["METRICS_EXEMPLAR_MIN_SECONDS"])
+        if os.getenv("METRICS_EXEMPLAR_MIN_SECONDS")
+        else None
+    )
+
+    RUNTIME_METRICS_INTERVAL_SECONDS = float(os.getenv("RUNTIME_METRICS_INTERVAL_SECONDS", "5"))
 
     KEYCLOAK_BASE_URL = os.getenv("KEYCLOAK_BASE_URL", "http://keycloak:8080")
     KEYCLOAK_REALM = os.getenv("KEYCLOAK_REALM", "python-demo")
     KEYCLOAK_CLIENT_ID = os.getenv("KEYCLOAK_CLIENT_ID", "python-demo-api")
     KEYCLOAK_CLIENT_SECRET = os.getenv("KEYCLOAK_CLIENT_SECRET", "python-demo-api-secret")
     KEYCLOAK_ADMIN_ROLE = os.getenv("KEYCLOAK_ADMIN_ROLE", "admin")
+    KEYCLOAK_CLAIMS_CACHE_SIZE = int(os.getenv("KEYCLOAK_CLAIMS_CACHE_SIZE", "1024"))
 
 
 class TestConfig(BaseConfig):
@@ -44,6 +114,14 @@ class TestConfig(BaseConfig):
         "sqlite+pysqlite:///:memory:",
     )
     TESTING = True
+    # In-memory SQLite runs on a StaticPool, which takes no sizing options
+    SQLALCHEMY_ENGINE_OPTIONS = {}
+    LOG_SQL_LEVEL = os.getenv("LOG_SQL_LEVEL", "WARNING")
+    # Test runs must not write into the repository's api/logs
+    LOG_DIR = Path(tempfile.gettempdir()) / "python-demo-test-logs"
+    EAGER_LOADING_RAISE = True
+    # Request tests cover the SQL path; the read model's own tests switch it on
+    READ_MODEL_ENABLED = False
 
 
 class DevelopmentConfig(BaseConfig):
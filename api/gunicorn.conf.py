@@ -0,0 +1,38 @@
+"""Gunicorn settings picked up automatically from the working directory."""
+
+import os
+
+# Import the app once in the master: migrations and seeding (DB_BOOTSTRAP=auto) run
+# there a single time before forking, and workers start from the already-built app.
+preload_app = os.getenv("GUNICORN_PRELOAD_APP", "1") == "1"
+
+# Read by config.py when the app is imported, after this file: the master and
+# each worker slot write their own app.<label>.log/sqlalchemy.<label>.log instead
+# of all of them rotating app.log. Labels are reused when a worker is replaced,
+# so restarts and recycling do not add files.
+os.environ.setdefault("LOG_FILE_PER_PROCESS", "1")
+os.environ["LOG_PROCESS_LABEL"] = "master"
+
+
+def on_starting(server):
+    if os.getenv("LOG_FILE_PER_PROCESS") == "1":
+        from config import get_config
+        from logging_config import prune_process_logs
+
+        # Files of slots beyond the current worker count (or of older pid-named runs)
+        labels = {"master", *(f"worker-{slot}" for slot in range(server.num_workers))}
+        prune_process_logs(get_config().LOG_DIR, labels)
+
+    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        from observability.multiprocess import clear_sample_files
+
+        os.makedirs(multiproc_dir, exist_ok=True)
+        clear_sample_files(multiproc_dir)
+
+
+def pre_fork(server, worker):
+    # The lowest slot no live worker holds; the child inherits the label through fork
+    taken = {getattr(other, "log_slot", None) for other in server.WORKERS.values()}
+    worker.log_slot = next(slot for slot in range(len(taken) + 1) if slot not in taken)
+    os.environ["LOG_PROCESS_LABEL"] = f"worker-{worker.log_slot}"
@@ -1,48 +1,184 @@
+import atexit
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import os
+import queue
+import random
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Union
+from typing import Callable, List, Optional, Union
 
+ACCESS_LOG_FLAG = "access_log"
+SQL_LOGGER_NAME = "sqlalchemy.engine"
+# Names this process's files with per_process_files (set per worker slot by gunicorn.conf.py)
+PROCESS_LABEL_ENV = "LOG_PROCESS_LABEL"
+LOG_FILE_STEMS = ("app", "sqlalchemy")
 
-def configure_logging(log_dir: Union[str, Path], level: str = "INFO") -> None:
-    """Configure application-wide logging to stdout and rotating files."""
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+_handler_factory: Optional[Callable[[], List[logging.Handler]]] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, ready for log shippers."""
+
+    EXTRA_FIELDS = ("request_id", "status")
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in self.EXTRA_FIELDS:
+            if hasattr(record, field):
+                payload[field] = getattr(record, field)
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep a fraction of access lines and SQL statement logs; everything else passes.
+
+    Runs before records are queued, so dropped records cost neither formatting nor I/O.
+    Access lines for 5xx responses are always kept.
+    """
+
+    def __init__(self, access_rate: float = 1.0, sql_rate: float = 1.0, rng=random.random):
+        super().__init__()
+        self.access_rate = access_rate
+        self.sql_rate = sql_rate
+        self._rng = rng
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, ACCESS_LOG_FLAG, False) and getattr(record, "status", 0) < 500:
+            return self._keep(self.access_rate)
+        if record.name.startswith(SQL_LOGGER_NAME) and record.levelno <= logging.INFO:
+            return self._keep(self.sql_rate)
+        return True
+
+    def _keep(self, rate: float) -> bool:
+        return rate >= 1 or (rate > 0 and self._rng() < rate)
+
+
+class _SqlRecordsOnly(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.name.startswith(SQL_LOGGER_NAME)
+
+
+def configure_logging(
+    log_dir: Union[str, Path],
+    level: str = "INFO",
+    *,
+    json_lines: bool = False,
+    access_sample_rate: float = 1.0,
+    sql_level: str = "INFO",
+    sql_sample_rate: float = 1.0,
+    per_process_files: bool = False,
+) -> None:
+    """Configure application-wide logging to stdout and rotating files.
+
+    Request threads only push records onto an in-memory queue; a ``QueueListener``
+    thread does the formatting and file/stdout I/O.
+    """
+
+    global _queue_handler, _handler_factory
 
     log_directory = Path(log_dir)
     log_directory.mkdir(parents=True, exist_ok=True)
 
     log_level = getattr(logging, level.upper(), logging.INFO)
-    logging.basicConfig(level=log_level)
+    if json_lines:
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+
+    def build_handlers() -> List[logging.Handler]:
+        # With several gunicorn workers, per-process files avoid concurrent rotation of one file
+        suffix = f".{process_label()}" if per_process_files else ""
 
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-    )
+        app_file_handler = RotatingFileHandler(
+            log_directory / f"app{suffix}.log", maxBytes=5 * 1024 * 1024, backupCount=5
+        )
+        app_file_handler.setFormatter(formatter)
 
-    # Root logger handler writing to file
-    app_log_path = log_directory / "app.log"
-    app_file_handler = RotatingFileHandler(
-        app_log_path, maxBytes=5 * 1024 * 1024, backupCount=5
-    )
-    app_file_handler.setFormatter(formatter)
+        # SQLAlchemy engine logs for debugging SQL queries
+        sql_handler = RotatingFileHandler(
+            log_directory / f"sqlalchemy{suffix}.log", maxBytes=5 * 1024 * 1024, backupCount=3
+        )
+        sql_handler.setFormatter(formatter)
+        sql_handler.addFilter(_SqlRecordsOnly())
 
+        # Ensure stdout/stderr also receive logs
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        return [app_file_handler, sql_handler, stream_handler]
+
+    _stop_listener()
     root_logger = logging.getLogger()
-    if not any(isinstance(h, RotatingFileHandler) and h.baseFilename == str(app_log_path)
-               for h in root_logger.handlers):
-        root_logger.addHandler(app_file_handler)
-
-    # SQLAlchemy engine logs for debugging SQL queries
-    sqlalchemy_log_path = log_directory / "sqlalchemy.log"
-    sql_handler = RotatingFileHandler(
-        sqlalchemy_log_path, maxBytes=5 * 1024 * 1024, backupCount=3
-    )
-    sql_handler.setFormatter(formatter)
-    sql_logger = logging.getLogger("sqlalchemy.engine")
-    if not any(isinstance(h, RotatingFileHandler) and h.baseFilename == str(sqlalchemy_log_path)
-               for h in sql_logger.handlers):
-        sql_logger.setLevel(logging.INFO)
-        sql_logger.addHandler(sql_handler)
-
-    # Ensure stdout/stderr also receive logs
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-    root_logger.addHandler(stream_handler)
+    if _queue_handler is not None:
+        root_logger.removeHandler(_queue_handler)
+
+    _queue_handler = QueueHandler(queue.SimpleQueue())
+    _queue_handler.addFilter(SamplingFilter(access_sample_rate, sql_sample_rate))
+    root_logger.addHandler(_queue_handler)
+    root_logger.setLevel(log_level)
+    logging.getLogger(SQL_LOGGER_NAME).setLevel(getattr(logging, sql_level.upper(), logging.INFO))
+
+    _handler_factory = build_handlers
+    _start_listener()
+
+
+def process_label() -> str:
+    """``LOG_PROCESS_LABEL`` (``master``, ``worker-0``...) or, outside gunicorn, the pid."""
+
+    return os.environ.get(PROCESS_LABEL_ENV) or str(os.getpid())
+
+
+def prune_process_logs(log_dir: Union[str, Path], keep_labels) -> List[Path]:
+    """Delete per-process log files (and their rotations) of labels not in ``keep_labels``."""
+
+    removed = []
+    for stem in LOG_FILE_STEMS:
+        for path in Path(log_dir).glob(f"{stem}.*.log*"):
+            label = path.name[len(stem) + 1 :].split(".log", 1)[0]
+            if label not in keep_labels:
+                path.unlink(missing_ok=True)
+                removed.append(path)
+    return removed
+
+
+def _start_listener() -> None:
+    global _listener
+    if _queue_handler is None or _handler_factory is None:
+        return
+    _listener = QueueListener(_queue_handler.queue, *_handler_factory(), respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+def _restart_listener_after_fork() -> None:
+    # The listener thread does not survive fork (gunicorn preload_app): give the
+    # child a fresh queue and its own handlers.
+    global _listener
+    if _queue_handler is None:
+        return
+    _listener = None
+    _queue_handler.queue = queue.SimpleQueue()
+    _start_listener()
+
 
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+atexit.register(_stop_listener)
@@ -0,0 +1,22 @@
+"""Composite index backing keyset pagination on articles"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251201_0002"
+down_revision = "20251130_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_articles_created_at_id",
+        "articles",
+        ["created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_articles_created_at_id", table_name="articles")
@@ -0,0 +1,47 @@
+"""Stored excerpt column for the articles summary projection"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251202_0003"
+down_revision = "20251201_0002"
+branch_labels = None
+depends_on = None
+
+EXCERPT_LENGTH = 200
+
+
+def _build_excerpt(text):
+    if not text:
+        return ""
+    normalized = text.strip()
+    if len(normalized) <= EXCERPT_LENGTH:
+        return normalized
+    return f"{normalized[:EXCERPT_LENGTH].strip()}…"
+
+
+def upgrade():
+    op.add_column(
+        "articles",
+        sa.Column("excerpt", sa.String(length=255), nullable=False, server_default=""),
+    )
+
+    articles = sa.table(
+        "articles",
+        sa.column("id", sa.Integer),
+        sa.column("post_entry", sa.Text),
+        sa.column("excerpt", sa.String),
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(articles.c.id, articles.c.post_entry)).fetchall()
+    for row in rows:
+        bind.execute(
+            articles.update()
+            .where(articles.c.id == row.id)
+            .values(excerpt=_build_excerpt(row.post_entry))
+        )
+
+
+def downgrade():
+    op.drop_column("articles", "excerpt")
@@ -0,0 +1,18 @@
+"""Content hash of the applied seed on seed_runs"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251203_0004"
+down_revision = "20251202_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("seed_runs", sa.Column("content_hash", sa.String(length=64), nullable=True))
+
+
+def downgrade():
+    op.drop_column("seed_runs", "content_hash")
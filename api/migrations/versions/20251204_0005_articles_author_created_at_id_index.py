@@ -0,0 +1,22 @@
+"""Composite index backing keyset pagination of an author's articles"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20251204_0005"
+down_revision = "20251203_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_articles_author_created_at_id",
+        "articles",
+        ["author_id", "created_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_articles_author_created_at_id", table_name="articles")
@@ -0,0 +1,28 @@
+"""Per-table version rows bumped by every write"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251205_0006"
+down_revision = "20251204_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    data_versions = op.create_table(
+        "data_versions",
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("changed_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("table_name"),
+    )
+    op.bulk_insert(
+        data_versions,
+        [{"table_name": name, "version": 0} for name in ("articles", "authors", "socials")],
+    )
+
+
+def downgrade():
+    op.drop_table("data_versions")
@@ -0,0 +1,32 @@
+"""Log of the rows written under each data_versions bump"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20251206_0007"
+down_revision = "20251205_0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "data_changes",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("table_name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("row_id", sa.Integer(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_data_changes_table_name_version",
+        "data_changes",
+        ["table_name", "version"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_data_changes_table_name_version", table_name="data_changes")
+    op.drop_table("data_changes")
@@ -1,7 +1,7 @@
 from .article import Article
 from .author import Author
+from .data_version import DataChange, DataVersion
 from .seed_run import SeedRun
 from .social import Social
 
-__all__ = ["Article", "Author", "SeedRun", "Social"]
-
+__all__ = ["Article", "Author", "DataChange", "DataVersion", "SeedRun", "Social"]
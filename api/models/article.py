@@ -4,20 +4,43 @@ from sqlalchemy.orm import validates
 from extensions import db
 from .base import SerializerMixin, TimestampMixin
 
+EXCERPT_LENGTH = 200
+
+
+def build_excerpt(text, limit: int = EXCERPT_LENGTH) -> str:
+    """Mirror the UI preview: trimmed text cut at ``limit`` chars with an ellipsis."""
+
+    if not text:
+        return ""
+    normalized = text.strip()
+    if len(normalized) <= limit:
+        return normalized
+    return f"{normalized[:limit].strip()}…"
+
 
 class Article(SerializerMixin, TimestampMixin, db.Model):
     __tablename__ = "articles"
+    __table_args__ = (
+        db.Index("ix_articles_created_at_id", "created_at", "id"),
+        db.Index("ix_articles_author_created_at_id", "author_id", "created_at", "id"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(255), nullable=False)
     slug = db.Column(db.String(255), nullable=False, unique=True)
     published_label = db.Column(db.String(255), nullable=False)
     post_entry = db.Column(db.Text, nullable=False)
+    excerpt = db.Column(db.String(255), nullable=False, default="")
     tags = db.Column(db.JSON, nullable=False, default=list)
     author_id = db.Column(db.Integer, db.ForeignKey("authors.id", ondelete="CASCADE"), nullable=False)
 
     author = db.relationship("Author", back_populates="articles")
 
+    @validates("post_entry")
+    def validate_post_entry(self, key, value):
+        self.excerpt = build_excerpt(value)
+        return value
+
     @validates("tags")
     def validate_tags(self, key, value):
         if value is None:
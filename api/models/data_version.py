@@ -0,0 +1,234 @@
+"""One version row per catalog table, bumped in the same transaction as every write.
+
+``updated_at`` cannot tell whether a table changed: MySQL's ``DATETIME`` keeps
+whole seconds, so a second edit in the same second leaves ``max(updated_at)``
+where it was, and the seed upsert stamps the article file's own date. Every
+write through the session instead increments ``data_versions.version`` of the
+tables it touched: ORM flushes (new, modified and deleted objects) and Core
+``INSERT``/``UPDATE``/``DELETE`` statements run with ``session.execute`` (bulk
+endpoints, NDJSON import, seed upserts). Deletes also bump the tables whose rows
+the database removes through ``ON DELETE CASCADE``.
+
+Since the row is updated inside the writer's transaction, readers in any
+worker see the new version exactly when they can see the new data.
+
+Each bump also logs the rows it covers in ``data_changes``, as ``(table,
+version, row_id)`` with ``row_id`` ``NULL`` when any row may have changed (Core
+``INSERT``/``DELETE`` statements, cascades), so a reader that holds version ``n``
+can fetch just the rows written since. The log keeps the last
+``CHANGE_LOG_RETENTION`` versions of each table.
+
+The same listeners remember which rows the transaction wrote, as ``(table, id)``
+tags (``id`` is ``None`` for a Core statement), and hand them to the callbacks
+registered with :func:`subscribe_to_commits` once it commits; in-process caches
+use that to drop entries early.
+"""
+
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import Integer, String, bindparam, event, select, update
+from sqlalchemy.orm import Session
+
+from extensions import db
+
+VERSIONED_TABLES = ("articles", "authors", "socials")
+
+# Versions of each table kept in data_changes; a reader further behind reloads the table
+CHANGE_LOG_RETENTION = 1000
+
+# (table, id) of a written row; id None stands for the whole table
+RowTag = Tuple[str, Optional[int]]
+
+_PENDING_KEY = "data_version_rows"
+_PRUNED_KEY = "data_version_pruned"
+_commit_subscribers: List[Callable[[Set[RowTag]], None]] = []
+
+
+class DataVersion(db.Model):
+    __tablename__ = "data_versions"
+
+    table_name = db.Column(db.String(64), primary_key=True)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+    changed_at = db.Column(db.DateTime, nullable=True)
+
+
+class DataChange(db.Model):
+    __tablename__ = "data_changes"
+    __table_args__ = (db.Index("ix_data_changes_table_name_version", "table_name", "version"),)
+
+    id = db.Column(db.Integer, primary_key=True)
+    table_name = db.Column(db.String(64), nullable=False)
+    version = db.Column(db.BigInteger, nullable=False)
+    row_id = db.Column(db.Integer, nullable=True)
+
+
+@event.listens_for(DataVersion.__table__, "after_create")
+def _insert_version_rows(target, connection, **kw):
+    connection.execute(
+        target.insert(), [{"table_name": name, "version": 0} for name in VERSIONED_TABLES]
+    )
+
+
+def bump_versions(session: Session, tables: Iterable[str], rows: Iterable[RowTag] = ()) -> None:
+    """Increment the version of ``tables`` inside ``session``'s transaction.
+
+    ``rows`` are the ``(table, id)`` tags written under the new versions; a table
+    without tags (or tagged with ``None``) is logged as changed as a whole.
+    """
+
+    names = sorted(set(tables) & set(VERSIONED_TABLES))
+    if not names:
+        return
+    versions = DataVersion.__table__
+    changes = DataChange.__table__
+    ids = {}
+    for table, row_id in rows:
+        ids.setdefault(table, set()).add(row_id)
+
+    # On the connection: a session.execute would re-enter do_orm_execute
+    connection = session.connection()
+    connection.execute(
+        update(versions)
+        .where(versions.c.table_name.in_(names))
+        .values(version=versions.c.version + 1, changed_at=datetime.utcnow())
+    )
+    # The version row is locked by the UPDATE above, so this reads our own bump
+    connection.execute(
+        changes.insert().from_select(
+            ["table_name", "version", "row_id"],
+            select(
+                versions.c.table_name,
+                versions.c.version,
+                bindparam("change_row_id", type_=Integer),
+            ).where(versions.c.table_name == bindparam("change_table", type_=String)),
+        ),
+        [
+            {"change_table": name, "change_row_id": row_id}
+            for name in names
+            for row_id in _logged_ids(ids.get(name))
+        ],
+    )
+    # Pruning once per table and transaction is enough to bound the log
+    pruned = session.info.setdefault(_PRUNED_KEY, set())
+    prune_change_log(session, set(names) - pruned)
+    pruned.update(names)
+
+
+def prune_change_log(session: Session, tables: Iterable[str]) -> None:
+    """Drop the ``data_changes`` rows of ``tables`` older than ``CHANGE_LOG_RETENTION`` versions."""
+
+    names = sorted(set(tables) & set(VERSIONED_TABLES))
+    if not names:
+        return
+    versions = DataVersion.__table__
+    changes = DataChange.__table__
+    session.connection().execute(
+        changes.delete().where(
+            changes.c.table_name.in_(names),
+            changes.c.version
+            <= select(versions.c.version)
+            .where(versions.c.table_name == changes.c.table_name)
+            .scalar_subquery()
+            - CHANGE_LOG_RETENTION,
+        )
+    )
+
+
+def subscribe_to_commits(callback: Callable[[Set[RowTag]], None]) -> None:
+    """Call ``callback`` with the rows of every committed transaction that wrote any."""
+
+    if callback not in _commit_subscribers:
+        _commit_subscribers.append(callback)
+
+
+def _with_cascades(tables: Iterable[str]) -> Set[str]:
+    names = set(tables)
+    pending = list(names)
+    while pending:
+        parent = pending.pop()
+        for table in db.metadata.tables.values():
+            if table.name in names:
+                continue
+            if any(
+                fk.column.table.name == parent and (fk.ondelete or "").upper() == "CASCADE"
+                for fk in table.foreign_keys
+            ):
+                names.add(table.name)
+                pending.append(table.name)
+    return names
+
+
+def _logged_ids(ids: Optional[Set[Optional[int]]]) -> List[Optional[int]]:
+    if not ids or None in ids:
+        return [None]
+    return sorted(ids)
+
+
+def _table_name(instance) -> str:
+    return getattr(instance, "__tablename__", "")
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_flushed_tables(session, flush_context):
+    # An object whose only change is a collection (an article appended to its
+    # author) leaves its own row untouched
+    changed = [
+        instance
+        for instance in session.dirty
+        if session.is_modified(instance, include_collections=False)
+    ]
+    written = {_table_name(instance) for instance in (*session.new, *changed)}
+    # Only deletes cascade to other tables
+    deleted = {_table_name(instance) for instance in session.deleted}
+    cascaded = _with_cascades(deleted) - deleted
+    rows = {
+        (_table_name(instance), instance.id)
+        for instance in (*session.new, *changed, *session.deleted)
+        if _table_name(instance) in VERSIONED_TABLES
+    }
+    # The database picks the cascaded rows, so their whole table counts as changed
+    rows.update((name, None) for name in cascaded if name in VERSIONED_TABLES)
+    bump_versions(session, written | deleted | cascaded, rows)
+    session.info.setdefault(_PENDING_KEY, set()).update(rows)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _bump_statement_tables(orm_execute_state):
+    state = orm_execute_state
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    if table is None or table.name in (DataVersion.__tablename__, DataChange.__tablename__):
+        return
+    names = {table.name}
+    if state.is_delete:
+        names = _with_cascades(names)
+    rows = {(name, None) for name in names if name in VERSIONED_TABLES}
+    # An UPDATE by primary key (a list of dicts with ``id``) names its rows
+    parameters = state.parameters
+    if (
+        state.is_update
+        and state.statement.whereclause is None
+        and isinstance(parameters, list)
+        and parameters
+        and all("id" in row for row in parameters)
+    ):
+        rows = {(table.name, row["id"]) for row in parameters if table.name in VERSIONED_TABLES}
+    bump_versions(state.session, names, rows)
+    state.session.info.setdefault(_PENDING_KEY, set()).update(rows)
+
+
+@event.listens_for(Session, "after_commit")
+def _announce_committed_rows(session):
+    session.info.pop(_PRUNED_KEY, None)
+    rows = session.info.pop(_PENDING_KEY, None)
+    if rows:
+        for callback in _commit_subscribers:
+            callback(rows)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_rows(session):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_PRUNED_KEY, None)
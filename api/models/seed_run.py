@@ -7,5 +7,7 @@ class SeedRun(SerializerMixin, db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(128), unique=True, nullable=False)
+    # SHA-256 of the seed content; a different hash re-applies the seed
+    content_hash = db.Column(db.String(64), nullable=True)
     executed_at = db.Column(db.DateTime, server_default=db.func.current_timestamp(), nullable=False)
 
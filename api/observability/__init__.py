@@ -1,4 +1,29 @@
 from .metrics import ObservabilityMetrics, MetricsFormatter
+from .multiprocess import MultiProcessSampleStore, clear_sample_files
+from .pool import (
+    PRE_PING_STRATEGIES,
+    InstrumentedQueuePool,
+    configure_pre_ping,
+    instrument_pool,
+    instrumented_engine_options,
+)
+from .runtime import RuntimeCollector, current_rss_bytes
+from .sql import instrument_sqlalchemy, repeated_statements, request_db_stats
 
-__all__ = ["ObservabilityMetrics", "MetricsFormatter"]
+__all__ = [
+    "ObservabilityMetrics",
+    "MetricsFormatter",
+    "MultiProcessSampleStore",
+    "clear_sample_files",
+    "PRE_PING_STRATEGIES",
+    "InstrumentedQueuePool",
+    "configure_pre_ping",
+    "instrument_pool",
+    "instrumented_engine_options",
+    "RuntimeCollector",
+    "current_rss_bytes",
+    "instrument_sqlalchemy",
+    "repeated_statements",
+    "request_db_stats",
+]
 
@@ -1,21 +1,55 @@
 from __future__ import annotations
 
 import os
-from typing import Iterable
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Sequence, Tuple
 
 from opentelemetry import metrics
 from opentelemetry.metrics._internal.observation import Observation
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.metrics.view import ExplicitBucketHistogramAggregation, View
 from opentelemetry.sdk.resources import Resource
 
+from .multiprocess import MergedSamples, MultiProcessSampleStore, format_bound
+from .runtime import RUNTIME_METRICS, RuntimeCollector
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Exemplar(NamedTuple):
+    request_id: str
+    value: float
+    timestamp: float
+
+
+# (metric name, sorted point attributes, bucket "le") -> latest exemplar of that bucket
+Exemplars = Dict[Tuple[str, tuple, str], Exemplar]
+
 
 class ObservabilityMetrics:
     """Wraps OpenTelemetry metrics collection for HTTP requests and service liveness."""
 
-    def __init__(self, service_name: str, namespace: str = "python-demo"):
+    def __init__(
+        self,
+        service_name: str,
+        namespace: str = "python-demo",
+        multiprocess_dir: Optional[str] = None,
+        latency_buckets: Optional[Sequence[float]] = None,
+        exemplar_min_seconds: Optional[float] = None,
+    ):
         self.service_name = service_name
         self.namespace = namespace
+        self.sample_store = MultiProcessSampleStore(multiprocess_dir) if multiprocess_dir else None
+        self.latency_buckets = tuple(sorted(latency_buckets or DEFAULT_LATENCY_BUCKETS))
+        self.exemplar_min_seconds = exemplar_min_seconds
+        self._exemplars: Exemplars = {}
+        self._exemplars_lock = threading.Lock()
+        self.runtime_collector: Optional[RuntimeCollector] = None
+        self.runtime_publish_interval = 5.0
+        self._runtime_published_at: Optional[float] = None
 
         os.environ.setdefault("OTEL_TRACES_EXPORTER", "none")
         os.environ.setdefault("OTEL_METRICS_EXPORTER", "none")
@@ -28,22 +62,65 @@ class ObservabilityMetrics:
             }
         )
 
-        self.provider = MeterProvider(resource=resource, metric_readers=[self.reader])
+        latency_view = View(
+            instrument_name="http_server_request_duration_seconds",
+            aggregation=ExplicitBucketHistogramAggregation(boundaries=self.latency_buckets),
+        )
+        pool_wait_view = View(
+            instrument_name="db_pool_checkout_wait_seconds",
+            aggregation=ExplicitBucketHistogramAggregation(boundaries=POOL_WAIT_BUCKETS),
+        )
+        self.provider = MeterProvider(
+            resource=resource,
+            metric_readers=[self.reader],
+            views=[latency_view, pool_wait_view],
+        )
         metrics.set_meter_provider(self.provider)
 
         meter = self.provider.get_meter(service_name, version="0.1.0")
+        self._meter = meter
         self.request_counter = meter.create_counter(
             "http_server_requests_total",
             description="Total HTTP requests received by the API",
         )
-        self.duration_sum_counter = meter.create_counter(
-            "http_server_request_duration_seconds_sum",
-            description="Total time spent handling HTTP requests",
+        self.duration_histogram = meter.create_histogram(
+            "http_server_request_duration_seconds",
+            description="Time spent handling HTTP requests",
+            unit="s",
+        )
+        self.db_queries_counter = meter.create_counter(
+            "db_queries_total",
+            description="SQL statements executed while handling HTTP requests",
+        )
+        self.db_time_counter = meter.create_counter(
+            "db_time_seconds_total",
+            description="Time spent in SQL statements while handling HTTP requests",
             unit="s",
         )
-        self.duration_count_counter = meter.create_counter(
-            "http_server_request_duration_seconds_count",
-            description="Number of HTTP requests observed for duration",
+        self.cache_hits_counter = meter.create_counter(
+            "cache_hits_total",
+            description="Lookups answered from an in-process cache",
+        )
+        self.cache_misses_counter = meter.create_counter(
+            "cache_misses_total",
+            description="Lookups that missed an in-process cache",
+        )
+        self.cache_evictions_counter = meter.create_counter(
+            "cache_evictions_total",
+            description="Entries evicted from an in-process cache to respect its size limit",
+        )
+        self.pool_wait_histogram = meter.create_histogram(
+            "db_pool_checkout_wait_seconds",
+            description="Time spent waiting for a connection from the SQLAlchemy pool",
+            unit="s",
+        )
+        self.pool_events_counter = meter.create_counter(
+            "db_pool_events_total",
+            description="SQLAlchemy pool checkout, checkin and connect events",
+        )
+        self.pool_timeouts_counter = meter.create_counter(
+            "db_pool_checkout_timeouts_total",
+            description="Checkouts that gave up after pool_timeout",
         )
         meter.create_observable_gauge(
             "service_liveness",
@@ -51,26 +128,140 @@ class ObservabilityMetrics:
             description="Indicates if the API process is alive",
         )
 
+    def register_runtime_collector(self, collector: RuntimeCollector, publish_interval: float = 5.0):
+        """Expose process, GC and pool readings of ``collector`` as per-worker series.
+
+        In multiprocess mode every worker also copies its readings into the shared
+        store (at most once per ``publish_interval`` while serving requests), so a
+        scrape answered by one worker still lists every live worker's ``pid``.
+        """
+        self.runtime_collector = collector
+        self.runtime_publish_interval = publish_interval
+        for name, (description, kind) in RUNTIME_METRICS.items():
+            create = (
+                self._meter.create_observable_counter
+                if kind == "counter"
+                else self._meter.create_observable_gauge
+            )
+            create(name, callbacks=[self._runtime_callback(name)], description=description)
+
+    def _runtime_callback(self, name: str):
+        def observe(options=None):
+            for sample in self.runtime_collector.samples():
+                if sample.name == name:
+                    yield Observation(sample.value, attributes=sample.attributes)
+
+        return observe
+
+    def publish_runtime_samples(self, force: bool = False):
+        if self.sample_store is None or self.runtime_collector is None:
+            return
+        now = time.monotonic()
+        if (
+            not force
+            and self._runtime_published_at is not None
+            and now - self._runtime_published_at < self.runtime_publish_interval
+        ):
+            return
+        self._runtime_published_at = now
+        for sample in self.runtime_collector.samples():
+            self.sample_store.set(sample.name, sample.description, sample.kind, sample.attributes, sample.value)
+
     def _observe_liveness(self, options=None):
         yield Observation(
             1,
             attributes={"service": self.service_name, "state": "alive"},
         )
 
-    def record_request(self, method: str, path: str, status: int, duration_seconds: float):
+    def record_request(
+        self,
+        method: str,
+        path: str,
+        status: int,
+        duration_seconds: float,
+        request_id: Optional[str] = None,
+    ):
         attributes = {
             "service": self.service_name,
             "http.method": method,
             "http.route": self._normalize_path(path),
             "http.status_code": status,
         }
-        self.request_counter.add(1, attributes=attributes)
-        self.duration_sum_counter.add(duration_seconds, attributes=attributes)
-        self.duration_count_counter.add(1, attributes=attributes)
+        self._add(self.request_counter, 1, attributes)
+        self._record(self.duration_histogram, duration_seconds, attributes, self.latency_buckets)
+        if (
+            request_id
+            and self.exemplar_min_seconds is not None
+            and duration_seconds >= self.exemplar_min_seconds
+        ):
+            self._keep_exemplar(self.duration_histogram.name, attributes, duration_seconds, request_id)
+        self.publish_runtime_samples()
+
+    def record_db_usage(self, method: str, path: str, queries: int, duration_seconds: float):
+        if not queries:
+            return
+        attributes = {
+            "service": self.service_name,
+            "http.method": method,
+            "http.route": self._normalize_path(path),
+        }
+        self._add(self.db_queries_counter, queries, attributes)
+        self._add(self.db_time_counter, duration_seconds, attributes)
+
+    def record_pool_event(self, pool: str, event: str):
+        self._add(self.pool_events_counter, 1, {"service": self.service_name, "pool": pool, "event": event})
+
+    def record_pool_wait(self, pool: str, seconds: float, timed_out: bool = False):
+        attributes = {"service": self.service_name, "pool": pool}
+        self._record(self.pool_wait_histogram, seconds, attributes, POOL_WAIT_BUCKETS)
+        if timed_out:
+            self._add(self.pool_timeouts_counter, 1, attributes)
+
+    def record_cache_event(self, cache: str, endpoint: str, outcome: str, amount: int = 1):
+        counters = {
+            "hit": self.cache_hits_counter,
+            "miss": self.cache_misses_counter,
+            "eviction": self.cache_evictions_counter,
+        }
+        counter = counters.get(outcome)
+        if counter is None:
+            return
+        self._add(
+            counter,
+            amount,
+            {"service": self.service_name, "cache": cache, "endpoint": endpoint},
+        )
 
     def scrape(self):
         return self.reader.get_metrics_data()
 
+    def exemplars(self) -> Exemplars:
+        with self._exemplars_lock:
+            return dict(self._exemplars)
+
+    def shared_samples(self) -> Optional[MergedSamples]:
+        """Samples merged across every worker, or ``None`` in single-process mode."""
+        if self.sample_store is None:
+            return None
+        self.publish_runtime_samples(force=True)
+        return self.sample_store.merge()
+
+    def _add(self, counter, amount, attributes: dict):
+        counter.add(amount, attributes=attributes)
+        if self.sample_store is not None:
+            self.sample_store.inc(counter.name, counter.description, attributes, amount)
+
+    def _record(self, histogram, value: float, attributes: dict, boundaries: Sequence[float]):
+        histogram.record(value, attributes=attributes)
+        if self.sample_store is not None:
+            self.sample_store.observe(histogram.name, histogram.description, attributes, value, boundaries)
+
+    def _keep_exemplar(self, name: str, attributes: dict, value: float, request_id: str):
+        bucket = next((bound for bound in self.latency_buckets if value <= bound), float("inf"))
+        key = (name, tuple(sorted(attributes.items())), format_bound(bucket))
+        with self._exemplars_lock:
+            self._exemplars[key] = Exemplar(request_id, value, time.time())
+
     @staticmethod
     def _normalize_path(path: str) -> str:
         # Replace numeric path segments with :id to keep cardinality low
@@ -93,15 +284,26 @@ class MetricsFormatter:
         "Gauge": "gauge",
         "Sum": "counter",
     }
+    OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
 
-    def __init__(self, metrics_data):
+    def __init__(
+        self,
+        metrics_data,
+        shared_samples: Optional[MergedSamples] = None,
+        exemplars: Optional[Exemplars] = None,
+    ):
         self.metrics_data = metrics_data
+        self.shared_samples = shared_samples
+        self.exemplars = exemplars or {}
 
-    def to_text(self) -> str:
+    def to_text(self, openmetrics: bool = False) -> str:
+        """Render the snapshot; exemplars are only valid in (and emitted for) OpenMetrics."""
         if not self.metrics_data:
             return ""
 
         lines = []
+        shared = dict(self.shared_samples or {})
+        resource_attrs = {}
         for resource_metrics in self.metrics_data.resource_metrics:
             resource_attrs = dict(resource_metrics.resource.attributes)
             for scope_metric in resource_metrics.scope_metrics:
@@ -110,17 +312,114 @@ class MetricsFormatter:
                     data_class = metric.data.__class__.__name__
                     metric_type = self.TYPE_MAPPING.get(data_class, "gauge")
                     description = metric.description or "Metric emitted via OpenTelemetry"
-                    lines.append(f"# HELP {metric_name} {description}")
-                    lines.append(f"# TYPE {metric_name} {metric_type}")
+                    lines.extend(self._header(metric_name, metric_type, description, openmetrics))
+                    if metric_name in shared:
+                        # Multiprocess mode: replace this worker's partial view with the merged totals
+                        family = shared.pop(metric_name)
+                        lines.extend(
+                            self._shared_lines(metric_name, resource_attrs, family, openmetrics)
+                        )
+                        continue
+                    if metric_type == "histogram":
+                        for data_point in metric.data.data_points:
+                            bounds = [*data_point.explicit_bounds, float("inf")]
+                            lines.extend(
+                                self._histogram_lines(
+                                    metric_name,
+                                    resource_attrs,
+                                    dict(data_point.attributes),
+                                    [(format_bound(b), c) for b, c in zip(bounds, data_point.bucket_counts)],
+                                    data_point.sum,
+                                    data_point.count,
+                                    openmetrics,
+                                )
+                            )
+                        continue
                     for data_point in metric.data.data_points:
                         value = getattr(data_point, "value", getattr(data_point, "sum", None))
                         if value is None:
                             continue
                         labels = self._format_labels(resource_attrs, data_point.attributes)
                         lines.append(f"{metric_name}{labels} {self._format_value(value)}")
+
+        # Series only other workers have recorded so far
+        for metric_name, family in sorted(shared.items()):
+            description = family.description or "Metric emitted via OpenTelemetry"
+            lines.extend(self._header(metric_name, family.kind, description, openmetrics))
+            lines.extend(self._shared_lines(metric_name, resource_attrs, family, openmetrics))
+        if openmetrics:
+            lines.append("# EOF")
         lines.append("")
         return "\n".join(lines)
 
+    @staticmethod
+    def _header(metric_name: str, metric_type: str, description: str, openmetrics: bool):
+        family = metric_name
+        if openmetrics and metric_type == "counter":
+            # OpenMetrics names the counter family without the mandatory _total suffix
+            if metric_name.endswith("_total"):
+                family = metric_name[: -len("_total")]
+            else:
+                metric_type = "unknown"
+        return [f"# HELP {family} {description}", f"# TYPE {family} {metric_type}"]
+
+    def _shared_lines(self, metric_name: str, resource_attrs: dict, family, openmetrics: bool):
+        if family.kind != "histogram":
+            for (_, label_items), value in sorted(family.samples.items(), key=lambda item: str(item[0])):
+                labels = self._format_labels(resource_attrs, dict(label_items))
+                yield f"{metric_name}{labels} {self._format_value(value)}"
+            return
+
+        series = {}
+        for (suffix, label_items), value in family.samples.items():
+            attrs = dict(label_items)
+            le = attrs.pop("le", None)
+            entry = series.setdefault(tuple(sorted(attrs.items())), {"buckets": [], "sum": 0.0, "count": 0})
+            if suffix == "_bucket":
+                entry["buckets"].append((le, value))
+            elif suffix == "_sum":
+                entry["sum"] = value
+            elif suffix == "_count":
+                entry["count"] = value
+        for label_items, entry in sorted(series.items(), key=lambda item: str(item[0])):
+            buckets = sorted(entry["buckets"], key=lambda bucket: float(bucket[0]))
+            yield from self._histogram_lines(
+                metric_name,
+                resource_attrs,
+                dict(label_items),
+                buckets,
+                entry["sum"],
+                entry["count"],
+                openmetrics,
+            )
+
+    def _histogram_lines(
+        self,
+        metric_name: str,
+        resource_attrs: dict,
+        attributes: dict,
+        buckets,
+        total_sum: float,
+        total_count,
+        openmetrics: bool,
+    ):
+        exemplar_attrs = tuple(sorted(attributes.items()))
+        cumulative = 0
+        for le, count in buckets:
+            cumulative += int(count)
+            labels = self._format_labels(resource_attrs, {**attributes, "le": le})
+            line = f"{metric_name}_bucket{labels} {cumulative}"
+            exemplar = self.exemplars.get((metric_name, exemplar_attrs, le)) if openmetrics else None
+            if exemplar is not None:
+                line += (
+                    f' # {{request_id="{self._escape(exemplar.request_id)}"}} '
+                    f"{self._format_value(float(exemplar.value))} {exemplar.timestamp:.3f}"
+                )
+            yield line
+        labels = self._format_labels(resource_attrs, attributes)
+        yield f"{metric_name}_sum{labels} {self._format_value(float(total_sum))}"
+        yield f"{metric_name}_count{labels} {int(total_count)}"
+
     @staticmethod
     def _format_labels(resource_attrs: dict, point_attrs: dict) -> str:
         labels = {**resource_attrs, **point_attrs}
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import glob
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, NamedTuple, Sequence, Tuple, Union
+
+from prometheus_client.mmap_dict import MmapedDict
+
+SAMPLE_FILE_PATTERN = "samples_*.db"
+
+LabelItems = Tuple[Tuple[str, object], ...]
+
+
+class SharedFamily(NamedTuple):
+    description: str
+    kind: str
+    # (sample suffix, sorted label items) -> value summed across workers
+    samples: Dict[Tuple[str, LabelItems], float]
+
+
+MergedSamples = Dict[str, SharedFamily]
+
+
+class MultiProcessSampleStore:
+    """Per-process metric samples kept in a memory-mapped file.
+
+    Each gunicorn worker writes only to ``samples_<pid>.db`` inside the shared
+    directory, so increments never contend across processes; ``merge`` sums
+    every file at scrape time, the same layout prometheus_client uses for its
+    multiprocess mode. Files of dead workers are kept so counters stay monotonic.
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pid = None
+        self._file = None
+        self._initialized_series = set()
+
+    def inc(self, name: str, description: str, attributes: dict, amount: float) -> None:
+        with self._lock:
+            self._inc(name, "", description, "counter", attributes, amount)
+
+    def set(self, name: str, description: str, kind: str, attributes: dict, value: float) -> None:
+        """Store the latest reading of a per-process series (labelled with this worker's ``pid``)."""
+        with self._lock:
+            self._samples().write_value(
+                self._key(name, "", description, kind, attributes), value, time.time()
+            )
+
+    def observe(
+        self,
+        name: str,
+        description: str,
+        attributes: dict,
+        value: float,
+        boundaries: Sequence[float],
+    ) -> None:
+        """Record a histogram observation as a non-cumulative bucket plus sum/count."""
+        bucket = format_bound(next((bound for bound in boundaries if value <= bound), float("inf")))
+        with self._lock:
+            series = (self._samples_path(), name, json.dumps(attributes, sort_keys=True, default=str))
+            if series not in self._initialized_series:
+                # Create every bucket up front so all workers expose the same layout
+                for bound in (*boundaries, float("inf")):
+                    self._inc(name, "_bucket", description, "histogram", {**attributes, "le": format_bound(bound)}, 0)
+                self._initialized_series.add(series)
+            self._inc(name, "_bucket", description, "histogram", {**attributes, "le": bucket}, 1)
+            self._inc(name, "_sum", description, "histogram", attributes, value)
+            self._inc(name, "_count", description, "histogram", attributes, 1)
+
+    def merge(self) -> MergedSamples:
+        merged: MergedSamples = {}
+        for path in glob.glob(str(self.directory / SAMPLE_FILE_PATTERN)):
+            try:
+                entries = list(MmapedDict.read_all_values_from_file(path))
+            except (OSError, RuntimeError):
+                continue
+            file_pid = _pid_of(path)
+            worker_alive = file_pid is None or _pid_alive(file_pid)
+            for key, value, _timestamp, _pos in entries:
+                name, suffix, description, kind, attributes = json.loads(key)
+                if not worker_alive and attributes.get("pid") == file_pid:
+                    # Readings of an exited worker (RSS, threads...) would otherwise linger forever
+                    continue
+                family = merged.setdefault(name, SharedFamily(description, kind, {}))
+                sample_key = (suffix, tuple(sorted(attributes.items())))
+                family.samples[sample_key] = family.samples.get(sample_key, 0.0) + value
+        return merged
+
+    def _inc(self, name, suffix, description, kind, attributes, amount) -> None:
+        key = self._key(name, suffix, description, kind, attributes)
+        samples = self._samples()
+        current, _ = samples.read_value(key)
+        samples.write_value(key, current + amount, time.time())
+
+    @staticmethod
+    def _key(name, suffix, description, kind, attributes) -> str:
+        return json.dumps([name, suffix, description, kind, attributes], sort_keys=True, default=str)
+
+    def _samples_path(self) -> str:
+        return str(self.directory / f"samples_{os.getpid()}.db")
+
+    def _samples(self) -> MmapedDict:
+        # The store may be created in the gunicorn master (preload_app); every
+        # forked worker must open its own file instead of sharing the parent's.
+        pid = os.getpid()
+        if self._file is None or self._pid != pid:
+            self._file = MmapedDict(self._samples_path())
+            self._pid = pid
+        return self._file
+
+
+def format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _pid_of(path: str):
+    match = re.fullmatch(r"samples_(\d+)\.db", os.path.basename(path))
+    return int(match.group(1)) if match else None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def clear_sample_files(directory: Union[str, Path]) -> None:
+    """Remove samples left by a previous deployment; call from the gunicorn master."""
+
+    for path in glob.glob(str(Path(directory) / SAMPLE_FILE_PATTERN)):
+        os.remove(path)
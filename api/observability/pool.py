@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+PRE_PING_STRATEGIES = ("always", "idle", "never")
+
+_LAST_USED_KEY = "last_used_at"
+
+WaitObserver = Callable[[float, bool], None]
+
+
+class InstrumentedQueuePool(QueuePool):
+    """``QueuePool`` that reports how long each checkout waited for a connection.
+
+    SQLAlchemy has no event before a checkout starts, so the wait is measured
+    around ``connect()``: queue wait, opening a new connection and the checkout
+    listeners (pre-ping) are all included, which is what a request actually pays.
+    """
+
+    wait_observer: Optional[WaitObserver] = None
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self._observe_wait(time.perf_counter() - started, True)
+            raise
+        self._observe_wait(time.perf_counter() - started, False)
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.wait_observer = self.wait_observer
+        return pool
+
+    def _observe_wait(self, seconds: float, timed_out: bool) -> None:
+        if self.wait_observer is not None:
+            self.wait_observer(seconds, timed_out)
+
+
+def instrumented_engine_options(options: dict) -> dict:
+    """Engine options with ``InstrumentedQueuePool`` whenever a sized queue pool is configured."""
+
+    options = dict(options)
+    if "pool_size" in options:
+        options.setdefault("poolclass", InstrumentedQueuePool)
+    return options
+
+
+def instrument_pool(engine: Engine, pool_name: str, metrics) -> None:
+    """Count checkout/checkin/connect events and feed the checkout-wait histogram."""
+
+    def on_event(name):
+        def listener(*_args):
+            metrics.record_pool_event(pool_name, name)
+
+        return listener
+
+    for name in ("checkout", "checkin", "connect"):
+        event.listen(engine.pool, name, on_event(name))
+    if isinstance(engine.pool, InstrumentedQueuePool):
+        engine.pool.wait_observer = lambda seconds, timed_out: metrics.record_pool_wait(
+            pool_name, seconds, timed_out
+        )
+
+
+def configure_pre_ping(engine: Engine, strategy: str, idle_seconds: float) -> None:
+    """Ping on checkout only for connections idle longer than ``idle_seconds``.
+
+    ``always`` is SQLAlchemy's ``pool_pre_ping`` (set through the engine options) and
+    ``never`` relies on ``pool_recycle`` alone; both need nothing here.
+    """
+
+    if strategy != "idle":
+        return
+
+    @event.listens_for(engine.pool, "connect")
+    def _fresh(dbapi_connection, connection_record):
+        connection_record.info[_LAST_USED_KEY] = time.monotonic()
+
+    @event.listens_for(engine.pool, "checkin")
+    def _released(dbapi_connection, connection_record):
+        connection_record.info[_LAST_USED_KEY] = time.monotonic()
+
+    @event.listens_for(engine.pool, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        last_used = connection_record.info.get(_LAST_USED_KEY)
+        if last_used is not None and time.monotonic() - last_used < idle_seconds:
+            return
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception as error:
+            # The pool discards this connection and retries the checkout with a new one
+            raise exc.DisconnectionError() from error
+        connection_record.info[_LAST_USED_KEY] = time.monotonic()
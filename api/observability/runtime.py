@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import gc
+import os
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+class RuntimeSample(NamedTuple):
+    name: str
+    description: str
+    kind: str
+    attributes: dict
+    value: float
+
+
+RUNTIME_METRICS = {
+    "process_resident_memory_bytes": ("Current resident set size of the worker", "gauge"),
+    "process_open_fds": ("File descriptors currently open by the worker", "gauge"),
+    "process_threads": ("Threads alive in the worker", "gauge"),
+    "python_gc_collections_total": ("Garbage collections run, per generation", "counter"),
+    "python_gc_pause_seconds_total": ("Time spent in garbage collection, per generation", "counter"),
+    "db_pool_size": ("Configured size of the SQLAlchemy connection pool", "gauge"),
+    "db_pool_checked_out": ("Connections currently checked out of the pool", "gauge"),
+    "db_pool_overflow": ("Connections opened beyond pool_size (negative while the pool is not full)", "gauge"),
+    "read_model_memory_bytes": ("Approximate size of the worker's in-memory read model", "gauge"),
+    "read_model_memory_bytes_per_10k_articles": ("Read model size scaled to 10,000 articles", "gauge"),
+    "read_model_rows": ("Rows held by the read model, per table", "gauge"),
+    "read_model_refreshes_total": ("Read model table refreshes, per table and mode", "counter"),
+}
+
+
+def current_rss_bytes() -> Optional[int]:
+    """Current (not peak) resident set size, read from ``/proc/self/statm``."""
+    try:
+        with open("/proc/self/statm", "r", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def open_fd_count() -> Optional[int]:
+    try:
+        return len(os.listdir("/proc/self/fd"))
+    except OSError:
+        return None
+
+
+class GcPauseTracker:
+    """Accumulates GC pause time per generation through ``gc.callbacks``."""
+
+    def __init__(self):
+        self.pause_seconds = [0.0] * len(gc.get_stats())
+        self._started_at: Optional[float] = None
+
+    def install(self) -> None:
+        if self._callback not in gc.callbacks:
+            gc.callbacks.append(self._callback)
+
+    def _callback(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._started_at = time.perf_counter()
+        elif phase == "stop" and self._started_at is not None:
+            self.pause_seconds[info.get("generation", 0)] += time.perf_counter() - self._started_at
+            self._started_at = None
+
+
+gc_pause_tracker = GcPauseTracker()
+
+
+class RuntimeCollector:
+    """Reads process, GC and connection-pool state; every sample carries the worker PID."""
+
+    def __init__(
+        self,
+        service_name: str,
+        pools_provider: Optional[Callable[[], Dict[str, object]]] = None,
+        read_model_provider: Optional[Callable[[], object]] = None,
+    ):
+        self.service_name = service_name
+        self.pools_provider = pools_provider
+        self.read_model_provider = read_model_provider
+        gc_pause_tracker.install()
+
+    def samples(self) -> List[RuntimeSample]:
+        base = {"service": self.service_name, "pid": os.getpid()}
+        samples = []
+
+        def add(name: str, value, **labels):
+            if value is None:
+                return
+            description, kind = RUNTIME_METRICS[name]
+            samples.append(RuntimeSample(name, description, kind, {**base, **labels}, value))
+
+        add("process_resident_memory_bytes", current_rss_bytes())
+        add("process_open_fds", open_fd_count())
+        add("process_threads", threading.active_count())
+        for generation, stats in enumerate(gc.get_stats()):
+            add("python_gc_collections_total", stats.get("collections", 0), generation=generation)
+            add("python_gc_pause_seconds_total", gc_pause_tracker.pause_seconds[generation], generation=generation)
+
+        for pool_name, pool in (self.pools_provider() if self.pools_provider else {}).items():
+            # Only QueuePool exposes checkout accounting; SQLite's static pools are skipped
+            for name, reader in (
+                ("db_pool_size", "size"),
+                ("db_pool_checked_out", "checkedout"),
+                ("db_pool_overflow", "overflow"),
+            ):
+                method = getattr(pool, reader, None)
+                if callable(method):
+                    add(name, method(), pool=pool_name)
+
+        read_model = self.read_model_provider() if self.read_model_provider else None
+        if read_model is not None:
+            catalog = read_model.current()
+            memory = catalog.memory_bytes()
+            add("read_model_memory_bytes", memory)
+            articles = catalog.count_articles()
+            if articles:
+                add("read_model_memory_bytes_per_10k_articles", round(memory * 10_000 / articles))
+            for table in catalog.versions:
+                add("read_model_rows", len(catalog.records(table)), table=table)
+            for (table, mode), count in sorted(read_model.refreshes.items()):
+                add("read_model_refreshes_total", count, table=table, mode=mode)
+        return samples
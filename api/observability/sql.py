@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import NamedTuple
+
+from flask import current_app, g, has_request_context
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_START_TIMES_KEY = "query_started_at"
+
+
+class RequestDbStats(NamedTuple):
+    queries: int
+    seconds: float
+
+
+def instrument_sqlalchemy() -> None:
+    """Count statements and DB time per request for every engine (primary and replicas)."""
+
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def request_db_stats() -> RequestDbStats:
+    return RequestDbStats(getattr(g, "db_query_count", 0), getattr(g, "db_query_seconds", 0.0))
+
+
+def repeated_statements(threshold: int):
+    """Statements executed at least ``threshold`` times in this request (likely N+1)."""
+
+    statements = getattr(g, "db_statements", None)
+    if not statements or threshold <= 0:
+        return []
+    return [(statement, count) for statement, count in statements.most_common() if count >= threshold]
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(_START_TIMES_KEY, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get(_START_TIMES_KEY)
+    elapsed = time.perf_counter() - started.pop() if started else 0.0
+    if not has_request_context():
+        return
+    g.db_query_count = getattr(g, "db_query_count", 0) + 1
+    g.db_query_seconds = getattr(g, "db_query_seconds", 0.0) + elapsed
+    if current_app.config.get("SQL_N_PLUS_ONE_THRESHOLD", 0) > 0:
+        g.setdefault("db_statements", Counter())[statement] += 1
@@ -1,6 +1,20 @@
-from .article import ArticleSchema
+from .article import ArticleSchema, ArticleSummarySchema
 from .author import AuthorSchema
+from .compiled import CompiledSerializer, compile_serializer
+from .loading import plan_loading
 from .social import SocialSchema
+from .validators import FlatValidator, cached_schema, payload_loader
 
-__all__ = ["ArticleSchema", "AuthorSchema", "SocialSchema"]
+__all__ = [
+    "ArticleSchema",
+    "ArticleSummarySchema",
+    "AuthorSchema",
+    "CompiledSerializer",
+    "FlatValidator",
+    "SocialSchema",
+    "cached_schema",
+    "compile_serializer",
+    "payload_loader",
+    "plan_loading",
+]
 
@@ -14,6 +14,19 @@ class ArticleSchema(Schema):
     updated_at = fields.DateTime(dump_only=True)
 
 
+class ArticleSummarySchema(Schema):
+    id = fields.Int(dump_only=True)
+    title = fields.Str(dump_only=True)
+    slug = fields.Str(dump_only=True)
+    published_label = fields.Str(dump_only=True)
+    excerpt = fields.Str(dump_only=True)
+    tags = fields.List(fields.Str(), dump_only=True)
+    author_id = fields.Int(dump_only=True)
+    author = fields.Nested("AuthorSchema", only=("id", "name"), dump_only=True)
+    created_at = fields.DateTime(dump_only=True)
+    updated_at = fields.DateTime(dump_only=True)
+
+
 class ArticleInputSchema(Schema):
     article = fields.Nested(ArticleSchema(exclude=("id", "created_at", "updated_at")))
 
@@ -0,0 +1,183 @@
+"""Row-to-dict serializers compiled from the marshmallow schemas, for list endpoints.
+
+``schema.dump(instances)`` walks every field of every ORM object. The compiled
+serializer produces the same dicts from the column tuples of a Core ``select()``
+through a function generated once per schema, skipping ORM hydration and the
+model ``load`` events.
+"""
+
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from marshmallow import Schema, fields
+from sqlalchemy import JSON, inspect, select
+from sqlalchemy.orm import Session
+
+# Same chunk size selectinload uses for its IN lists
+COLLECTION_CHUNK_SIZE = 500
+
+_ISO_FORMATS = (None, "iso", "iso8601")
+
+
+class CompiledSerializer:
+    """Equivalent of ``schema.dump(many=True)`` over rows of :meth:`statement`.
+
+    Supported fields: columns of ``model`` (any field type), a ``Nested`` many-to-one
+    relationship (outer joined into the same SELECT) and a ``List(Nested(...))``
+    collection, fetched with one extra query per ``COLLECTION_CHUNK_SIZE`` parents.
+    """
+
+    def __init__(self, schema: Schema, model, _extra_columns: Sequence = ()):
+        self.schema = schema
+        self.model = model
+        self._mapper = inspect(model)
+        self._columns: List = []
+        self._joins: List = []
+        self._collections: List[Tuple[str, "CompiledSerializer", object, object]] = []
+        self._namespace: Dict[str, object] = {}
+
+        body = self._compile_fields(schema, self._mapper, "")
+        if self._collections:
+            self._key_index = self._column_index(self._mapper.primary_key[0], "")
+        names = [f"c{index}" for index in range(len(self._columns))]
+        self._columns.extend(_extra_columns)
+        names.extend(f"_extra{index}" for index in range(len(_extra_columns)))
+        source = f"def serialize(row):\n    {', '.join(names)}, = row\n    return {body}\n"
+        exec(compile(source, f"<compiled {type(schema).__name__}>", "exec"), self._namespace)
+        self._serialize_row: Callable = self._namespace["serialize"]
+        self.source = source
+
+    def statement(self):
+        """The SELECT the generated function reads; callers add filters, ordering and limits."""
+
+        statement = select(*self._columns).select_from(self.model)
+        for relationship in self._joins:
+            statement = statement.outerjoin(relationship)
+        return statement
+
+    def dump(self, session: Session, statement) -> List[dict]:
+        return self.dump_rows(session, session.execute(statement).all())
+
+    def dump_rows(self, session: Session, rows) -> List[dict]:
+        data = list(map(self._serialize_row, rows))
+        if self._collections and rows:
+            keys = [row[self._key_index] for row in rows]
+            for field_name, child, foreign_key, order_by in self._collections:
+                children = child._fetch_children(session, foreign_key, order_by, keys)
+                for item, key in zip(data, keys):
+                    item[field_name] = children.get(key, [])
+        return data
+
+    def _fetch_children(
+        self, session: Session, foreign_key, order_by, keys
+    ) -> Dict[object, List[dict]]:
+        grouped: Dict[object, List[dict]] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), COLLECTION_CHUNK_SIZE):
+            chunk = unique_keys[start:start + COLLECTION_CHUNK_SIZE]
+            statement = self.statement().where(foreign_key.in_(chunk)).order_by(*order_by)
+            for row in session.execute(statement):
+                grouped.setdefault(row[-1], []).append(self._serialize_row(row))
+        return grouped
+
+    def _column_index(self, column, prefix: str) -> int:
+        for index, existing in enumerate(self._columns):
+            if existing.element is column:
+                return index
+        self._columns.append(column.label(f"{prefix}_{column.key}"))
+        return len(self._columns) - 1
+
+    def _compile_fields(self, schema: Schema, mapper, prefix: str) -> str:
+        items = []
+        for field_name, field in schema.dump_fields.items():
+            key = field.data_key or field_name
+            attribute = field.attribute or field_name
+            if isinstance(field, fields.Nested):
+                expression = self._compile_nested(field, mapper, attribute, prefix)
+            elif isinstance(field, fields.List) and isinstance(field.inner, fields.Nested):
+                expression = self._register_collection(key, field.inner, mapper, attribute, prefix)
+            else:
+                column = mapper.columns[attribute]
+                self._columns.append(column.label(f"{prefix}{attribute}"))
+                expression = self._compile_value(field, column, f"c{len(self._columns) - 1}")
+            items.append(f"{key!r}: {expression}")
+        return "{" + ", ".join(items) + "}"
+
+    def _compile_nested(self, field: fields.Nested, mapper, attribute: str, prefix: str) -> str:
+        relationship = mapper.relationships[attribute]
+        if relationship.uselist or prefix:
+            raise TypeError(f"{attribute}: only top-level many-to-one Nested fields can be compiled")
+        self._joins.append(getattr(mapper.class_, attribute))
+        target = relationship.mapper
+        nested_prefix = f"{attribute}__"
+        body = self._compile_fields(field.schema, target, nested_prefix)
+        key_index = self._column_index(target.primary_key[0], nested_prefix)
+        # Outer join: no related row means every nested column is NULL, which dumps as None
+        return f"(None if c{key_index} is None else {body})"
+
+    def _register_collection(
+        self, key: str, inner: fields.Nested, mapper, attribute: str, prefix: str
+    ) -> str:
+        relationship = mapper.relationships[attribute]
+        if prefix or len(relationship.local_remote_pairs) != 1:
+            raise TypeError(f"{attribute}: only top-level single-column collections can be compiled")
+        _, foreign_key = relationship.local_remote_pairs[0]
+        child_model = relationship.mapper.class_
+        order_by = relationship.order_by or tuple(relationship.mapper.primary_key)
+        child = CompiledSerializer(
+            inner.schema, child_model, _extra_columns=(foreign_key.label("_parent"),)
+        )
+        self._collections.append((key, child, foreign_key, order_by))
+        # Filled in by dump_rows once the children are fetched; keeps the key order of dump()
+        return "None"
+
+    def _compile_value(self, field: fields.Field, column, name: str) -> str:
+        python_type = _python_type(column)
+        if isinstance(field, fields.List):
+            if isinstance(column.type, JSON):
+                # Mirrors the model load events that turn a NULL JSON list into []
+                return f"([] if {name} is None else {self._compile_list(field, name)})"
+            return f"(None if {name} is None else {self._compile_list(field, name)})"
+        if _is_passthrough(field, python_type):
+            return name
+        if isinstance(field, fields.DateTime) and field.format in _ISO_FORMATS:
+            # Covers Date and Time too: every "iso" formatter is the value's isoformat()
+            return f"(None if {name} is None else {name}.isoformat())"
+        return f"{self._bind(field)}({name})"
+
+    def _compile_list(self, field: fields.List, name: str) -> str:
+        if type(field.inner) is fields.String:
+            # ensure_text_type is str()
+            return f"list(map(str, {name}))"
+        return f"[{self._bind(field.inner)}(each) for each in {name}]"
+
+    def _bind(self, field: fields.Field) -> str:
+        """Fall back to the field's own ``_serialize`` for types without an inline form."""
+
+        name = f"_field{len(self._namespace)}"
+        serialize = field._serialize
+        self._namespace[name] = lambda value: serialize(value, None, None)
+        return name
+
+
+def _python_type(column):
+    try:
+        return column.type.python_type
+    except NotImplementedError:
+        return None
+
+
+def _is_passthrough(field: fields.Field, python_type) -> bool:
+    """Whether ``field._serialize`` returns column values of ``python_type`` unchanged."""
+
+    if isinstance(field, fields.String):
+        return python_type is str
+    if isinstance(field, fields.Integer):
+        return python_type is int and not field.as_string
+    return False
+
+
+def compile_serializer(schema: Schema, model) -> CompiledSerializer:
+    for field in schema.dump_fields.values():
+        if isinstance(field, (fields.Method, fields.Function)):
+            raise TypeError(f"{type(schema).__name__}: Method/Function fields need the object")
+    return CompiledSerializer(schema, model)
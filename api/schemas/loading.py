@@ -0,0 +1,97 @@
+"""SQLAlchemy loader options derived from what a marshmallow schema renders.
+
+``plan_loading(schema, model)`` walks the schema's effective dump fields (after
+``only``/``exclude``) and returns ``load_only`` for the rendered columns plus one
+eager loader per rendered relationship, recursively. Relationships and columns
+the schema does not render are never fetched. With ``raise_unplanned`` every
+other relationship gets ``raiseload`` and every deferred column raises on
+access, so a dump that needs something the plan left out fails loudly instead
+of issuing a lazy query per row.
+"""
+
+import threading
+from typing import Callable, Dict, Hashable, Iterable, Set, Tuple
+
+from marshmallow import Schema, fields
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+_plans: Dict[Hashable, Tuple] = {}
+_lock = threading.Lock()
+
+
+def plan_loading(
+    schema: Schema,
+    model,
+    raise_unplanned: bool = False,
+    many_to_one: Callable = selectinload,
+) -> Tuple:
+    """Loader options for ``select(model)`` whose result is dumped with ``schema``.
+
+    Collections always use ``selectinload``; ``many_to_one`` picks the loader for
+    scalar relationships (``joinedload`` when the query must stay one statement).
+    Plans are cached per schema class and the options that pick its dump fields
+    (``only``, ``exclude``, ``load_only``), so schemas built per request share
+    one plan and are not kept alive by the cache.
+    """
+
+    key = (_schema_key(schema), model, raise_unplanned, many_to_one)
+    options = _plans.get(key)
+    if options is None:
+        options = tuple(_plan(schema, inspect(model), raise_unplanned, many_to_one, ()))
+        with _lock:
+            options = _plans.setdefault(key, options)
+    return options
+
+
+def _schema_key(schema: Schema) -> Hashable:
+    only = None if schema.only is None else frozenset(schema.only)
+    return type(schema), only, frozenset(schema.exclude), frozenset(schema.load_only)
+
+
+def _plan(
+    schema: Schema, mapper, raise_unplanned: bool, many_to_one, required: Iterable[str]
+) -> list:
+    columns: Set[str] = set(required)
+    loaders = []
+    restrict_columns = True
+    for field_name, field in schema.dump_fields.items():
+        attribute = field.attribute or field_name
+        if attribute in mapper.relationships:
+            relationship = mapper.relationships[attribute]
+            nested = field.inner if isinstance(field, fields.List) else field
+            if not isinstance(nested, fields.Nested):
+                raise TypeError(f"{attribute}: relationships must be rendered with Nested")
+            local_keys, remote_keys = _join_keys(mapper, relationship)
+            columns.update(local_keys)
+            loader = (selectinload if relationship.uselist else many_to_one)(
+                getattr(mapper.class_, attribute)
+            )
+            child = _plan(
+                nested.schema, relationship.mapper, raise_unplanned, many_to_one, remote_keys
+            )
+            loaders.append(loader.options(*child))
+        elif attribute in mapper.column_attrs:
+            columns.add(attribute)
+        else:
+            # A plain Python property may read any column: keep them all loaded
+            restrict_columns = False
+
+    options = []
+    if restrict_columns:
+        attributes = [getattr(mapper.class_, key) for key in sorted(columns)]
+        options.append(load_only(*attributes, raiseload=raise_unplanned))
+    options.extend(loaders)
+    if raise_unplanned:
+        options.append(raiseload("*"))
+    return options
+
+
+def _join_keys(mapper, relationship) -> Tuple[Set[str], Set[str]]:
+    """Attribute names of the join columns on each side, which the loaders need loaded."""
+
+    local_keys, remote_keys = set(), set()
+    for local, remote in relationship.local_remote_pairs:
+        local_keys.add(mapper.get_property_by_column(local).key)
+        remote_keys.add(relationship.mapper.get_property_by_column(remote).key)
+    return local_keys, remote_keys
@@ -0,0 +1,166 @@
+"""Request payload loaders built once per (schema, partial) and shared across threads.
+
+Constructing a marshmallow schema binds every field (and, lazily, every nested
+schema) again, so the write routes reuse one instance per combination. Nested
+schemas are resolved up front: after construction ``load`` only reads the
+instance, which makes sharing it between Gunicorn threads safe.
+
+:class:`FlatValidator` is the optional fast path for payloads without nested
+objects: plain ``str``/``int``/``list[str]`` values are checked inline and every
+other field goes through its own ``deserialize``. Anything it does not accept
+is handed to the full schema, so error messages stay exactly marshmallow's.
+"""
+
+import threading
+from typing import Dict, Hashable, Tuple, Type, Union
+
+from marshmallow import EXCLUDE, INCLUDE, Schema, ValidationError, fields, missing
+
+Partial = Union[bool, Tuple[str, ...]]
+
+_schemas: Dict[Hashable, Schema] = {}
+_validators: Dict[Hashable, "FlatValidator"] = {}
+_lock = threading.Lock()
+
+
+def cached_schema(schema_class: Type[Schema], partial: Partial = False, **options) -> Schema:
+    """One shared ``schema_class(partial=partial, **options)`` per process."""
+
+    key = (schema_class, partial, tuple(sorted(options.items())))
+    schema = _schemas.get(key)
+    if schema is None:
+        with _lock:
+            schema = _schemas.get(key)
+            if schema is None:
+                schema = schema_class(partial=partial, **options)
+                _resolve_nested(schema)
+                _schemas[key] = schema
+    return schema
+
+
+def payload_loader(
+    schema_class: Type[Schema], partial: Partial = False, fast: bool = True, **options
+):
+    """``cached_schema`` or, with ``fast``, its :class:`FlatValidator`; both expose ``load``."""
+
+    schema = cached_schema(schema_class, partial, **options)
+    if not fast:
+        return schema
+    key = (schema_class, partial, tuple(sorted(options.items())))
+    validator = _validators.get(key)
+    if validator is None:
+        with _lock:
+            validator = _validators.setdefault(key, FlatValidator(schema))
+    return validator
+
+
+def clear_cache() -> None:
+    with _lock:
+        _schemas.clear()
+        _validators.clear()
+
+
+class FlatValidator:
+    """Precompiled ``schema.load`` for flat dict payloads; falls back to ``schema`` otherwise."""
+
+    def __init__(self, schema: Schema):
+        self.schema = schema
+        self.enabled = not _has_load_hooks(schema) and schema.unknown not in (EXCLUDE, INCLUDE)
+        self._known = frozenset(
+            field.data_key or name for name, field in schema.load_fields.items()
+        )
+        self._fields = []
+        self._nested = set()
+        for name, field in schema.load_fields.items():
+            key = field.data_key or name
+            if _is_nested(field):
+                self._nested.add(key)
+                continue
+            self._fields.append(
+                (key, field.attribute or name, _required(schema, name, field), _checker(field))
+            )
+
+    def load(self, data):
+        if not self.enabled or type(data) is not dict or not self._known.issuperset(data):
+            return self.schema.load(data)
+        if self._nested and not self._nested.isdisjoint(data):
+            return self.schema.load(data)
+
+        result = {}
+        for key, attribute, required, check in self._fields:
+            value = data.get(key, missing)
+            if value is missing:
+                if required:
+                    return self.schema.load(data)
+                continue
+            value = check(value)
+            if value is missing:
+                return self.schema.load(data)
+            result[attribute] = value
+        return result
+
+
+def _checker(field: fields.Field):
+    """A ``value -> loaded value`` function that returns ``missing`` instead of raising."""
+
+    validators = tuple(field.validators)
+
+    def validate(value):
+        for validator in validators:
+            try:
+                if validator(value) is False:
+                    return missing
+            except ValidationError:
+                return missing
+        return value
+
+    if type(field) is fields.String:
+        return lambda value: validate(value) if type(value) is str else missing
+    if type(field) is fields.Integer and not field.as_string:
+        return lambda value: validate(value) if type(value) is int else missing
+    inner = getattr(field, "inner", None)
+    if type(field) is fields.List and type(inner) is fields.String and not inner.validators:
+        return lambda value: (
+            validate(list(value))
+            if type(value) is list and all(type(item) is str for item in value)
+            else missing
+        )
+
+    def deserialize(value):
+        # Field.deserialize runs the validators itself
+        try:
+            return field.deserialize(value)
+        except ValidationError:
+            return missing
+
+    return deserialize
+
+
+def _required(schema: Schema, name: str, field: fields.Field) -> bool:
+    """Whether a missing value needs the full schema: a required error or a ``load_default``."""
+
+    if schema.partial is True or (schema.partial and name in schema.partial):
+        return False
+    return field.required or field.load_default is not missing
+
+
+def _is_nested(field: fields.Field) -> bool:
+    return isinstance(field, fields.Nested) or (
+        isinstance(field, fields.List) and isinstance(field.inner, fields.Nested)
+    )
+
+
+def _has_load_hooks(schema: Schema) -> bool:
+    # Keys are "validates" or (tag, pass_many) tuples such as ("pre_load", False)
+    load_tags = {"pre_load", "post_load", "validates", "validates_schema"}
+    return any(
+        methods and (tag if isinstance(tag, str) else tag[0]) in load_tags
+        for tag, methods in schema._hooks.items()
+    )
+
+
+def _resolve_nested(schema: Schema) -> None:
+    for field in schema.fields.values():
+        nested = field.inner if isinstance(field, fields.List) else field
+        if isinstance(nested, fields.Nested):
+            _resolve_nested(nested.schema)
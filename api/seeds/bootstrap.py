@@ -1,3 +1,4 @@
+import hashlib
 import json
 from datetime import datetime
 from pathlib import Path
@@ -6,33 +7,58 @@ from flask import current_app
 
 from extensions import db
 from models import Article, Author, SeedRun, Social
+from models.article import build_excerpt
+from services.bulk_upsert import bulk_upsert
 from .data import AUTHOR_SEED, SEED_NAME, SOCIALS_SEED
 
+ARTICLE_SEED_PATH = Path(__file__).parent / "article_seed_data.json"
+
 
 def bootstrap_seed_data():
-    """Load deterministic data into the database if the seed has not been executed yet."""
+    """Load deterministic data into the database unless this exact seed content was already applied."""
+
+    raw_articles = ARTICLE_SEED_PATH.read_bytes()
+    author_payload = _author_payload()
+    content_hash = _content_hash(raw_articles, author_payload)
 
-    seed_exists = SeedRun.query.filter_by(name=SEED_NAME).first()
-    if seed_exists:
+    seed_run = SeedRun.query.filter_by(name=SEED_NAME).first()
+    if seed_run and seed_run.content_hash == content_hash:
         current_app.logger.info("Seed '%s' already applied, skipping.", SEED_NAME)
         return
 
     current_app.logger.info("Running database seed '%s'...", SEED_NAME)
-    author = _upsert_author()
+    author = _upsert_author(author_payload)
     _upsert_socials(author)
-    _upsert_articles(author)
+    _upsert_articles(author, json.loads(raw_articles))
 
-    db.session.add(SeedRun(name=SEED_NAME))
+    if seed_run is None:
+        seed_run = SeedRun(name=SEED_NAME)
+        db.session.add(seed_run)
+    else:
+        seed_run.executed_at = datetime.utcnow()
+    seed_run.content_hash = content_hash
     db.session.commit()
     current_app.logger.info("Seed '%s' completed.", SEED_NAME)
 
 
-def _upsert_author():
+def _author_payload():
     from os import getenv
 
     payload = AUTHOR_SEED.copy()
     payload["public_key"] = getenv("VINICIUS_PUBLIC_KEY", payload["public_key"])
-    payload["birthdate"] = datetime.fromisoformat(payload["birthdate"]).date()
+    return payload
+
+
+def _content_hash(raw_articles: bytes, author_payload: dict) -> str:
+    """SHA-256 of everything the seed writes: the article file plus author and socials."""
+
+    digest = hashlib.sha256(raw_articles)
+    digest.update(json.dumps([author_payload, SOCIALS_SEED], sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _upsert_author(payload: dict):
+    payload = {**payload, "birthdate": datetime.fromisoformat(payload["birthdate"]).date()}
 
     author = Author.query.filter_by(name=payload["name"]).first()
     if author:
@@ -46,20 +72,13 @@ def _upsert_author():
 
 
 def _upsert_socials(author: Author):
-    for social_data in SOCIALS_SEED:
-        social = Social.query.filter_by(slug=social_data["slug"]).first()
-        if social is None:
-            social = Social(author_id=author.id, **social_data)
-            db.session.add(social)
-        else:
-            social.profile_link = social_data["profile_link"]
-            social.description = social_data["description"]
-            social.author_id = author.id
-    db.session.flush()
+    now = datetime.utcnow()
+    rows = [{**social_data, "author_id": author.id, "updated_at": now} for social_data in SOCIALS_SEED]
+    result = bulk_upsert(db.session, Social, rows, key="slug")
+    current_app.logger.info("Seed socials: %d inserted, %d updated.", result.inserted, result.updated)
 
 
-def _upsert_articles(author: Author):
-    payload = _load_article_seed_file()
+def _upsert_articles(author: Author, payload: dict):
     metadata = payload.get("metadata", {})
     generated_at = metadata.get("generated_at")
     generated_ts = (
@@ -68,29 +87,20 @@ def _upsert_articles(author: Author):
         else datetime.utcnow()
     )
 
-    for article_attrs in payload.get("data", []):
-        slug = article_attrs.get("slug")
-        article = Article.query.filter_by(slug=slug).first()
-        attrs = {
+    rows = [
+        {
+            "slug": article_attrs.get("slug"),
             "title": article_attrs.get("title"),
             "published_label": article_attrs.get("published_label"),
             "post_entry": article_attrs.get("post_entry"),
+            # Core inserts skip the model's @validates hook that fills the excerpt
+            "excerpt": build_excerpt(article_attrs.get("post_entry")),
             "tags": article_attrs.get("tags") or [],
             "author_id": author.id,
+            "created_at": generated_ts,
+            "updated_at": generated_ts,
         }
-        if article:
-            for key, value in attrs.items():
-                setattr(article, key, value)
-        else:
-            article = Article(slug=slug, **attrs)
-            db.session.add(article)
-
-        article.created_at = generated_ts
-        article.updated_at = generated_ts
-
-
-def _load_article_seed_file():
-    seed_path = Path(__file__).parent / "article_seed_data.json"
-    with open(seed_path, "r", encoding="utf-8") as handler:
-        return json.load(handler)
-
+        for article_attrs in payload.get("data", [])
+    ]
+    result = bulk_upsert(db.session, Article, rows, key="slug")
+    current_app.logger.info("Seed articles: %d inserted, %d updated.", result.inserted, result.updated)
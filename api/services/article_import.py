@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple
+
+from marshmallow import EXCLUDE, ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import Article, Author
+from models.article import build_excerpt
+from schemas import ArticleSchema
+
+DEFAULT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+AUTHOR_MISSING = "Author must exist"
+SLUG_TAKEN = "Slug has already been taken"
+
+# Lines of GET /articles/export can be imported as-is: dump-only fields are ignored
+_import_schema = ArticleSchema(many=True, unknown=EXCLUDE)
+
+
+class ImportReport:
+    def __init__(self):
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+
+    def fail(self, line: int, messages: Dict[str, List[str]]) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line, "errors": messages})
+
+    def to_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.failed > len(self.errors),
+        }
+
+
+class _Line(NamedTuple):
+    number: int
+    payload: dict
+
+
+def existing_author_ids(session: Session, author_ids: Iterable[int]) -> Set[int]:
+    """The subset of ``author_ids`` that exist, in a single query."""
+
+    ids = set(author_ids)
+    if not ids:
+        return set()
+    return set(session.scalars(select(Author.id).where(Author.id.in_(ids))))
+
+
+def existing_slugs(session: Session, slugs: Iterable[str]) -> Set[str]:
+    values = set(slugs)
+    if not values:
+        return set()
+    return set(session.scalars(select(Article.slug).where(Article.slug.in_(values))))
+
+
+def import_articles_ndjson(
+    session: Session, lines: Iterable[bytes], batch_size: int = DEFAULT_BATCH_SIZE
+) -> ImportReport:
+    """Insert one article per NDJSON line, committing every ``batch_size`` accepted lines.
+
+    Each batch costs one validation pass, one author lookup, one slug lookup and
+    one executemany INSERT. Bad lines are reported with their line number and
+    never stop the import; committed batches stay committed.
+    """
+
+    report = ImportReport()
+    seen_slugs: Set[str] = set()
+    for batch in _batches(_parse_lines(lines, report), batch_size):
+        _import_batch(session, batch, report, seen_slugs)
+    return report
+
+
+def _parse_lines(lines: Iterable[bytes], report: ImportReport) -> Iterator[_Line]:
+    for number, raw in enumerate(lines, start=1):
+        if not raw.strip():
+            continue
+        try:
+            payload = json.loads(raw)
+        except ValueError:
+            report.fail(number, {"_line": ["JSON inválido"]})
+            continue
+        if isinstance(payload, dict) and isinstance(payload.get("article"), dict):
+            payload = payload["article"]
+        if not isinstance(payload, dict):
+            report.fail(number, {"_line": ["Cada linha deve ser um objeto JSON"]})
+            continue
+        yield _Line(number, payload)
+
+
+def _batches(lines: Iterator[_Line], size: int) -> Iterator[List[_Line]]:
+    batch: List[_Line] = []
+    for line in lines:
+        batch.append(line)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _import_batch(session: Session, batch: List[_Line], report: ImportReport, seen_slugs: Set[str]) -> None:
+    try:
+        loaded = _import_schema.load([line.payload for line in batch])
+        invalid: Dict[int, dict] = {}
+    except ValidationError as error:
+        loaded = error.valid_data
+        invalid = error.messages
+
+    candidates: List[Tuple[int, dict]] = []
+    for index, line in enumerate(batch):
+        if index in invalid:
+            report.fail(line.number, invalid[index])
+        else:
+            candidates.append((line.number, loaded[index]))
+
+    authors = existing_author_ids(session, (data["author_id"] for _, data in candidates))
+    taken = existing_slugs(session, (data["slug"] for _, data in candidates))
+
+    rows: List[Tuple[int, dict]] = []
+    for number, data in candidates:
+        if data["author_id"] not in authors:
+            report.fail(number, {"author_id": [AUTHOR_MISSING]})
+        elif data["slug"] in taken or data["slug"] in seen_slugs:
+            report.fail(number, {"slug": [SLUG_TAKEN]})
+        else:
+            seen_slugs.add(data["slug"])
+            rows.append((number, {**data, "excerpt": build_excerpt(data["post_entry"])}))
+
+    if not rows:
+        return
+    try:
+        session.execute(insert(Article), [row for _, row in rows])
+        session.commit()
+        report.imported += len(rows)
+    except IntegrityError:
+        # Lost a race with a concurrent writer: retry row by row to pin the failing lines
+        session.rollback()
+        _insert_one_by_one(session, rows, report)
+
+
+def _insert_one_by_one(session: Session, rows: List[Tuple[int, dict]], report: ImportReport) -> None:
+    for number, row in rows:
+        try:
+            session.execute(insert(Article), [row])
+            session.commit()
+            report.imported += 1
+        except IntegrityError as error:
+            session.rollback()
+            report.fail(number, integrity_error_messages(error))
+
+
+def integrity_error_messages(error: IntegrityError) -> Dict[str, List[str]]:
+    """Field-level messages for a unique/foreign-key violation on ``articles``."""
+
+    detail = str(error.orig).lower()
+    if "slug" in detail:
+        return {"slug": [SLUG_TAKEN]}
+    if "author" in detail or "foreign key" in detail:
+        return {"author_id": [AUTHOR_MISSING]}
+    return {"_line": ["Não foi possível salvar o artigo."]}
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+
+class UpsertResult(NamedTuple):
+    inserted: int
+    updated: int
+
+
+def bulk_upsert(
+    session: Session,
+    model,
+    rows: List[Dict],
+    key: str,
+    update_columns: Optional[Sequence[str]] = None,
+) -> UpsertResult:
+    """Insert or update ``rows`` matched on the unique column ``key`` in a single executemany.
+
+    Existing keys are prefetched with one ``IN`` query (for the counts and for
+    dialects without native upsert). MySQL uses ``ON DUPLICATE KEY UPDATE``, SQLite
+    and PostgreSQL ``ON CONFLICT DO UPDATE``. ``update_columns`` defaults to every
+    column in the rows except ``key``; leave out columns such as ``created_at`` that
+    must keep their original value.
+    """
+
+    if not rows:
+        return UpsertResult(0, 0)
+
+    table = model.__table__
+    keys = {row[key] for row in rows}
+    existing = dict(
+        session.execute(select(table.c[key], table.c.id).where(table.c[key].in_(keys))).all()
+    )
+    columns = list(update_columns) if update_columns is not None else [c for c in rows[0] if c != key]
+
+    dialect = session.get_bind(mapper=model).dialect.name
+    if dialect in ("mysql", "mariadb"):
+        statement = mysql_insert(table)
+        statement = statement.on_duplicate_key_update({c: statement.inserted[c] for c in columns})
+        session.execute(statement, rows)
+    elif dialect in ("sqlite", "postgresql"):
+        statement = (sqlite_insert if dialect == "sqlite" else postgresql_insert)(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c[key]],
+            set_={c: statement.excluded[c] for c in columns},
+        )
+        session.execute(statement, rows)
+    else:
+        new_rows = [row for row in rows if row[key] not in existing]
+        changed_rows = [
+            {"id": existing[row[key]], **{c: row[c] for c in columns}}
+            for row in rows
+            if row[key] in existing
+        ]
+        if new_rows:
+            session.execute(insert(model), new_rows)
+        if changed_rows:
+            session.execute(update(model), changed_rows)
+
+    return UpsertResult(inserted=len(keys - existing.keys()), updated=len(keys & existing.keys()))
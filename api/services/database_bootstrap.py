@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import errno
+import fcntl
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+from flask import current_app
+from flask_migrate import upgrade
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from extensions import db
+from seeds import bootstrap_seed_data
+
+BOOTSTRAP_MODES = ("auto", "skip")
+BOOTSTRAP_COMMAND = "bootstrap-db"
+LOCK_NAME = "python-demo-bootstrap"
+
+
+class BootstrapLockTimeout(RuntimeError):
+    pass
+
+
+def run_database_bootstrap() -> None:
+    """Apply migrations and the seed while holding the cross-process bootstrap lock.
+
+    Every process that gets here waits for the lock and then finds the work done,
+    since both ``upgrade`` and the seed are idempotent.
+    """
+
+    config = current_app.config
+    with bootstrap_lock(db.engine, config["DB_BOOTSTRAP_LOCK_FILE"], config["DB_BOOTSTRAP_LOCK_TIMEOUT_SECONDS"]):
+        started = time.perf_counter()
+        upgrade()
+        bootstrap_seed_data()
+        current_app.logger.info("Database bootstrap finished in %.2fs.", time.perf_counter() - started)
+
+
+def bootstrap_on_startup(config, argv: Optional[Sequence[str]] = None) -> bool:
+    """Whether building the app should run the bootstrap (``DB_BOOTSTRAP=auto``).
+
+    ``flask bootstrap-db`` imports ``app.py``, which builds the app before the
+    command runs; the command does the bootstrap itself, so the import skips it.
+    """
+
+    argv = sys.argv if argv is None else argv
+    return (
+        not config.get("TESTING")
+        and config["DB_BOOTSTRAP"] == "auto"
+        and BOOTSTRAP_COMMAND not in argv[1:]
+    )
+
+
+@contextmanager
+def bootstrap_lock(engine: Engine, lock_file: Union[str, Path], timeout_seconds: float) -> Iterator[None]:
+    """MySQL ``GET_LOCK`` advisory lock, or an ``flock`` on ``lock_file`` for other databases."""
+
+    if engine.dialect.name == "mysql":
+        with _mysql_advisory_lock(engine, timeout_seconds):
+            yield
+    else:
+        with _file_lock(Path(lock_file), timeout_seconds):
+            yield
+
+
+@contextmanager
+def _mysql_advisory_lock(engine: Engine, timeout_seconds: float) -> Iterator[None]:
+    # The lock belongs to this connection, so it is held open for the whole bootstrap
+    with engine.connect() as connection:
+        acquired = connection.execute(
+            text("SELECT GET_LOCK(:name, :timeout)"),
+            {"name": LOCK_NAME, "timeout": int(timeout_seconds)},
+        ).scalar()
+        if acquired != 1:
+            raise BootstrapLockTimeout(f"Could not acquire MySQL lock '{LOCK_NAME}' in {timeout_seconds}s.")
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": LOCK_NAME})
+
+
+@contextmanager
+def _file_lock(path: Path, timeout_seconds: float, poll_seconds: float = 0.05) -> Iterator[None]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = time.monotonic() + timeout_seconds
+    with open(path, "a", encoding="utf-8") as handle:
+        while True:
+            try:
+                fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError as error:
+                if error.errno not in (errno.EAGAIN, errno.EACCES):
+                    raise
+                if time.monotonic() >= deadline:
+                    raise BootstrapLockTimeout(f"Could not lock {path} in {timeout_seconds}s.") from error
+                time.sleep(poll_seconds)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def register_bootstrap_command(app) -> None:
+    @app.cli.command(BOOTSTRAP_COMMAND)
+    def bootstrap_db_command():
+        """Run migrations and seed data once (deploy step before starting gunicorn)."""
+        run_database_bootstrap()
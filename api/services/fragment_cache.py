@@ -0,0 +1,224 @@
+"""Encoded JSON of each article, author and social, reused across responses.
+
+The read model hands the list endpoints the same records request after request;
+encoding them is what is left of the work. :class:`FragmentCache` keeps the
+compact JSON bytes of every rendered entity, keyed by kind, id and the
+``version`` token of every read model record the bytes were built from (the
+nested author, the socials). A record only gets a new token when its values
+change, so a row written by another worker, even within the same second as
+the previous write, simply misses. Collection responses are assembled by
+joining fragments, byte-identical to ``jsonify`` of the same dicts.
+
+Entries are evicted least recently used once their total size passes
+``FRAGMENT_CACHE_MAX_BYTES``. The rows committed by this process, reported by
+the session listeners in ``models.data_version``, also drop the fragments that
+embed them right away, so the outdated bytes do not wait for eviction.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from flask import current_app, request
+
+from models.data_version import RowTag, subscribe_to_commits
+
+# (table, id) of a row a fragment was rendered from; id None stands for the whole table
+Tag = RowTag
+
+
+class FragmentCache:
+    """Thread-safe LRU of encoded JSON fragments bounded by their total size in bytes."""
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        on_event: Optional[Callable[[str, str, int], None]] = None,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self._on_event = on_event
+        self._entries: "OrderedDict[Hashable, Tuple[bytes, Tuple[Tag, ...]]]" = OrderedDict()
+        self._keys_by_tag: Dict[Tag, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+
+    def fragments(
+        self,
+        items: Iterable[Tuple[Hashable, Tuple[Tag, ...], Any]],
+        render: Callable[[Any], Any],
+        name: str = "default",
+    ) -> List[bytes]:
+        """Fragments for ``(key, tags, record)`` items; misses are ``render``-ed and stored.
+
+        Looks up and stores the whole batch under one lock acquisition each.
+        """
+
+        items = list(items)
+        with self._lock:
+            found = [self._get(key) for key, _, _ in items]
+        missing = [index for index, fragment in enumerate(found) if fragment is None]
+        for index in missing:
+            found[index] = encode(render(items[index][2]))
+
+        evicted = 0
+        if missing and self.max_bytes > 0:
+            with self._lock:
+                for index in missing:
+                    key, tags, _ = items[index]
+                    evicted += self._set(key, found[index], tags)
+        self._emit("hit", name, len(items) - len(missing))
+        self._emit("miss", name, len(missing))
+        self._emit("eviction", name, evicted)
+        return found
+
+    def invalidate(self, tags: Iterable[Tag]) -> int:
+        with self._lock:
+            keys: Set[Hashable] = set()
+            for table, row_id in set(tags):
+                if row_id is None:
+                    for tag, tagged in self._keys_by_tag.items():
+                        if tag[0] == table:
+                            keys.update(tagged)
+                else:
+                    keys.update(self._keys_by_tag.get((table, row_id), ()))
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_tag.clear()
+            self.size_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: Hashable) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _set(self, key: Hashable, fragment: bytes, tags: Tuple[Tag, ...]) -> int:
+        if len(fragment) > self.max_bytes:
+            return 0
+        self._remove(key)
+        self._entries[key] = (fragment, tags)
+        self.size_bytes += len(fragment)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+        evicted = 0
+        while self.size_bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            evicted += 1
+        return evicted
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        fragment, tags = entry
+        self.size_bytes -= len(fragment)
+        for tag in tags:
+            tagged = self._keys_by_tag.get(tag)
+            if tagged is not None:
+                tagged.discard(key)
+                if not tagged:
+                    del self._keys_by_tag[tag]
+
+    def _emit(self, outcome: str, name: str, amount: int) -> None:
+        if amount and self._on_event is not None:
+            self._on_event(outcome, name, amount)
+
+
+def encode(obj) -> bytes:
+    """The bytes ``jsonify(obj)`` would produce, minus the trailing newline."""
+
+    return current_app.json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_list(fragments: List[bytes]) -> bytes:
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def json_page(fragments: List[bytes], next_cursor: Optional[str]) -> bytes:
+    """``{"data": [...], "next_cursor": ...}`` of the paginated list endpoints."""
+
+    return b'{"data":' + json_list(fragments) + b',"next_cursor":' + encode(next_cursor) + b"}"
+
+
+def prepend_members(fragment: bytes, members: Dict[str, bytes]) -> bytes:
+    """Add already encoded ``members`` at the start of an encoded object.
+
+    With the provider's ``sort_keys`` the result matches ``jsonify`` as long as
+    the new keys sort before the fragment's.
+    """
+
+    head = b",".join(encode(name) + b":" + value for name, value in members.items())
+    return b"{" + head + (b"," + fragment[1:] if fragment != b"{}" else b"}")
+
+
+def article_fragments(catalog, records, summary: bool = False, author: bool = True) -> List[bytes]:
+    """``catalog.article_dict`` of every record, encoded once per version of the article."""
+
+    kind = "article" + ("_summary" if summary else "") + ("" if author else "_embedded")
+
+    def item(record):
+        tags: Tuple[Tag, ...] = (("articles", record.id),)
+        key: Tuple = (kind, record.id, record.version)
+        if author:
+            # The nested author's name is part of the bytes
+            related = catalog.author(record.author_id)
+            tags += (("authors", record.author_id),)
+            key += (related.version if related is not None else None,)
+        return key, tags, record
+
+    return _fragment_cache().fragments(
+        map(item, records),
+        lambda record: catalog.article_dict(record, summary, author=author),
+        name=request.endpoint,
+    )
+
+
+def author_fragments(catalog, records) -> List[bytes]:
+    """``catalog.author_dict`` (socials included) of every record."""
+
+    def item(record):
+        socials = catalog.socials_of(record.id)
+        key = ("author", record.id, record.version, tuple(social.version for social in socials))
+        tags = (("authors", record.id), *(("socials", social.id) for social in socials))
+        return key, tags, record
+
+    return _fragment_cache().fragments(
+        map(item, records), catalog.author_dict, name=request.endpoint
+    )
+
+
+def _fragment_cache() -> FragmentCache:
+    return current_app.extensions["fragment_cache"]
+
+
+_caches: "weakref.WeakSet[FragmentCache]" = weakref.WeakSet()
+
+
+def _invalidate_committed_rows(rows: Set[Tag]) -> None:
+    for cache in _caches:
+        cache.invalidate(rows)
+
+
+def init_fragment_cache(app, metrics=None) -> FragmentCache:
+    def record_event(outcome: str, name: str, amount: int) -> None:
+        if metrics is not None:
+            metrics.record_cache_event("fragment", name, outcome, amount)
+
+    cache = FragmentCache(max_bytes=app.config.get("FRAGMENT_CACHE_MAX_BYTES", 0), on_event=record_event)
+    _caches.add(cache)
+    subscribe_to_commits(_invalidate_committed_rows)
+    app.extensions["fragment_cache"] = cache
+    return cache
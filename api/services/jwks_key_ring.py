@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from jose import jwk
+from jose.backends.base import Key
+
+logger = logging.getLogger(__name__)
+
+
+class JwksKeyRing:
+    """Signing keys of a JWKS endpoint, indexed by ``kid`` as ready-to-use key objects.
+
+    * Keys are constructed once per fetch instead of once per token.
+    * Concurrent refreshes collapse into a single HTTP call (single flight).
+    * Once ``refresh_ahead_ratio`` of the TTL has elapsed, a daemon thread
+      refreshes the ring while callers keep using the current keys; callers
+      only block when the ring is empty or fully expired.
+    * An unknown ``kid`` (key rotation) triggers a refetch at most once every
+      ``unknown_kid_min_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        fetch_jwks: Callable[[], Dict[str, Any]],
+        ttl_seconds: float = 300,
+        refresh_ahead_ratio: float = 0.8,
+        unknown_kid_min_interval: float = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch_jwks = fetch_jwks
+        self._ttl = ttl_seconds
+        self._refresh_ahead_ratio = refresh_ahead_ratio
+        self._unknown_kid_min_interval = unknown_kid_min_interval
+        self._clock = clock
+
+        self._keys: Dict[str, Key] = {}
+        self._fetched_at: Optional[float] = None
+        self._generation = 0
+        self._last_unknown_kid_refresh: Optional[float] = None
+        self._refresh_lock = threading.Lock()
+        self._background_refresh: Optional[threading.Thread] = None
+
+    def get(self, kid: Optional[str]) -> Optional[Key]:
+        if not kid:
+            return None
+
+        now = self._clock()
+        loaded = False
+        if self._fetched_at is None or now >= self._fetched_at + self._ttl:
+            self._refresh(self._generation)
+            loaded = True
+        elif now >= self._fetched_at + self._ttl * self._refresh_ahead_ratio:
+            self._refresh_in_background()
+
+        key = self._keys.get(kid)
+        # A load made by this very call already is the refetch for an unknown kid
+        if key is None and self._may_refetch_unknown_kid(already_fetched=loaded):
+            self._refresh(self._generation)
+            key = self._keys.get(kid)
+        return key
+
+    def _may_refetch_unknown_kid(self, already_fetched: bool = False) -> bool:
+        with self._refresh_lock:
+            now = self._clock()
+            if already_fetched:
+                self._last_unknown_kid_refresh = now
+                return False
+            last = self._last_unknown_kid_refresh
+            if last is not None and now - last < self._unknown_kid_min_interval:
+                return False
+            self._last_unknown_kid_refresh = now
+            return True
+
+    def _refresh(self, seen_generation: int) -> None:
+        with self._refresh_lock:
+            # Another thread refreshed while we were waiting for the lock
+            if self._generation != seen_generation:
+                return
+            self._load(self._fetch_jwks())
+
+    def _refresh_in_background(self) -> None:
+        with self._refresh_lock:
+            if self._background_refresh is not None and self._background_refresh.is_alive():
+                return
+            self._background_refresh = threading.Thread(
+                target=self._background_refresh_target,
+                args=(self._generation,),
+                name="jwks-refresh",
+                daemon=True,
+            )
+            self._background_refresh.start()
+
+    def _background_refresh_target(self, seen_generation: int) -> None:
+        try:
+            self._refresh(seen_generation)
+        except Exception:  # pragma: no cover - keep serving current keys until they expire
+            logger.warning("Background JWKS refresh failed.", exc_info=True)
+
+    def _load(self, jwks: Dict[str, Any]) -> None:
+        keys: Dict[str, Key] = {}
+        for jwk_data in jwks.get("keys", []):
+            kid = jwk_data.get("kid")
+            if not kid or jwk_data.get("use", "sig") != "sig":
+                continue
+            try:
+                keys[kid] = jwk.construct(jwk_data, jwk_data.get("alg", "RS256"))
+            except Exception:
+                logger.warning("Skipping unsupported JWK %s.", kid, exc_info=True)
+        self._keys = keys
+        self._fetched_at = self._clock()
+        self._generation += 1
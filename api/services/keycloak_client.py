@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import copy
+import hashlib
+import threading
 import time
-from typing import Any, Dict, Iterable, List, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
 from flask import current_app
 from jose import jwt
 
+from .jwks_key_ring import JwksKeyRing
+
 
 class KeycloakError(RuntimeError):
     """Raised when an interaction with Keycloak fails."""
@@ -24,6 +30,7 @@ class KeycloakClient:
         *,
         session: Optional[requests.Session] = None,
         cache_ttl_seconds: int = 300,
+        claims_cache_size: int = 1024,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.realm = realm
@@ -33,8 +40,11 @@ class KeycloakClient:
         self._cache_ttl = cache_ttl_seconds
         self._well_known: Optional[Dict[str, Any]] = None
         self._well_known_expires_at: float = 0
-        self._jwks: Optional[Dict[str, Any]] = None
-        self._jwks_expires_at: float = 0
+        self._well_known_lock = threading.Lock()
+        self._key_ring = JwksKeyRing(self._fetch_jwks, ttl_seconds=cache_ttl_seconds)
+        self._claims_cache_size = claims_cache_size
+        self._claims_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._claims_lock = threading.Lock()
 
     def exchange_password(self, username: str, password: str) -> Dict[str, Any]:
         """Request access/refresh tokens using the Resource Owner Password grant."""
@@ -65,26 +75,39 @@ class KeycloakClient:
         return response.json()
 
     def decode_token(self, token: str) -> Dict[str, Any]:
-        """Validate and decode a JWT access token."""
+        """Validate and decode a JWT access token.
+
+        Verified claims are kept in a bounded LRU keyed by the token digest until the
+        token's ``exp``, so repeated calls with the same bearer token skip the
+        RS256 signature verification.
+        """
+        digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        cached = self._cached_claims(digest)
+        if cached is not None:
+            return cached
+
         try:
             header = jwt.get_unverified_header(token)
         except Exception as exc:  # pragma: no cover - jose raises many subclasses
             raise KeycloakError("Invalid token header.") from exc
 
-        jwk = self._select_key(header.get("kid"))
-        if not jwk:
+        key = self._key_ring.get(header.get("kid"))
+        if key is None:
             raise KeycloakError("Unable to resolve signing key for token.")
 
         try:
-            return jwt.decode(
+            claims = jwt.decode(
                 token,
-                jwk,
+                key,
                 algorithms=[header.get("alg", "RS256")],
                 options={"verify_aud": False},
             )
         except Exception as exc:  # pragma: no cover
             raise KeycloakError("Token validation failed.") from exc
 
+        self._cache_claims(digest, claims)
+        return claims
+
     def extract_roles(self, claims: Dict[str, Any]) -> List[str]:
         realm_access = claims.get("realm_access") or {}
         roles = realm_access.get("roles") or []
@@ -98,24 +121,49 @@ class KeycloakClient:
             raise KeycloakError(f"Missing required role(s): {', '.join(missing)}")
         return claims
 
+    def _cached_claims(self, digest: str) -> Optional[Dict[str, Any]]:
+        with self._claims_lock:
+            entry = self._claims_cache.get(digest)
+            if entry is None:
+                return None
+            expires_at, claims = entry
+            if time.time() >= expires_at:
+                del self._claims_cache[digest]
+                return None
+            self._claims_cache.move_to_end(digest)
+        # Callers may mutate the result; never hand out the cached object itself
+        return copy.deepcopy(claims)
+
+    def _cache_claims(self, digest: str, claims: Dict[str, Any]) -> None:
+        expires_at = claims.get("exp")
+        if self._claims_cache_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        with self._claims_lock:
+            self._claims_cache[digest] = (float(expires_at), copy.deepcopy(claims))
+            self._claims_cache.move_to_end(digest)
+            while len(self._claims_cache) > self._claims_cache_size:
+                self._claims_cache.popitem(last=False)
+
     def _get_well_known(self) -> Dict[str, Any]:
         if self._well_known and time.time() < self._well_known_expires_at:
             return self._well_known
 
-        url = f"{self.base_url}/realms/{self.realm}/.well-known/openid-configuration"
-        response = self._session.get(url, timeout=10)
-        if not response.ok:
-            detail = self._extract_error(response)
-            raise KeycloakError(f"Unable to fetch OpenID metadata: {detail}")
+        with self._well_known_lock:
+            # Threads queued behind the lock reuse the metadata the first one fetched
+            if self._well_known and time.time() < self._well_known_expires_at:
+                return self._well_known
 
-        self._well_known = response.json()
-        self._well_known_expires_at = time.time() + self._cache_ttl
-        return self._well_known
+            url = f"{self.base_url}/realms/{self.realm}/.well-known/openid-configuration"
+            response = self._session.get(url, timeout=10)
+            if not response.ok:
+                detail = self._extract_error(response)
+                raise KeycloakError(f"Unable to fetch OpenID metadata: {detail}")
 
-    def _get_jwks(self) -> Dict[str, Any]:
-        if self._jwks and time.time() < self._jwks_expires_at:
-            return self._jwks
+            self._well_known = response.json()
+            self._well_known_expires_at = time.time() + self._cache_ttl
+            return self._well_known
 
+    def _fetch_jwks(self) -> Dict[str, Any]:
         metadata = self._get_well_known()
         jwks_uri = metadata.get("jwks_uri")
         if not jwks_uri:
@@ -125,19 +173,7 @@ class KeycloakClient:
         if not response.ok:
             detail = self._extract_error(response)
             raise KeycloakError(f"Unable to fetch JWKS: {detail}")
-
-        self._jwks = response.json()
-        self._jwks_expires_at = time.time() + self._cache_ttl
-        return self._jwks
-
-    def _select_key(self, kid: Optional[str]) -> Optional[Dict[str, Any]]:
-        if not kid:
-            return None
-        keys = self._get_jwks().get("keys", [])
-        for jwk in keys:
-            if jwk.get("kid") == kid:
-                return jwk
-        return None
+        return response.json()
 
     @staticmethod
     def _extract_error(response: requests.Response) -> str:
@@ -156,6 +192,7 @@ class KeycloakClient:
             config.get("KEYCLOAK_REALM", "python-demo"),
             config.get("KEYCLOAK_CLIENT_ID", "python-demo-api"),
             config.get("KEYCLOAK_CLIENT_SECRET"),
+            claims_cache_size=config.get("KEYCLOAK_CLAIMS_CACHE_SIZE", 1024),
         )
 
 
@@ -0,0 +1,409 @@
+"""Per-worker in-memory snapshot of articles, authors and socials for the read endpoints.
+
+The catalog changes a few times a day and is read constantly, so every worker
+keeps it in memory as ``__slots__`` records (tags and published labels are
+interned) with the orderings the endpoints need already built. Before serving,
+the view checks the table versions (the ``data_versions`` counters every write
+bumps, also read by ``conditional_get``, so usually no extra query) and
+refreshes only the tables that moved. ``updated_at`` cannot tell which rows
+changed (whole-second ``DATETIME`` on MySQL, seed upserts stamping the file's
+date), so a refresh reads the ``data_changes`` log the same writes fill and
+selects just those rows, in one query. The table is re-read whole only when the
+log cannot say (a Core ``INSERT``/``DELETE``, a cascade, or a snapshot older
+than the log's retention), keeping the record objects of the rows whose values
+are unchanged; each record carries a ``version`` token that only changes with
+its values.
+
+Snapshots are immutable: a refresh builds a new :class:`Catalog` and swaps it
+in, so readers never lock. Writes made by another worker are picked up by the
+next request that checks the versions.
+"""
+
+from __future__ import annotations
+
+import itertools
+import sys
+import threading
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import select
+
+from extensions import db
+from models import Article, Author, DataChange, Social
+from services.table_version import TableVersion, current_table_versions
+
+Position = Tuple[datetime, int]
+
+# Worker-wide source of record versions: a new number for every row state loaded
+_record_versions = itertools.count(1)
+
+
+class _Record:
+    # Subclasses list the selected columns in their own __slots__
+    __slots__ = ("version",)
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+        self.version = next(_record_versions)
+
+    def values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    @classmethod
+    def from_row(cls, row):
+        return cls(*row)
+
+
+class ArticleRecord(_Record):
+    __slots__ = (
+        "id",
+        "title",
+        "slug",
+        "published_label",
+        "post_entry",
+        "excerpt",
+        "tags",
+        "author_id",
+        "created_at",
+        "updated_at",
+    )
+
+    @classmethod
+    def from_row(cls, row):
+        record = cls(*row)
+        # A handful of distinct tags and labels repeat across thousands of articles
+        record.published_label = sys.intern(record.published_label)
+        record.tags = tuple(sys.intern(tag) for tag in record.tags or ())
+        return record
+
+
+class AuthorRecord(_Record):
+    __slots__ = ("id", "name", "birthdate", "photo_url", "public_key", "bio", "created_at", "updated_at")
+
+
+class SocialRecord(_Record):
+    __slots__ = ("id", "profile_link", "slug", "description", "author_id", "created_at", "updated_at")
+
+
+class _ArticleTable:
+    """Articles by id plus ``(created_at, id)`` orderings, overall and per author."""
+
+    __slots__ = ("records", "keys", "ordered", "by_author")
+
+    def __init__(self, records: Dict[int, ArticleRecord]):
+        self.records = records
+        self.ordered = sorted(records.values(), key=_position)
+        self.keys = [_position(record) for record in self.ordered]
+        grouped: Dict[int, List[ArticleRecord]] = {}
+        for record in self.ordered:
+            grouped.setdefault(record.author_id, []).append(record)
+        self.by_author = {
+            author_id: ([_position(record) for record in group], group)
+            for author_id, group in grouped.items()
+        }
+
+
+class _AuthorTable:
+    """Authors by id, in ``ORDER BY name`` order.
+
+    The order comes from the database: MySQL's collation compares names case-
+    and accent-insensitively, which sorting the strings in Python would not.
+    """
+
+    __slots__ = ("records", "by_name")
+
+    order_by = (Author.name, Author.id)
+
+    def __init__(self, records: Dict[int, AuthorRecord]):
+        self.records = records
+        self.by_name = list(records.values())
+
+
+class _SocialTable:
+    __slots__ = ("records", "by_author")
+
+    def __init__(self, records: Dict[int, SocialRecord]):
+        self.records = records
+        self.by_author: Dict[int, List[SocialRecord]] = {}
+        for record in sorted(records.values(), key=lambda record: record.id):
+            self.by_author.setdefault(record.author_id, []).append(record)
+
+
+# table name -> (model, record class, index class)
+TABLES = {
+    Article.__tablename__: (Article, ArticleRecord, _ArticleTable),
+    Author.__tablename__: (Author, AuthorRecord, _AuthorTable),
+    Social.__tablename__: (Social, SocialRecord, _SocialTable),
+}
+
+
+class Catalog:
+    """One immutable snapshot; dicts it returns match the marshmallow schemas' ``dump``."""
+
+    __slots__ = ("versions", "_tables", "_memory_bytes")
+
+    def __init__(self, versions: Dict[str, TableVersion], tables: Dict[str, object]):
+        self.versions = versions
+        self._tables = tables
+        self._memory_bytes: Optional[int] = None
+
+    @classmethod
+    def empty(cls) -> "Catalog":
+        return cls({}, {name: index({}) for name, (_, _, index) in TABLES.items()})
+
+    def records(self, table: str) -> Dict[int, _Record]:
+        return self._tables[table].records
+
+    def article(self, article_id: int) -> Optional[ArticleRecord]:
+        return self._tables[Article.__tablename__].records.get(article_id)
+
+    def author(self, author_id: int) -> Optional[AuthorRecord]:
+        return self._tables[Author.__tablename__].records.get(author_id)
+
+    def authors_by_name(self) -> List[AuthorRecord]:
+        return self._tables[Author.__tablename__].by_name
+
+    def socials_of(self, author_id: int) -> List[SocialRecord]:
+        return self._tables[Social.__tablename__].by_author.get(author_id, [])
+
+    def count_articles(self, author_id: Optional[int] = None) -> int:
+        table = self._tables[Article.__tablename__]
+        if author_id is None:
+            return len(table.keys)
+        return len(table.by_author.get(author_id, ((), ()))[0])
+
+    def articles_before(
+        self, position: Optional[Position], count: int, author_id: Optional[int] = None
+    ) -> List[ArticleRecord]:
+        """Up to ``count`` articles newest first, strictly older than ``position``.
+
+        The in-memory counterpart of ``keyset_window``: a bisect instead of an index seek.
+        """
+
+        table = self._tables[Article.__tablename__]
+        if author_id is None:
+            keys, ordered = table.keys, table.ordered
+        else:
+            keys, ordered = table.by_author.get(author_id, ((), ()))
+        end = len(keys) if position is None else bisect_left(keys, position)
+        return ordered[max(end - count, 0):end][::-1]
+
+    def article_dict(self, record: ArticleRecord, summary: bool = False, author: bool = True) -> dict:
+        """``ArticleSchema`` dump, or ``ArticleSummarySchema`` with ``summary``.
+
+        ``author=False`` mirrors ``exclude=("author",)``, the form embedded under an author.
+        """
+
+        data = {
+            "id": record.id,
+            "title": record.title,
+            "slug": record.slug,
+            "published_label": record.published_label,
+            "tags": list(record.tags),
+            "author_id": record.author_id,
+            "created_at": _isoformat(record.created_at),
+            "updated_at": _isoformat(record.updated_at),
+        }
+        if summary:
+            data["excerpt"] = record.excerpt
+        else:
+            data["post_entry"] = record.post_entry
+        if author:
+            related = self.author(record.author_id)
+            data["author"] = None if related is None else {"id": related.id, "name": related.name}
+        return data
+
+    def author_dict(self, record: AuthorRecord) -> dict:
+        """``AuthorSchema(exclude=("articles",))``."""
+
+        socials = self.socials_of(record.id)
+        return {
+            "id": record.id,
+            "name": record.name,
+            "birthdate": _isoformat(record.birthdate),
+            "photo_url": record.photo_url,
+            "public_key": record.public_key,
+            "bio": record.bio,
+            "socials": [_social_dict(social) for social in socials],
+            "created_at": _isoformat(record.created_at),
+            "updated_at": _isoformat(record.updated_at),
+        }
+
+    def memory_bytes(self) -> int:
+        """Approximate size of everything the snapshot holds, shared objects counted once."""
+
+        if self._memory_bytes is None:
+            self._memory_bytes = _deep_size(self._tables)
+        return self._memory_bytes
+
+    def refreshed(self, versions: Dict[str, TableVersion], records: Dict[str, dict]) -> "Catalog":
+        tables = dict(self._tables)
+        for name, table_records in records.items():
+            tables[name] = TABLES[name][2](table_records)
+        return Catalog({**self.versions, **versions}, tables)
+
+
+class ReadModel:
+    """Holds the worker's current :class:`Catalog` and refreshes it on version changes."""
+
+    def __init__(self):
+        self._catalog = Catalog.empty()
+        self._lock = threading.Lock()
+        self.refreshes: Counter = Counter()
+
+    def catalog(self, *models) -> Catalog:
+        """The snapshot, brought up to date for ``models`` (other tables may lag)."""
+
+        versions = current_table_versions(*models)
+        catalog = self._catalog
+        if all(catalog.versions.get(table) == version for table, version in versions.items()):
+            return catalog
+
+        with self._lock:
+            catalog = self._catalog
+            stale = {
+                table: version
+                for table, version in versions.items()
+                if catalog.versions.get(table) != version
+            }
+            if stale:
+                records = {
+                    table: self._load(table, catalog.records(table), catalog.versions.get(table), version)
+                    for table, version in stale.items()
+                }
+                catalog = self._catalog = catalog.refreshed(stale, records)
+        return catalog
+
+    def current(self) -> Catalog:
+        """The snapshot as it is, without a version check (for metrics)."""
+
+        return self._catalog
+
+    def clear(self) -> None:
+        with self._lock:
+            self._catalog = Catalog.empty()
+
+    def _load(
+        self, table: str, current: dict, loaded: Optional[TableVersion], target: TableVersion
+    ) -> dict:
+        if current and loaded is not None:
+            records = self._load_changes(table, current, loaded.version, target.version)
+            if records is not None:
+                self.refreshes[(table, "changes")] += 1
+                return records
+        self.refreshes[(table, "refresh" if current else "full")] += 1
+        return self._load_table(table, current)
+
+    def _load_table(self, table: str, current: dict) -> dict:
+        model, record_class, index = TABLES[table]
+        columns = [getattr(model, name) for name in record_class.__slots__]
+        statement = select(*columns).order_by(*getattr(index, "order_by", ()))
+
+        records = {}
+        for row in db.session.execute(statement):
+            records[row.id] = _reuse(record_class.from_row(row), current)
+        return records
+
+    def _load_changes(self, table: str, current: dict, since: int, until: int) -> Optional[dict]:
+        """``current`` plus the rows logged between the two versions, or ``None`` to re-read it all.
+
+        One query: the log joined to the rows it names, a deleted row coming
+        back with ``NULL`` columns.
+        """
+
+        model, record_class, index = TABLES[table]
+        columns = [getattr(model, name) for name in record_class.__slots__]
+        statement = (
+            select(DataChange.version, DataChange.row_id, *columns)
+            .select_from(DataChange)
+            .outerjoin(model, model.id == DataChange.row_id)
+            .where(
+                DataChange.table_name == table,
+                DataChange.version > since,
+                DataChange.version <= until,
+            )
+        )
+        rows = db.session.execute(statement).all()
+        # Every bump logs at least one row, so a missing version was pruned
+        if {row[0] for row in rows} != set(range(since + 1, until + 1)):
+            return None
+        if any(row[1] is None for row in rows):
+            return None
+
+        records = dict(current)
+        for row in rows:
+            if row[2] is None:
+                records.pop(row[1], None)
+            else:
+                records[row[1]] = _reuse(record_class.from_row(row[2:]), current)
+        order_by = getattr(index, "order_by", None)
+        if order_by:
+            ordered = db.session.scalars(select(model.id).order_by(*order_by))
+            records = {record_id: records[record_id] for record_id in ordered}
+        return records
+
+
+def current_catalog(*models) -> Optional[Catalog]:
+    """The app's read model refreshed for ``models``; ``None`` when ``READ_MODEL_ENABLED`` is off."""
+
+    if not current_app.config["READ_MODEL_ENABLED"]:
+        return None
+    return current_app.extensions["read_model"].catalog(*models)
+
+
+def init_read_model(app) -> ReadModel:
+    read_model = ReadModel()
+    app.extensions["read_model"] = read_model
+    return read_model
+
+
+def _reuse(record: _Record, current: dict) -> _Record:
+    # Unchanged rows keep their record, and with it its version
+    previous = current.get(record.id)
+    if previous is not None and previous.values() == record.values():
+        return previous
+    return record
+
+
+def _position(record: ArticleRecord) -> Position:
+    return (record.created_at, record.id)
+
+
+def _isoformat(value):
+    return None if value is None else value.isoformat()
+
+
+def _social_dict(record: SocialRecord) -> dict:
+    return {
+        "id": record.id,
+        "profile_link": record.profile_link,
+        "slug": record.slug,
+        "description": record.description,
+        "created_at": _isoformat(record.created_at),
+        "updated_at": _isoformat(record.updated_at),
+    }
+
+
+def _deep_size(root) -> int:
+    seen = set()
+    total = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif hasattr(obj, "__slots__"):
+            stack.extend(getattr(obj, name) for name in obj.__slots__ if hasattr(obj, name))
+    return total
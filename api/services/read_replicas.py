@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import itertools
+import threading
+from functools import wraps
+from typing import Dict, List, Optional
+
+from flask import current_app, g, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+
+REPLICA_NAME_PREFIX = "replica_"
+
+_round_robin = itertools.count()
+_round_robin_lock = threading.Lock()
+
+
+def init_read_replicas(app) -> Dict[str, Engine]:
+    """Create one engine per ``DATABASE_REPLICA_URLS`` entry (``replica_0``, ``replica_1``...).
+
+    Replicas are not Flask-SQLAlchemy binds: binds split tables across databases,
+    while every replica serves the whole schema.
+    """
+
+    options = app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {})
+    engines = {
+        f"{REPLICA_NAME_PREFIX}{index}": create_engine(url, **options)
+        for index, url in enumerate(app.config.get("DATABASE_REPLICA_URLS", []))
+    }
+    app.extensions["read_replicas"] = engines
+    return engines
+
+
+def use_read_replica(view):
+    """Let the ORM run this view's SELECTs on a read replica.
+
+    Must sit above decorators that query (``conditional_get``, ``cached_result``)
+    so their lookups are routed too. Without replicas configured it is a no-op.
+    """
+
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_read_replica = True
+        try:
+            return view(*args, **kwargs)
+        finally:
+            for key in ("db_read_replica", "db_wrote_primary", "db_replica_key"):
+                g.pop(key, None)
+
+    return wrapper
+
+
+class RoutingSession(Session):
+    """Sends SELECTs of ``use_read_replica`` views to one replica per request.
+
+    Everything else uses the primary: flushes and DML, requests without the
+    decorator and, for read-your-writes, every statement after this request
+    flushed or committed anything.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if has_request_context() and clause is not None and not getattr(clause, "is_select", False):
+            # Core DML (or raw SQL) ran on the primary: later reads must see it
+            g.db_wrote_primary = True
+        if bind is None and self._reads_from_replica(clause):
+            replica = self._request_replica()
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _reads_from_replica(self, clause) -> bool:
+        if not has_request_context() or not g.get("db_read_replica") or g.get("db_wrote_primary"):
+            return False
+        if self._flushing or self.new or self.dirty or self.deleted:
+            return False
+        return bool(getattr(clause, "is_select", False))
+
+    def _request_replica(self) -> Optional[Engine]:
+        engines: Dict[str, Engine] = current_app.extensions.get("read_replicas", {})
+        if not engines:
+            return None
+        # Stick to one replica per request so every read sees the same replication lag
+        key: Optional[str] = g.get("db_replica_key")
+        if key not in engines:
+            names: List[str] = sorted(engines)
+            with _round_robin_lock:
+                key = names[next(_round_robin) % len(names)]
+            g.db_replica_key = key
+        return engines[key]
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_request_to_primary(session, flush_context):
+    if has_request_context():
+        g.db_wrote_primary = True
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, FrozenSet, Iterable, Optional, Set, Tuple
+
+from flask import current_app, make_response, request
+
+from models.data_version import RowTag, subscribe_to_commits
+from services.table_version import current_table_versions
+
+CacheKey = Tuple[Any, ...]
+
+
+class ResultCache:
+    """Thread-safe LRU cache with per-entry TTL and table-based invalidation.
+
+    Every entry remembers the tables it was computed from, so a commit touching
+    ``articles`` drops only the entries that read ``articles``. The cache lives
+    per process and only sees this process's commits; :func:`cached_result`
+    keys entries by the tables' ``data_versions`` so writes handled by another
+    gunicorn worker are picked up too.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 30.0,
+        on_event: Optional[Callable[[str, str], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._on_event = on_event
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, FrozenSet[str], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: CacheKey, name: str = "default") -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        self._emit("hit" if entry is not None else "miss", name)
+        return entry[2] if entry is not None else None
+
+    def set(self, key: CacheKey, value: Any, tables: Iterable[str], name: str = "default") -> None:
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_seconds, frozenset(tables), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        for _ in range(evicted):
+            self._emit("eviction", name)
+
+    def invalidate_tables(self, tables: Iterable[str]) -> int:
+        tables = set(tables)
+        if not tables:
+            return 0
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[1] & tables]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _emit(self, outcome: str, name: str) -> None:
+        if self._on_event is not None:
+            self._on_event(outcome, name)
+
+
+_caches: "weakref.WeakSet[ResultCache]" = weakref.WeakSet()
+
+
+def _invalidate_committed_rows(rows: Set[RowTag]) -> None:
+    tables = {table for table, _ in rows}
+    for cache in _caches:
+        cache.invalidate_tables(tables)
+
+
+def cached_result(*models):
+    """Cache successful JSON responses keyed by endpoint, view args and query string.
+
+    The key also holds the ``data_versions`` of ``models`` (the ones
+    ``conditional_get`` already read, when it wraps the view), so a write from
+    any worker moves the request to a fresh entry instead of serving the old
+    body under the new ``ETag``.
+    """
+
+    tables = tuple(model.__tablename__ for model in models)
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            cache: Optional[ResultCache] = current_app.extensions.get("result_cache")
+            if cache is None:
+                return view(*args, **kwargs)
+
+            key = (
+                request.endpoint,
+                tuple(sorted(kwargs.items())),
+                tuple(sorted(request.args.items(multi=True))),
+                tuple((version.table, version.version) for version in current_table_versions(*models).values()),
+            )
+            cached = cache.get(key, name=request.endpoint)
+            if cached is not None:
+                body, status, mimetype = cached
+                return current_app.response_class(body, status=status, mimetype=mimetype)
+
+            response = make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                cache.set(
+                    key,
+                    (response.get_data(), response.status_code, response.mimetype),
+                    tables,
+                    name=request.endpoint,
+                )
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def init_result_cache(app, metrics=None) -> None:
+    def record_event(outcome: str, name: str) -> None:
+        if metrics is not None:
+            metrics.record_cache_event("result", name, outcome)
+
+    cache = ResultCache(
+        max_entries=app.config.get("RESULT_CACHE_MAX_ENTRIES", 256),
+        ttl_seconds=app.config.get("RESULT_CACHE_TTL_SECONDS", 30),
+        on_event=record_event,
+    )
+    _caches.add(cache)
+    subscribe_to_commits(_invalidate_committed_rows)
+    app.extensions["result_cache"] = cache
@@ -0,0 +1,50 @@
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from flask import g, has_request_context
+from sqlalchemy import select
+
+from extensions import db
+from models import DataVersion
+
+# g key under which conditional_get shares the versions it read with the view
+REQUEST_VERSIONS_KEY = "table_versions"
+
+
+class TableVersion(NamedTuple):
+    table: str
+    version: int
+    changed_at: Optional[datetime]
+
+
+def fetch_table_versions(*models) -> Tuple[TableVersion, ...]:
+    """Read the ``data_versions`` row of every model in a single primary-key lookup.
+
+    The version is incremented in the same transaction as every write to the
+    table (see ``models.data_version``), which makes it a fingerprint of the
+    table contents that works across processes, even for edits made within
+    the same second. A table without its row reads as version 0.
+    """
+
+    names = [model.__tablename__ for model in models]
+    rows = db.session.execute(
+        select(DataVersion.table_name, DataVersion.version, DataVersion.changed_at).where(
+            DataVersion.table_name.in_(names)
+        )
+    ).all()
+    found = {name: (int(version), changed_at) for name, version, changed_at in rows}
+    return tuple(TableVersion(name, *found.get(name, (0, None))) for name in names)
+
+
+def current_table_versions(*models) -> Dict[str, TableVersion]:
+    """``fetch_table_versions`` by table name, reusing what this request already read.
+
+    ``conditional_get`` leaves its versions in ``g`` while the view runs, so a view
+    that needs them again (the read model's staleness check) costs no extra query.
+    """
+
+    known = g.get(REQUEST_VERSIONS_KEY, {}) if has_request_context() else {}
+    missing = [model for model in models if model.__tablename__ not in known]
+    if missing:
+        known = {**known, **{version.table: version for version in fetch_table_versions(*missing)}}
+    return {model.__tablename__: known[model.__tablename__] for model in models}
@@ -1,19 +1,27 @@
 import os
 import platform
 import socket
+import threading
 from datetime import datetime, timezone
 from html import escape
 from importlib.metadata import distributions
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Any, Callable, Dict, Iterable
 
 import flask
 from flask import current_app
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import ArgumentError
 
 from extensions import db
+from observability.runtime import current_rss_bytes
 
 SENSITIVE_ENV_PATTERN = ("SECRET", "PASSWORD", "TOKEN", "KEY", "PWD", "PASS")
 
+# Sections that cannot change while the process is alive are built once and reused
+_static_cache: Dict[str, Any] = {}
+_static_lock = threading.Lock()
+
 
 class TechReport:
     def __init__(self, env=None):
@@ -22,12 +30,12 @@ class TechReport:
     def render(self) -> str:
         sections = [
             self._section_table("Host", self._host_info()),
-            self._section_table("Runtime & Flask", self._runtime_info()),
+            self._static("runtime_html", lambda: self._section_table("Runtime & Flask", self._runtime_info())),
             self._section_table("Banco de Dados", self._database_info()),
-            self._section_table("Configuração da Aplicação", self._config_info()),
-            self._env_section(),
-            self._packages_section(),
-            self._license_section(),
+            self._static("config_html", lambda: self._section_table("Configuração da Aplicação", self._config_info())),
+            self._env_section_cached(),
+            self._static("packages_html", self._packages_section),
+            self._static("license_html", self._license_section),
         ]
 
         return f"""<!DOCTYPE html>
@@ -56,6 +64,36 @@ class TechReport:
   </body>
 </html>"""
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON view for monitoring: no license text, packages as name/version."""
+        return {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "host": self._host_info(),
+            "runtime": self._static("runtime", self._runtime_info),
+            "database": self._database_info(),
+            "config": self._static("config", self._config_info),
+            "packages": self._static(
+                "packages_summary",
+                lambda: [{"name": pkg["name"], "version": pkg["version"]} for pkg in self._installed_packages()],
+            ),
+        }
+
+    @staticmethod
+    def _static(key: str, factory: Callable[[], Any]) -> Any:
+        value = _static_cache.get(key)
+        if value is None:
+            with _static_lock:
+                value = _static_cache.get(key)
+                if value is None:
+                    value = _static_cache[key] = factory()
+        return value
+
+    def _env_section_cached(self) -> str:
+        # Only the process environment is stable enough to cache; custom envs render fresh
+        if self.env is os.environ:
+            return self._static("env_html", self._env_section)
+        return self._env_section()
+
     def _section_table(self, title: str, items: Dict[str, str]) -> str:
         rows = "".join(
             f"<tr><th>{escape(key)}</th><td>{self._format_value(value)}</td></tr>"
@@ -126,12 +164,22 @@ class TechReport:
 
     def _host_info(self) -> Dict[str, str]:
         rss_mb = self._rss_memory_mb()
+        static_info = self._static(
+            "host",
+            lambda: {
+                "Hostname": socket.gethostname(),
+                "Plataforma": platform.platform(),
+                "Sistema Operacional": platform.system(),
+                "Processadores": os.cpu_count() or "N/A",
+            },
+        )
         return {
-            "Hostname": socket.gethostname(),
+            "Hostname": static_info["Hostname"],
+            # Read per call: gunicorn forks workers after this module may have been imported
             "PID": os.getpid(),
-            "Plataforma": platform.platform(),
-            "Sistema Operacional": platform.system(),
-            "Processadores": os.cpu_count() or "N/A",
+            "Plataforma": static_info["Plataforma"],
+            "Sistema Operacional": static_info["Sistema Operacional"],
+            "Processadores": static_info["Processadores"],
             "Memória RSS (MB)": f"{rss_mb:.2f}",
         }
 
@@ -147,7 +195,7 @@ class TechReport:
         }
 
     def _database_info(self) -> Dict[str, str]:
-        uri = current_app.config.get("SQLALCHEMY_DATABASE_URI", "")
+        uri = _masked_uri(current_app.config.get("SQLALCHEMY_DATABASE_URI", ""))
         try:
             engine = db.get_engine()
             params = engine.url
@@ -175,7 +223,13 @@ class TechReport:
     def _sanitized_env(self) -> Iterable:
         entries = []
         for key, value in sorted(self.env.items()):
-            display = "[FILTERED]" if any(token in key.upper() for token in SENSITIVE_ENV_PATTERN) else value
+            if any(token in key.upper() for token in SENSITIVE_ENV_PATTERN):
+                display = "[FILTERED]"
+            elif "://" in value:
+                # DATABASE_URL, DATABASE_REPLICA_URLS (comma separated) and friends
+                display = ",".join(_masked_uri(part.strip()) or "[FILTERED]" for part in value.split(","))
+            else:
+                display = value
             entries.append((key, display))
         return entries
 
@@ -215,11 +269,14 @@ class TechReport:
 
     @staticmethod
     def _rss_memory_mb() -> float:
+        rss_bytes = current_rss_bytes()
+        if rss_bytes is not None:
+            return rss_bytes / (1024 * 1024)
         try:
             import resource
 
+            # Without /proc only the peak RSS is available; macOS reports bytes, Linux kilobytes
             rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-            # macOS reports bytes, Linux reports kilobytes
             if platform.system() == "Darwin":
                 rss_mb = rss_kb / (1024 * 1024)
             else:
@@ -228,3 +285,11 @@ class TechReport:
         except Exception:
             return 0.0
 
+
+def _masked_uri(uri: str) -> str:
+    """The DSN with its password replaced by ``***``; /tech.json is public."""
+
+    try:
+        return make_url(uri).render_as_string(hide_password=True)
+    except ArgumentError:
+        return ""
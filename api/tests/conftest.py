@@ -32,6 +32,9 @@ def clean_database(app):
         db.session.remove()
         db.drop_all()
         db.create_all()
+        app.extensions["result_cache"].clear()
+        app.extensions["read_model"].clear()
+        app.extensions["fragment_cache"].clear()
         yield
         db.session.remove()
 
@@ -0,0 +1,77 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+
+def generate_signing_key(kid: str):
+    """Return (private PEM, public JWK dict) for a fresh RSA key."""
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode("ascii")
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    ).decode("ascii")
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk["kid"] = kid
+    return private_pem, public_jwk
+
+
+def sign_token(private_pem: str, kid: str, **claims) -> str:
+    payload = {"preferred_username": "admin", "realm_access": {"roles": ["admin"]}, **claims}
+    return jwt.encode(payload, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+class StubKeycloakServer:
+    """Local HTTP server exposing the OpenID metadata and JWKS of one realm."""
+
+    def __init__(self, realm: str = "demo", keys=None, delay_seconds: float = 0.0):
+        self.realm = realm
+        self.keys = list(keys or [])
+        self.delay_seconds = delay_seconds
+        self.jwks_requests = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.endswith("/.well-known/openid-configuration"):
+                    body = {"jwks_uri": f"{stub.base_url}/realms/{stub.realm}/protocol/openid-connect/certs"}
+                elif self.path.endswith("/certs"):
+                    with stub._lock:
+                        stub.jwks_requests += 1
+                    time.sleep(stub.delay_seconds)
+                    body = {"keys": list(stub.keys)}
+                else:
+                    self.send_error(404)
+                    return
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,73 @@
+import json
+import logging
+
+import logging_config
+from logging_config import ACCESS_LOG_FLAG, JsonFormatter, SamplingFilter, configure_logging
+
+
+def _record(name="app", level=logging.INFO, msg="message", **extra):
+    record = logging.LogRecord(name, level, __file__, 1, msg, None, None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_sampling_filter_drops_access_and_sql_records_by_rate():
+    sampler = SamplingFilter(access_rate=0.0, sql_rate=0.0)
+
+    assert not sampler.filter(_record(**{ACCESS_LOG_FLAG: True, "status": 200}))
+    assert sampler.filter(_record(**{ACCESS_LOG_FLAG: True, "status": 503}))
+    assert not sampler.filter(_record(name="sqlalchemy.engine.Engine"))
+    assert sampler.filter(_record(name="sqlalchemy.engine.Engine", level=logging.WARNING))
+    assert sampler.filter(_record(name="app"))
+
+
+def test_sampling_filter_keeps_fraction_of_access_lines():
+    values = iter([0.05, 0.5])
+    sampler = SamplingFilter(access_rate=0.1, rng=lambda: next(values))
+
+    kept = [sampler.filter(_record(**{ACCESS_LOG_FLAG: True, "status": 200})) for _ in range(2)]
+
+    assert kept == [True, False]
+
+
+def test_json_formatter_emits_one_object_per_line():
+    line = JsonFormatter().format(_record(msg="HTTP GET /up -> 200", request_id="abc", status=200))
+
+    payload = json.loads(line)
+    assert payload["message"] == "HTTP GET /up -> 200"
+    assert payload["request_id"] == "abc"
+    assert payload["level"] == "INFO"
+
+
+def test_configure_logging_writes_through_queue_listener(app, tmp_path):
+    try:
+        configure_logging(tmp_path, json_lines=True)
+        logging.getLogger("python-demo.test").info("queued %s", "record")
+        logging_config._stop_listener()
+
+        lines = (tmp_path / "app.log").read_text(encoding="utf-8").splitlines()
+        assert json.loads(lines[-1])["message"] == "queued record"
+    finally:
+        configure_logging(app.config["LOG_DIR"], app.config["LOG_LEVEL"], sql_level=app.config["LOG_SQL_LEVEL"])
+
+
+def test_per_process_files_are_named_by_process_label(app, tmp_path, monkeypatch):
+    monkeypatch.setenv(logging_config.PROCESS_LABEL_ENV, "worker-1")
+    try:
+        configure_logging(tmp_path, per_process_files=True)
+        logging.getLogger("python-demo.test").warning("from a worker")
+        logging_config._stop_listener()
+
+        assert "from a worker" in (tmp_path / "app.worker-1.log").read_text(encoding="utf-8")
+    finally:
+        configure_logging(app.config["LOG_DIR"], app.config["LOG_LEVEL"], sql_level=app.config["LOG_SQL_LEVEL"])
+
+
+def test_prune_process_logs_keeps_only_current_labels(tmp_path):
+    for name in ("app.log", "app.worker-0.log", "app.worker-3.log.1", "sqlalchemy.4242.log", "app.master.log"):
+        (tmp_path / name).touch()
+
+    logging_config.prune_process_logs(tmp_path, {"master", "worker-0"})
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["app.log", "app.master.log", "app.worker-0.log"]
@@ -0,0 +1,81 @@
+import multiprocessing
+
+from observability import MetricsFormatter, ObservabilityMetrics, MultiProcessSampleStore
+from observability.multiprocess import SharedFamily
+
+
+def _record_in_child(directory):
+    store = MultiProcessSampleStore(directory)
+    store.inc("http_server_requests_total", "Total HTTP requests", {"http.route": "/up"}, 3)
+    store.observe("latency_seconds", "Latency", {"http.route": "/up"}, 0.3, (0.1, 0.5))
+
+
+def test_sample_store_merges_counters_from_every_process(tmp_path):
+    store = MultiProcessSampleStore(tmp_path)
+    store.inc("http_server_requests_total", "Total HTTP requests", {"http.route": "/up"}, 2)
+    store.observe("latency_seconds", "Latency", {"http.route": "/up"}, 0.05, (0.1, 0.5))
+
+    child = multiprocessing.get_context("fork").Process(target=_record_in_child, args=(str(tmp_path),))
+    child.start()
+    child.join()
+
+    merged = store.merge()
+
+    counter = merged["http_server_requests_total"]
+    assert counter.description == "Total HTTP requests"
+    assert counter.samples == {("", (("http.route", "/up"),)): 5.0}
+    histogram = merged["latency_seconds"].samples
+    assert histogram[("_bucket", (("http.route", "/up"), ("le", "0.1")))] == 1.0
+    assert histogram[("_bucket", (("http.route", "/up"), ("le", "0.5")))] == 1.0
+    assert histogram[("_bucket", (("http.route", "/up"), ("le", "+Inf")))] == 0.0
+    assert histogram[("_count", (("http.route", "/up"),))] == 2.0
+    assert len(list(tmp_path.glob("samples_*.db"))) == 2
+
+
+def test_formatter_emits_merged_totals(tmp_path):
+    metrics = ObservabilityMetrics("python-demo-test", multiprocess_dir=str(tmp_path))
+    metrics.record_request("GET", "/up", 200, 0.01)
+
+    other_worker = {
+        "http_server_requests_total": SharedFamily(
+            "Total HTTP requests received by the API",
+            "counter",
+            {("", (("http.route", "/up"), ("http.status_code", 200))): 7.0},
+        ),
+        "cache_hits_total": SharedFamily(
+            "Lookups answered from an in-process cache",
+            "counter",
+            {("", (("cache", "result"),)): 4.0},
+        ),
+    }
+
+    text = MetricsFormatter(metrics.scrape(), other_worker).to_text()
+
+    assert 'http_server_requests_total{http_route="/up",http_status_code="200"' in text
+    assert "7.000000" in text
+    assert "# TYPE cache_hits_total counter" in text
+
+
+def test_formatter_emits_histogram_buckets_and_exemplars():
+    metrics = ObservabilityMetrics(
+        "python-demo-test",
+        latency_buckets=(0.1, 1.0),
+        exemplar_min_seconds=0.5,
+    )
+    metrics.record_request("GET", "/articles", 200, 0.05, request_id="fast")
+    metrics.record_request("GET", "/articles", 200, 0.7, request_id="slow")
+
+    formatter = MetricsFormatter(metrics.scrape(), exemplars=metrics.exemplars())
+    text = formatter.to_text()
+    openmetrics = formatter.to_text(openmetrics=True)
+
+    assert "# TYPE http_server_request_duration_seconds histogram" in text
+    assert 'le="0.1"' in text and 'le="1.0"' in text and 'le="+Inf"' in text
+    bucket_lines = [line for line in text.splitlines() if line.startswith("http_server_request_duration_seconds_bucket")]
+    assert [line.rsplit(" ", 1)[1] for line in bucket_lines] == ["1", "2", "2"]
+    assert "http_server_request_duration_seconds_count" in text
+    assert "request_id" not in text
+    assert '# {request_id="slow"} 0.700000' in openmetrics
+    assert "fast" not in openmetrics
+    assert "# TYPE http_server_requests counter" in openmetrics
+    assert openmetrics.rstrip().endswith("# EOF")
@@ -0,0 +1,93 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from observability import (
+    InstrumentedQueuePool,
+    MetricsFormatter,
+    ObservabilityMetrics,
+    configure_pre_ping,
+    instrument_pool,
+    instrumented_engine_options,
+)
+
+
+class _EventRecorder:
+    def __init__(self):
+        self.events = []
+
+    def record_pool_event(self, pool, event):
+        self.events.append(event)
+
+    def record_pool_wait(self, pool, seconds, timed_out=False):
+        pass
+
+
+def _engine(tmp_path, **options):
+    return create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        **options,
+    )
+
+
+def test_engine_options_use_the_instrumented_pool_only_for_sized_pools():
+    assert instrumented_engine_options({"pool_size": 4})["poolclass"] is InstrumentedQueuePool
+    assert "poolclass" not in instrumented_engine_options({})
+
+
+def test_checkout_wait_and_pool_events_are_exported(tmp_path):
+    metrics = ObservabilityMetrics("python-demo-test")
+    engine = _engine(tmp_path, pool_timeout=0.05)
+    instrument_pool(engine, "default", metrics)
+
+    with engine.connect():
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+    with engine.connect():
+        pass
+
+    text_output = MetricsFormatter(metrics.scrape()).to_text()
+
+    assert "# TYPE db_pool_checkout_wait_seconds histogram" in text_output
+    assert 'db_pool_checkout_wait_seconds_count{pool="default"' in text_output
+    count_line = next(line for line in text_output.splitlines() if line.startswith("db_pool_checkout_wait_seconds_count"))
+    assert count_line.endswith(" 3")
+    assert 'db_pool_checkout_timeouts_total{pool="default"' in text_output
+    assert 'db_pool_events_total{event="checkout",pool="default"' in text_output
+    assert 'db_pool_events_total{event="connect",pool="default"' in text_output
+
+
+def test_wait_observer_survives_pool_recreate(tmp_path):
+    metrics = ObservabilityMetrics("python-demo-test")
+    engine = _engine(tmp_path)
+    instrument_pool(engine, "default", metrics)
+
+    engine.dispose()
+
+    assert engine.pool.wait_observer is not None
+
+
+def test_idle_pre_ping_replaces_dead_connections(tmp_path):
+    engine = _engine(tmp_path)
+    configure_pre_ping(engine, "idle", idle_seconds=0)
+    recorder = _EventRecorder()
+    instrument_pool(engine, "default", recorder)
+
+    with engine.connect() as connection:
+        connection.connection.dbapi_connection.close()
+
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT 1")).scalar() == 1
+    assert recorder.events.count("connect") == 2
+
+
+
+def test_create_app_does_not_register_fork_hooks(monkeypatch):
+    import app as app_module
+
+    monkeypatch.setattr(app_module.os, "register_at_fork", lambda **kwargs: pytest.fail("hook registered"))
+    built = app_module.create_app()
+
+    assert built in app_module._apps_with_pools
@@ -0,0 +1,67 @@
+import multiprocessing
+import os
+
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+from observability import MultiProcessSampleStore, ObservabilityMetrics, RuntimeCollector, current_rss_bytes
+
+
+def _publish_in_child(directory):
+    store = MultiProcessSampleStore(directory)
+    store.set("process_threads", "Threads", "gauge", {"pid": os.getpid()}, 3)
+    store.inc("http_server_requests_total", "Total HTTP requests", {"http.route": "/up"}, 1)
+
+
+def test_current_rss_is_live_not_peak():
+    before = current_rss_bytes()
+    ballast = bytearray(64 * 1024 * 1024)
+    during = current_rss_bytes()
+    del ballast
+    after = current_rss_bytes()
+
+    assert before and during and after
+    assert during - before > 32 * 1024 * 1024
+    assert after < during
+
+
+def test_collector_labels_every_sample_with_the_worker_pid(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=QueuePool, pool_size=2)
+    collector = RuntimeCollector("python-demo-test", pools_provider=lambda: {"default": engine.pool})
+
+    with engine.connect():
+        samples = {(sample.name, sample.attributes.get("generation")): sample for sample in collector.samples()}
+
+    assert all(sample.attributes["pid"] == os.getpid() for sample in samples.values())
+    assert samples[("process_threads", None)].value >= 1
+    assert samples[("process_open_fds", None)].value > 0
+    assert ("python_gc_collections_total", 2) in samples
+    assert samples[("db_pool_size", None)].value == 2
+    assert samples[("db_pool_checked_out", None)].value == 1
+    assert samples[("db_pool_checked_out", None)].attributes["pool"] == "default"
+
+
+def test_sample_store_drops_readings_of_exited_workers(tmp_path):
+    store = MultiProcessSampleStore(tmp_path)
+    store.set("process_threads", "Threads", "gauge", {"pid": os.getpid()}, 5)
+
+    child = multiprocessing.get_context("fork").Process(target=_publish_in_child, args=(str(tmp_path),))
+    child.start()
+    child.join()
+
+    merged = store.merge()
+
+    assert merged["process_threads"].samples == {("", (("pid", os.getpid()),)): 5.0}
+    # Counters of the exited worker still count towards the totals
+    assert merged["http_server_requests_total"].samples == {("", (("http.route", "/up"),)): 1.0}
+
+
+def test_runtime_readings_are_shared_across_workers(tmp_path):
+    metrics = ObservabilityMetrics("python-demo-test", multiprocess_dir=str(tmp_path))
+    metrics.register_runtime_collector(RuntimeCollector("python-demo-test"))
+
+    merged = metrics.shared_samples()
+
+    rss = merged["process_resident_memory_bytes"]
+    assert rss.kind == "gauge"
+    assert [dict(labels)["pid"] for _, labels in rss.samples] == [os.getpid()]
@@ -1,5 +1,13 @@
+import json
+from datetime import datetime, timedelta
+
+from blueprints.bulk import BulkOutcome, split_ids
+from extensions import db
+from models import Article
+from models.data_version import bump_versions
+from services.article_export import execute_export, iter_article_ndjson
 from tests.factories import ArticleFactory, AuthorFactory
-from tests.utils import json_body
+from tests.utils import assert_max_queries, json_body
 
 
 def test_list_articles(client):
@@ -11,6 +19,15 @@ def test_list_articles(client):
     assert len(json_body(response)) == 2
 
 
+def test_list_articles_query_budget_does_not_grow_with_rows(client):
+    ArticleFactory.create_batch(10)
+
+    with assert_max_queries(3):
+        response = client.get("/articles")
+
+    assert len(json_body(response)) == 10
+
+
 def test_show_article(client):
     article = ArticleFactory()
 
@@ -59,6 +76,17 @@ def test_update_article(client):
     assert json_body(response)["title"] == "Atualizado"
 
 
+def test_update_article_moves_it_to_another_author(client):
+    article = ArticleFactory()
+    other = AuthorFactory(name="Outro Autor")
+    db.session.expunge_all()
+
+    response = client.patch(f"/articles/{article.id}", json={"article": {"author_id": other.id}})
+
+    assert response.status_code == 200
+    assert json_body(response)["author"] == {"id": other.id, "name": "Outro Autor"}
+
+
 def test_delete_article(client):
     article = ArticleFactory()
 
@@ -81,3 +109,386 @@ def test_count_by_author(client):
     assert alice["articles_count"] == 2
     assert bob["articles_count"] == 0
 
+
+def test_list_articles_paginates_with_cursor(client):
+    ArticleFactory.create_batch(5)
+
+    first = client.get("/articles?limit=2")
+    assert first.status_code == 200
+    first_page = json_body(first)
+    assert len(first_page["data"]) == 2
+    assert first_page["next_cursor"]
+
+    seen = [item["id"] for item in first_page["data"]]
+    cursor = first_page["next_cursor"]
+    while cursor:
+        page = json_body(client.get(f"/articles?limit=2&cursor={cursor}"))
+        seen.extend(item["id"] for item in page["data"])
+        cursor = page["next_cursor"]
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+def test_list_articles_rejects_invalid_cursor(client):
+    response = client.get("/articles?cursor=not-a-cursor")
+
+    assert response.status_code == 422
+    assert "errors" in json_body(response)
+
+
+def test_list_articles_rejects_invalid_limit(client):
+    response = client.get("/articles?limit=0")
+
+    assert response.status_code == 422
+
+
+def test_list_articles_summary_view_returns_excerpt(client):
+    ArticleFactory(post_entry="  " + "a" * 300 + "  ")
+
+    response = client.get("/articles?view=summary")
+
+    assert response.status_code == 200
+    item = json_body(response)[0]
+    assert "post_entry" not in item
+    assert item["excerpt"] == "a" * 200 + "…"
+    assert set(item["author"]) == {"id", "name"}
+
+
+def test_list_articles_rejects_unknown_view(client):
+    response = client.get("/articles?view=compact")
+
+    assert response.status_code == 422
+
+
+def test_list_articles_returns_304_when_etag_matches(client):
+    ArticleFactory()
+
+    first = client.get("/articles")
+    etag = first.headers["ETag"]
+
+    cached = client.get("/articles", headers={"If-None-Match": etag})
+
+    assert cached.status_code == 304
+    assert cached.data == b""
+    assert cached.headers["ETag"] == etag
+
+
+def test_list_articles_returns_304_for_a_weakened_etag(client):
+    ArticleFactory()
+    etag = client.get("/articles").headers["ETag"]
+
+    cached = client.get("/articles", headers={"If-None-Match": f"W/{etag}"})
+
+    assert cached.status_code == 304
+
+
+def test_list_articles_etag_changes_after_write(client):
+    article = ArticleFactory()
+    etag = client.get("/articles").headers["ETag"]
+
+    client.delete(f"/articles/{article.id}")
+    response = client.get("/articles", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert json_body(response) == []
+
+
+def test_list_articles_etag_changes_when_an_edit_keeps_the_max_updated_at(client):
+    # Two edits in the same second share updated_at on MySQL's whole-second DATETIME
+    stamp = datetime(2025, 12, 1, 12, 0, 0)
+    article = ArticleFactory(title="one", updated_at=stamp - timedelta(seconds=1))
+    ArticleFactory(updated_at=stamp)
+    etag = client.get("/articles").headers["ETag"]
+
+    article.title = "EDITED"
+    article.updated_at = stamp
+    db.session.flush()
+    response = client.get("/articles", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert "EDITED" in [item["title"] for item in json_body(response)]
+
+
+def test_count_by_author_cache_is_invalidated_on_commit(client, app):
+    author = AuthorFactory(name="Carol")
+    ArticleFactory(author=author)
+    cache = app.extensions["result_cache"]
+
+    first = json_body(client.get("/articles/count_by_author"))
+    assert len(cache) == 1
+    assert json_body(client.get("/articles/count_by_author")) == first
+
+    client.post(
+        "/articles",
+        json={
+            "article": {
+                "title": "Outro",
+                "slug": "outro",
+                "published_label": "Hoje",
+                "post_entry": "Texto",
+                "tags": [],
+                "author_id": author.id,
+            }
+        },
+    )
+
+    assert len(cache) == 0
+    payload = json_body(client.get("/articles/count_by_author"))
+    assert payload[0]["articles_count"] == 2
+
+
+def test_count_by_author_cache_follows_writes_from_other_workers(client, app):
+    author = AuthorFactory(name="Carol")
+    ArticleFactory(author=author)
+    first = client.get("/articles/count_by_author")
+    assert json_body(first)[0]["articles_count"] == 1
+
+    # Another worker's commit: the version moves but this process's
+    # commit listeners never fire
+    db.session.connection().execute(
+        Article.__table__.insert().values(
+            title="Outro", slug="outro", published_label="Hoje", post_entry="Texto", tags=[], author_id=author.id
+        )
+    )
+    bump_versions(db.session, ["articles"])
+    response = client.get("/articles/count_by_author", headers={"If-None-Match": first.headers["ETag"]})
+
+    assert response.status_code == 200
+    assert json_body(response)[0]["articles_count"] == 2
+    assert len(app.extensions["result_cache"]) == 2
+
+
+def test_export_streams_every_article_as_ndjson(client):
+    articles = ArticleFactory.create_batch(3)
+
+    response = client.get("/articles/export")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.is_streamed
+    lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [line["id"] for line in lines] == sorted(article.id for article in articles)
+    assert lines[0]["author"]["name"] == articles[0].author.name
+    assert lines[0]["post_entry"] == articles[0].post_entry
+
+
+def test_export_fetches_rows_in_batches_with_one_statement(app):
+    ArticleFactory.create_batch(5)
+
+    with assert_max_queries(1):
+        result = execute_export(db.session, batch_size=2)
+        chunks = list(iter_article_ndjson(result))
+
+    assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+
+
+def test_export_articles_cli_command(app):
+    ArticleFactory.create_batch(2)
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["export-articles", "--batch-size", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert len(result.output.splitlines()) == 2
+
+
+def _ndjson(*lines):
+    return "\n".join(line if isinstance(line, str) else json.dumps(line) for line in lines).encode("utf-8")
+
+
+def _article_line(author_id, slug, **overrides):
+    return {
+        "title": f"Title {slug}",
+        "slug": slug,
+        "published_label": "Jan 1, 2025",
+        "post_entry": "Body",
+        "tags": ["python"],
+        "author_id": author_id,
+        **overrides,
+    }
+
+
+def test_import_inserts_valid_lines_and_reports_the_rest(client, app, monkeypatch):
+    author = AuthorFactory()
+    existing = ArticleFactory(author=author)
+    monkeypatch.setitem(app.config, "ARTICLE_IMPORT_BATCH_SIZE", 2)
+    body = _ndjson(
+        _article_line(author.id, "first"),
+        "{not json",
+        _article_line(author.id, "second"),
+        "",
+        _article_line(author.id + 999, "orphan"),
+        _article_line(author.id, existing.slug),
+        {"article": _article_line(author.id, "wrapped")},
+        _article_line(author.id, "first"),
+        {"title": ""},
+    )
+
+    response = client.post("/articles/import", data=body, content_type="application/x-ndjson")
+
+    payload = json_body(response)
+    assert response.status_code == 200
+    assert payload["imported"] == 3
+    assert payload["failed"] == 5
+    errors = {error["line"]: error["errors"] for error in payload["errors"]}
+    assert errors[2] == {"_line": ["JSON inválido"]}
+    assert errors[5] == {"author_id": ["Author must exist"]}
+    assert errors[6] == {"slug": ["Slug has already been taken"]}
+    assert errors[8] == {"slug": ["Slug has already been taken"]}
+    assert "slug" in errors[9]
+    imported = Article.query.filter(Article.slug.in_(["first", "second", "wrapped"])).all()
+    assert sorted(article.excerpt for article in imported) == ["Body", "Body", "Body"]
+
+
+def test_import_accepts_export_output(client):
+    ArticleFactory.create_batch(3)
+    exported = client.get("/articles/export").get_data(as_text=True)
+    Article.query.delete()
+    db.session.commit()
+
+    response = client.post("/articles/import", data=exported.encode("utf-8"))
+
+    assert json_body(response)["imported"] == 3
+    assert Article.query.count() == 3
+
+
+def test_import_runs_a_fixed_number_of_queries_per_batch(client):
+    author = AuthorFactory()
+    body = _ndjson(*(_article_line(author.id, f"slug-{index}") for index in range(50)))
+
+    with assert_max_queries(6):
+        response = client.post("/articles/import", data=body)
+
+    assert json_body(response)["imported"] == 50
+
+
+def test_bulk_create_articles_in_one_transaction(client):
+    author = AuthorFactory()
+    items = [_article_line(author.id, f"bulk-{index}") for index in range(20)]
+
+    with assert_max_queries(8):
+        response = client.post("/articles/bulk", json={"article": items})
+
+    payload = json_body(response)
+    assert response.status_code == 201
+    assert [result["status"] for result in payload["results"]] == ["created"] * 20
+    assert payload["results"][3]["data"]["slug"] == "bulk-3"
+    assert payload["results"][3]["data"]["author"]["id"] == author.id
+    assert Article.query.count() == 20
+
+
+def test_bulk_create_articles_reports_items_and_writes_nothing(client):
+    author = AuthorFactory()
+    existing = ArticleFactory(author=author)
+    items = [
+        _article_line(author.id, "fine"),
+        _article_line(author.id + 999, "orphan"),
+        _article_line(author.id, existing.slug),
+        _article_line(author.id, "twice"),
+        _article_line(author.id, "twice"),
+        {"title": ""},
+    ]
+
+    response = client.post("/articles/bulk", json={"article": items})
+
+    results = json_body(response)["results"]
+    assert response.status_code == 422
+    assert results[0] == {"index": 0, "status": "skipped"}
+    assert results[1]["errors"] == {"author_id": ["Author must exist"]}
+    assert results[2]["errors"] == {"slug": ["Slug has already been taken"]}
+    assert results[3]["errors"] == results[4]["errors"] == {"slug": ["Slug has already been taken"]}
+    assert "title" in results[5]["errors"]
+    assert Article.query.count() == 1
+
+
+def test_bulk_create_articles_maps_integrity_error_to_items(client, monkeypatch):
+    import blueprints.articles as articles_blueprint
+
+    author = AuthorFactory()
+    existing = ArticleFactory(author=author)
+    # The rollback must not take the fixtures with it
+    db.session.commit()
+    check = articles_blueprint.reject_taken_values
+    calls = []
+
+    def miss_first_check(*args, **kwargs):
+        # Simulates a concurrent writer taking the slug between the check and the flush
+        calls.append(args)
+        if len(calls) > 1:
+            check(*args, **kwargs)
+
+    monkeypatch.setattr(articles_blueprint, "reject_taken_values", miss_first_check)
+    items = [_article_line(author.id, "fresh"), _article_line(author.id, existing.slug)]
+
+    response = client.post("/articles/bulk", json={"article": items})
+
+    results = json_body(response)["results"]
+    assert response.status_code == 422
+    assert results[0]["status"] == "skipped"
+    assert results[1]["errors"] == {"slug": ["Slug has already been taken"]}
+    assert Article.query.count() == 1
+
+
+def test_bulk_create_articles_requires_a_list(client):
+    response = client.post("/articles/bulk", json={"article": {"title": "x"}})
+
+    assert response.status_code == 422
+    assert json_body(response)["errors"] == ["deve ser uma lista não vazia"]
+
+
+def test_bulk_update_articles(client):
+    author = AuthorFactory()
+    first, second = ArticleFactory.create_batch(2, author=author)
+
+    with assert_max_queries(7):
+        response = client.patch(
+            "/articles/bulk",
+            json={
+                "article": [
+                    {"id": first.id, "title": "Primeiro"},
+                    {"id": second.id, "slug": second.slug, "tags": ["flask"]},
+                ]
+            },
+        )
+
+    results = json_body(response)["results"]
+    assert response.status_code == 200
+    assert results[0]["data"]["title"] == "Primeiro"
+    assert results[1]["data"]["tags"] == ["flask"]
+
+
+def test_split_ids_leaves_the_request_items_untouched():
+    items = [{"id": 1, "title": "Novo"}, {"title": "Sem id"}]
+    outcome = BulkOutcome(len(items))
+
+    ids, stripped = split_ids(items, outcome)
+
+    assert ids == {0: 1}
+    assert stripped == [{"title": "Novo"}, {"title": "Sem id"}]
+    assert items[0] == {"id": 1, "title": "Novo"}
+    assert list(outcome.errors) == [1]
+
+
+def test_bulk_update_articles_requires_existing_ids(client):
+    article = ArticleFactory()
+
+    response = client.patch(
+        "/articles/bulk",
+        json={
+            "article": [
+                {"id": article.id, "title": "Novo"},
+                {"id": article.id + 999, "title": "Fantasma"},
+                {"title": "Sem id"},
+            ]
+        },
+    )
+
+    results = json_body(response)["results"]
+    assert response.status_code == 422
+    assert results[0]["status"] == "skipped"
+    assert results[1]["errors"] == {"id": ["Artigo não encontrado."]}
+    assert results[2]["errors"] == {"id": ["é obrigatório"]}
+    db.session.expire_all()
+    assert Article.query.get(article.id).title != "Novo"
@@ -1,5 +1,5 @@
 from tests.factories import ArticleFactory, AuthorFactory, SocialFactory
-from tests.utils import json_body
+from tests.utils import assert_max_queries, json_body
 
 
 def test_list_authors_includes_socials(client):
@@ -24,6 +24,50 @@ def test_show_author_includes_articles_and_socials(client):
     body = json_body(response)
     assert len(body["articles"]) == 1
     assert len(body["socials"]) == 1
+    assert body["articles_count"] == 1
+    assert body["articles_next_cursor"] is None
+
+
+def test_show_author_embeds_only_the_first_page_of_articles(client):
+    author = AuthorFactory()
+    ArticleFactory.create_batch(25, author=author)
+    ArticleFactory()
+
+    body = json_body(client.get(f"/authors/{author.id}"))
+
+    assert len(body["articles"]) == 20
+    assert body["articles_count"] == 25
+    cursor = body["articles_next_cursor"]
+    rest = json_body(client.get(f"/authors/{author.id}/articles", query_string={"cursor": cursor}))
+    assert len(rest["data"]) == 5
+    assert rest["next_cursor"] is None
+    ids = [article["id"] for article in body["articles"] + rest["data"]]
+    assert len(set(ids)) == 25
+
+
+def test_list_author_articles_summary_view(client):
+    author = AuthorFactory()
+    ArticleFactory.create_batch(3, author=author)
+
+    with assert_max_queries(3):
+        response = client.get(
+            f"/authors/{author.id}/articles", query_string={"view": "summary", "limit": 2}
+        )
+
+    body = json_body(response)
+    assert response.status_code == 200
+    assert len(body["data"]) == 2
+    assert body["next_cursor"]
+    assert "excerpt" in body["data"][0]
+    assert "post_entry" not in body["data"][0]
+
+
+def test_list_author_articles_errors(client):
+    author = AuthorFactory()
+
+    assert client.get(f"/authors/{author.id + 1}/articles").status_code == 404
+    response = client.get(f"/authors/{author.id}/articles", query_string={"view": "x"})
+    assert response.status_code == 422
 
 
 def test_create_author(client):
@@ -69,3 +113,65 @@ def test_delete_author(client):
 
     assert response.status_code == 204
 
+
+def test_delete_author_changes_the_etag_of_cascaded_tables(client):
+    article = ArticleFactory()
+    socials_etag = client.get("/socials").headers["ETag"]
+    articles_etag = client.get("/articles").headers["ETag"]
+
+    client.delete(f"/authors/{article.author_id}")
+
+    assert client.get("/socials", headers={"If-None-Match": socials_etag}).status_code == 200
+    assert client.get("/articles", headers={"If-None-Match": articles_etag}).status_code == 200
+
+
+def test_list_authors_query_budget_does_not_grow_with_rows(client):
+    for _ in range(5):
+        author = AuthorFactory()
+        ArticleFactory.create_batch(2, author=author)
+        SocialFactory(author=author)
+
+    with assert_max_queries(4):
+        response = client.get("/authors")
+
+    assert response.status_code == 200
+    assert len(json_body(response)) == 5
+
+
+def test_show_author_query_budget(client):
+    author = AuthorFactory()
+    ArticleFactory.create_batch(3, author=author)
+    SocialFactory.create_batch(2, author=author)
+
+    with assert_max_queries(4):
+        response = client.get(f"/authors/{author.id}")
+
+    assert response.status_code == 200
+
+
+def test_bulk_create_authors(client):
+    existing = AuthorFactory()
+    items = [
+        {
+            "name": name,
+            "birthdate": "1990-01-01",
+            "photo_url": "https://example.com/photo.jpg",
+            "public_key": "ssh-ed25519 AAAA",
+            "bio": "Developer",
+        }
+        for name in ("Ana", "Bruno", existing.name)
+    ]
+
+    response = client.post("/authors/bulk", json={"author": items})
+
+    results = json_body(response)["results"]
+    assert response.status_code == 422
+    assert results[2]["errors"] == {"name": ["Name has already been taken"]}
+
+    with assert_max_queries(7):
+        response = client.post("/authors/bulk", json={"author": items[:2]})
+
+    results = json_body(response)["results"]
+    assert response.status_code == 201
+    assert results[0]["data"]["name"] == "Ana"
+    assert results[1]["data"]["socials"] == []
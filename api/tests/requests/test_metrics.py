@@ -1,3 +1,6 @@
+import os
+
+
 def test_metrics_endpoint_returns_openmetrics(client):
     client.get("/liveness")
 
@@ -9,3 +12,50 @@ def test_metrics_endpoint_returns_openmetrics(client):
     assert "service_liveness" in body
     assert "text/plain" in response.content_type
 
+
+def test_metrics_endpoint_exports_result_cache_counters(client):
+    client.get("/articles/count_by_author")
+    client.get("/articles/count_by_author")
+
+    body = client.get("/metrics").data.decode("utf-8")
+
+    assert 'cache_hits_total{cache="result",endpoint="articles.count_by_author"' in body
+    assert "cache_misses_total" in body
+
+
+def test_metrics_endpoint_exposes_latency_histogram(client):
+    client.get("/liveness")
+
+    body = client.get("/metrics").data.decode("utf-8")
+
+    assert "# TYPE http_server_request_duration_seconds histogram" in body
+    assert 'http_server_request_duration_seconds_bucket{' in body
+    assert 'le="+Inf"' in body
+
+
+def test_metrics_endpoint_negotiates_openmetrics(client):
+    response = client.get("/metrics", headers={"Accept": "application/openmetrics-text"})
+
+    assert response.content_type.startswith("application/openmetrics-text")
+    assert response.data.decode("utf-8").rstrip().endswith("# EOF")
+
+
+def test_metrics_endpoint_exports_db_usage_per_route(client):
+    client.get("/socials")
+
+    body = client.get("/metrics").data.decode("utf-8")
+
+    assert 'db_queries_total{' in body
+    assert 'http_route="/socials"' in body
+    assert "db_time_seconds_total" in body
+
+
+def test_metrics_endpoint_exports_runtime_gauges_per_worker(client):
+    body = client.get("/metrics").data.decode("utf-8")
+
+    assert "# TYPE process_resident_memory_bytes gauge" in body
+    assert f'pid="{os.getpid()}"' in body
+    assert "process_open_fds{" in body
+    assert "process_threads{" in body
+    assert "# TYPE python_gc_pause_seconds_total counter" in body
+    assert 'python_gc_collections_total{generation="0"' in body
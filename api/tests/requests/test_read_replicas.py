@@ -0,0 +1,101 @@
+from datetime import date
+
+import pytest
+from flask import g
+from sqlalchemy import select
+
+from app import create_app
+from extensions import db
+from models import Author, Social
+from tests.utils import json_body
+
+
+def _seed(engine, slug):
+    with engine.begin() as connection:
+        author_id = connection.execute(
+            Author.__table__.insert().values(
+                name=f"Author {slug}",
+                birthdate=date(1990, 1, 1),
+                photo_url="https://example.com/photo.png",
+                public_key="key",
+                bio="bio",
+            )
+        ).inserted_primary_key[0]
+        connection.execute(
+            Social.__table__.insert().values(
+                slug=slug,
+                profile_link=f"https://example.com/{slug}",
+                description=slug,
+                author_id=author_id,
+            )
+        )
+
+
+def _slugs(engine):
+    with engine.connect() as connection:
+        return set(connection.execute(select(Social.slug)).scalars())
+
+
+@pytest.fixture()
+def replica_app(tmp_path):
+    application = create_app(
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'primary.db'}",
+            "DATABASE_REPLICA_URLS": [
+                f"sqlite:///{tmp_path / 'replica_a.db'}",
+                f"sqlite:///{tmp_path / 'replica_b.db'}",
+            ],
+        }
+    )
+    replicas = application.extensions["read_replicas"]
+    with application.app_context():
+        engines = {"primary": db.engine, **replicas}
+        for engine in engines.values():
+            db.metadata.create_all(engine)
+        _seed(engines["primary"], "primary")
+        _seed(replicas["replica_0"], "replica-a")
+        _seed(replicas["replica_1"], "replica-b")
+        yield application
+        db.session.remove()
+        for engine in engines.values():
+            engine.dispose()
+
+
+def test_read_handlers_use_replicas_round_robin(replica_app):
+    client = replica_app.test_client()
+
+    first = json_body(client.get("/socials"))
+    second = json_body(client.get("/socials"))
+
+    assert {first[0]["slug"], second[0]["slug"]} == {"replica-a", "replica-b"}
+
+
+def test_writes_stay_on_primary(replica_app):
+    client = replica_app.test_client()
+    payload = {
+        "social": {
+            "slug": "github",
+            "profile_link": "https://github.com/example",
+            "description": "Repo",
+            "author_id": 1,
+        }
+    }
+
+    response = client.post("/socials", json=payload)
+
+    assert response.status_code == 201
+    assert _slugs(db.engine) == {"primary", "github"}
+    assert _slugs(replica_app.extensions["read_replicas"]["replica_0"]) == {"replica-a"}
+
+
+def test_reads_after_a_write_in_the_same_request_use_primary(replica_app):
+    with replica_app.test_request_context("/socials"):
+        g.db_read_replica = True
+        assert db.session.scalars(select(Social.slug)).all() in (["replica-a"], ["replica-b"])
+
+        social = Social(slug="fresh", profile_link="https://example.com/fresh", description="x", author_id=1)
+        db.session.add(social)
+        db.session.commit()
+
+        assert set(db.session.scalars(select(Social.slug))) == {"primary", "fresh"}
+        db.session.remove()
@@ -63,3 +63,39 @@ def test_delete_social(client):
 
     assert response.status_code == 204
 
+
+def test_show_social_returns_304_when_etag_matches(client):
+    social = SocialFactory()
+    first = client.get(f"/socials/{social.id}")
+    assert "Last-Modified" in first.headers
+
+    response = client.get(
+        f"/socials/{social.id}",
+        headers={"If-None-Match": first.headers["ETag"]},
+    )
+
+    assert response.status_code == 304
+
+
+def test_bulk_create_socials(client):
+    author = AuthorFactory()
+    existing = SocialFactory(author=author)
+    items = [
+        {
+            "slug": slug,
+            "profile_link": f"https://example.com/{slug}",
+            "description": "Perfil",
+            "author_id": author.id,
+        }
+        for slug in ("mastodon", "bluesky")
+    ]
+
+    response = client.post("/socials/bulk", json={"social": items})
+
+    assert response.status_code == 201
+    assert [result["data"]["slug"] for result in json_body(response)["results"]] == ["mastodon", "bluesky"]
+
+    response = client.post("/socials/bulk", json={"social": [{**items[0], "slug": existing.slug}]})
+
+    assert response.status_code == 422
+    assert json_body(response)["results"][0]["errors"] == {"slug": ["Slug has already been taken"]}
@@ -1,3 +1,8 @@
+import json
+
+from services.tech_report import TechReport
+
+
 def test_tech_report_renders_html(client):
     response = client.get("/tech")
 
@@ -7,3 +12,54 @@ def test_tech_report_renders_html(client):
     assert "/tech &mdash; python-demo diagnostics" in body
     assert "Licença" in body
 
+
+def test_tech_report_json(client):
+    response = client.get("/tech.json")
+
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert {"host", "runtime", "database", "config", "packages"} <= set(payload)
+    assert any(pkg["name"].lower() == "flask" for pkg in payload["packages"])
+
+
+def test_tech_report_hides_the_database_password(client, monkeypatch):
+    monkeypatch.setitem(
+        client.application.config,
+        "SQLALCHEMY_DATABASE_URI",
+        "mysql+pymysql://demo:s3cr3t-pass@db:3306/demo",
+    )
+
+    payload = client.get("/tech.json").get_json()
+    html = client.get("/tech").data.decode("utf-8")
+
+    assert payload["database"]["URI"] == "mysql+pymysql://demo:***@db:3306/demo"
+    assert "s3cr3t-pass" not in json.dumps(payload)
+    assert "s3cr3t-pass" not in html
+
+
+def test_tech_report_masks_credentials_in_environment_urls(app):
+    env = {
+        "DATABASE_URL": "mysql+pymysql://demo:s3cr3t-pass@db:3306/demo",
+        "DATABASE_REPLICA_URLS": "mysql+pymysql://ro:r3pl1ca@r1/demo, mysql+pymysql://ro:r3pl1ca@r2/demo",
+        "LOG_DIR": "/app/api/logs",
+    }
+
+    html = TechReport(env=env)._env_section()
+
+    assert "s3cr3t-pass" not in html and "r3pl1ca" not in html
+    assert "mysql+pymysql://demo:***@db:3306/demo" in html
+    assert "mysql+pymysql://ro:***@r2/demo" in html
+    assert "/app/api/logs" in html
+
+
+def test_tech_report_builds_static_sections_once(client, monkeypatch):
+    client.get("/tech")
+
+    def fail():
+        raise AssertionError("packages re-scanned")
+
+    monkeypatch.setattr("services.tech_report.distributions", fail)
+    response = client.get("/tech")
+
+    assert response.status_code == 200
+    assert "Pacotes instalados" in response.data.decode("utf-8")
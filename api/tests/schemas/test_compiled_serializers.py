@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from marshmallow import Schema, fields
+
+from extensions import db
+from models import Article, Author
+from schemas import ArticleSchema, ArticleSummarySchema, AuthorSchema, compile_serializer
+from tests.factories import ArticleFactory, AuthorFactory, SocialFactory
+from tests.utils import assert_max_queries, json_body
+
+
+def _same_bytes(serializer, schema, model):
+    compiled = serializer.dump(db.session, serializer.statement().order_by(model.id))
+    expected = schema.dump(model.query.order_by(model.id).all(), many=True)
+    assert json.dumps(compiled, ensure_ascii=False) == json.dumps(expected, ensure_ascii=False)
+    return compiled
+
+
+@pytest.mark.parametrize("schema", [ArticleSchema(), ArticleSummarySchema()])
+def test_compiled_article_serializers_match_marshmallow(schema):
+    author = AuthorFactory(name="Zoë Ñandú")
+    ArticleFactory(author=author, title="Ação – “aspas”", tags=[])
+    ArticleFactory.create_batch(3)
+
+    compiled = _same_bytes(compile_serializer(schema, Article), schema, Article)
+
+    assert len(compiled) == 4
+
+
+@pytest.mark.parametrize("exclude", [("articles",), ()])
+def test_compiled_author_serializer_matches_marshmallow_with_collections(exclude):
+    with_children = AuthorFactory()
+    SocialFactory.create_batch(2, author=with_children)
+    ArticleFactory(author=with_children)
+    AuthorFactory()
+    schema = AuthorSchema(exclude=exclude)
+
+    compiled = _same_bytes(compile_serializer(schema, Author), schema, Author)
+
+    assert [len(author["socials"]) for author in compiled] == [2, 0]
+
+
+def test_compiled_serializer_fetches_collections_in_one_query():
+    for author in AuthorFactory.create_batch(5):
+        SocialFactory.create_batch(2, author=author)
+    serializer = compile_serializer(AuthorSchema(exclude=("articles",)), Author)
+
+    with assert_max_queries(2):
+        compiled = serializer.dump(db.session, serializer.statement())
+
+    assert sum(len(author["socials"]) for author in compiled) == 10
+
+
+def test_compiled_serializer_falls_back_to_the_field_for_other_types():
+    class CustomFormats(Schema):
+        id = fields.Str()
+        title = fields.Str(data_key="heading")
+        created_at = fields.DateTime(format="%Y")
+
+    ArticleFactory()
+    schema = CustomFormats()
+
+    _same_bytes(compile_serializer(schema, Article), schema, Article)
+
+
+def test_compiled_serializer_rejects_fields_that_need_the_object():
+    class WithMethod(Schema):
+        id = fields.Int()
+        upper = fields.Method("get_upper")
+
+        def get_upper(self, article):
+            return article.title.upper()
+
+    with pytest.raises(TypeError):
+        compile_serializer(WithMethod(), Article)
+
+
+def test_list_endpoints_match_the_marshmallow_output(client):
+    ArticleFactory.create_batch(3)
+    SocialFactory.create_batch(2)
+
+    articles = json_body(client.get("/articles"))
+    authors = json_body(client.get("/authors"))
+
+    expected_articles = ArticleSchema(many=True).dump(
+        Article.query.order_by(Article.created_at.desc(), Article.id.desc()).all()
+    )
+    expected_authors = AuthorSchema(exclude=("articles",), many=True).dump(
+        Author.query.order_by(Author.name.asc()).all()
+    )
+    assert articles == json.loads(json.dumps(expected_articles))
+    assert authors == json.loads(json.dumps(expected_authors))
@@ -0,0 +1,87 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+
+from extensions import db
+from models import Article, Author
+from schemas import ArticleSchema, ArticleSummarySchema, AuthorSchema, plan_loading
+from tests.factories import ArticleFactory, AuthorFactory, SocialFactory
+from tests.utils import assert_max_queries, json_body
+
+
+def _load(model, schema, raise_unplanned=True):
+    db.session.expunge_all()
+    options = plan_loading(schema, model, raise_unplanned=raise_unplanned)
+    return db.session.scalars(select(model).options(*options).order_by(model.id)).all()
+
+
+def test_planned_dump_matches_a_lazy_dump():
+    author = AuthorFactory()
+    SocialFactory.create_batch(2, author=author)
+    ArticleFactory.create_batch(2, author=author)
+    db.session.flush()
+    schema = AuthorSchema()
+    expected = schema.dump(Author.query.order_by(Author.id).all(), many=True)
+
+    with assert_max_queries(3):
+        assert schema.dump(_load(Author, schema), many=True) == expected
+
+
+def test_plan_skips_excluded_relationships_and_unrendered_columns():
+    ArticleFactory(author=AuthorFactory())
+    schema = AuthorSchema(exclude=("articles",))
+
+    with assert_max_queries(2) as statements:
+        authors = _load(Author, schema)
+        schema.dump(authors, many=True)
+
+    assert not any("FROM articles" in statement for statement in statements)
+    with pytest.raises(InvalidRequestError):
+        authors[0].articles
+
+
+def test_plan_loads_only_rendered_columns():
+    ArticleFactory()
+    schema = ArticleSummarySchema()
+
+    with assert_max_queries(2) as statements:
+        schema.dump(_load(Article, schema), many=True)
+
+    assert "post_entry" not in statements[0]
+    assert "articles.excerpt" in statements[0]
+    assert "authors.bio" not in statements[1]
+
+
+def test_unplanned_column_access_raises_only_when_strict():
+    ArticleFactory()
+
+    with pytest.raises(InvalidRequestError):
+        _load(Article, ArticleSummarySchema())[0].post_entry
+
+    assert _load(Article, ArticleSummarySchema(), raise_unplanned=False)[0].post_entry
+
+
+def test_plans_are_cached_per_schema():
+    schema = ArticleSchema()
+
+    assert plan_loading(schema, Article) is plan_loading(schema, Article)
+
+
+def test_schemas_built_per_call_share_one_plan():
+    plan = plan_loading(AuthorSchema(exclude=("articles",)), Author)
+
+    assert plan_loading(AuthorSchema(exclude=("articles",)), Author) is plan
+    assert plan_loading(AuthorSchema(), Author) is not plan
+    assert plan_loading(AuthorSchema(only=("id", "name")), Author) is not plan
+
+
+def test_show_author_renders_through_the_plan(client):
+    author = AuthorFactory()
+    ArticleFactory(author=author)
+    SocialFactory(author=author)
+    db.session.expunge_all()
+
+    response = client.get(f"/authors/{author.id}")
+
+    assert response.status_code == 200
+    assert len(json_body(response)["articles"]) == 1
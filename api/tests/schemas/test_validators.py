@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+from marshmallow import ValidationError
+
+from schemas import ArticleSchema, AuthorSchema, SocialSchema, cached_schema, payload_loader
+from schemas.validators import FlatValidator
+
+ARTICLE = {
+    "title": "Título",
+    "slug": "titulo",
+    "published_label": "Jan 1, 2025",
+    "post_entry": "Body",
+    "tags": ["python"],
+    "author_id": 1,
+}
+AUTHOR = {
+    "name": "Ana",
+    "birthdate": "1990-01-01",
+    "photo_url": "https://example.com/photo.jpg",
+    "public_key": "ssh-ed25519 AAAA",
+    "bio": "Developer",
+}
+SOCIAL = {"slug": "github", "profile_link": "https://github.com/x", "description": "Repo", "author_id": 1}
+
+
+def _outcome(loader, payload):
+    try:
+        return "ok", loader.load(payload)
+    except ValidationError as error:
+        return "error", error.messages
+
+
+CASES = [
+    (ArticleSchema, False, ARTICLE),
+    (ArticleSchema, False, {**ARTICLE, "title": ""}),
+    (ArticleSchema, False, {**ARTICLE, "author_id": "7"}),
+    (ArticleSchema, False, {**ARTICLE, "author_id": True}),
+    (ArticleSchema, False, {**ARTICLE, "tags": ["ok", 3]}),
+    (ArticleSchema, False, {**ARTICLE, "tags": None}),
+    (ArticleSchema, False, {**ARTICLE, "id": 5}),
+    (ArticleSchema, False, {**ARTICLE, "extra": 1}),
+    (ArticleSchema, False, {"title": "Só título"}),
+    (ArticleSchema, True, {"title": "Só título"}),
+    (ArticleSchema, True, {"slug": ""}),
+    (ArticleSchema, False, ["not", "a", "dict"]),
+    (AuthorSchema, False, AUTHOR),
+    (AuthorSchema, False, {**AUTHOR, "birthdate": "01/01/1990"}),
+    (AuthorSchema, False, {**AUTHOR, "photo_url": "not a url"}),
+    (AuthorSchema, False, {**AUTHOR, "socials": [{"slug": "x"}]}),
+    (AuthorSchema, True, {"bio": "Nova bio"}),
+    (SocialSchema, False, SOCIAL),
+    (SocialSchema, False, {**SOCIAL, "profile_link": "ftp//broken"}),
+]
+
+
+@pytest.mark.parametrize("schema_class, partial, payload", CASES)
+def test_flat_validator_matches_marshmallow(schema_class, partial, payload):
+    fast = payload_loader(schema_class, partial=partial)
+
+    assert isinstance(fast, FlatValidator)
+    assert _outcome(fast, payload) == _outcome(schema_class(partial=partial), payload)
+
+
+def test_schemas_are_built_once_per_combination():
+    assert cached_schema(ArticleSchema) is cached_schema(ArticleSchema)
+    assert cached_schema(ArticleSchema, partial=True) is not cached_schema(ArticleSchema)
+    assert cached_schema(AuthorSchema, exclude=("socials",)) is not cached_schema(AuthorSchema)
+    assert payload_loader(SocialSchema, fast=False) is cached_schema(SocialSchema)
+
+
+def test_cached_schema_is_shared_across_threads():
+    class ThreadSchema(ArticleSchema):
+        pass
+
+    barrier = threading.Barrier(8)
+    built = []
+
+    def build():
+        barrier.wait()
+        built.append(cached_schema(ThreadSchema, partial=True))
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(schema) for schema in built}) == 1
+
+
+def test_write_routes_answer_the_same_with_and_without_the_fast_validator(client, app):
+    payload = {"article": {**ARTICLE, "title": "", "tags": [1]}}
+    fast = client.post("/articles", json=payload)
+    app.config["FAST_PAYLOAD_VALIDATION"] = False
+    try:
+        slow = client.post("/articles", json=payload)
+    finally:
+        app.config["FAST_PAYLOAD_VALIDATION"] = True
+
+    assert fast.status_code == slow.status_code == 422
+    assert fast.get_json() == slow.get_json()
@@ -0,0 +1,62 @@
+import json
+
+from extensions import db
+from models import Article, SeedRun, Social
+from models.article import build_excerpt
+from seeds import bootstrap as seed_bootstrap
+from seeds.data import SEED_NAME, SOCIALS_SEED
+from tests.utils import assert_max_queries, json_body
+
+
+def _seed_file_copy(tmp_path, **article_changes):
+    payload = json.loads(seed_bootstrap.ARTICLE_SEED_PATH.read_text(encoding="utf-8"))
+    payload["data"][0].update(article_changes)
+    path = tmp_path / "article_seed_data.json"
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path, payload
+
+
+def test_seed_inserts_everything_in_a_few_statements():
+    seed_file = json.loads(seed_bootstrap.ARTICLE_SEED_PATH.read_text(encoding="utf-8"))
+
+    with assert_max_queries(17):
+        seed_bootstrap.bootstrap_seed_data()
+
+    assert Article.query.count() == len(seed_file["data"])
+    assert Social.query.count() == len(SOCIALS_SEED)
+    first = seed_file["data"][0]
+    article = Article.query.filter_by(slug=first["slug"]).one()
+    assert article.excerpt == build_excerpt(first["post_entry"])
+    assert len(SeedRun.query.filter_by(name=SEED_NAME).one().content_hash) == 64
+
+
+def test_unchanged_seed_is_skipped_with_one_query():
+    seed_bootstrap.bootstrap_seed_data()
+
+    with assert_max_queries(1):
+        seed_bootstrap.bootstrap_seed_data()
+
+
+def test_changed_seed_updates_existing_rows_in_place(tmp_path, monkeypatch):
+    seed_bootstrap.bootstrap_seed_data()
+    previous_hash = SeedRun.query.one().content_hash
+    path, payload = _seed_file_copy(tmp_path, title="Título revisado", post_entry="Novo texto")
+    monkeypatch.setattr(seed_bootstrap, "ARTICLE_SEED_PATH", path)
+
+    seed_bootstrap.bootstrap_seed_data()
+    db.session.expire_all()
+
+    article = Article.query.filter_by(slug=payload["data"][0]["slug"]).one()
+    assert article.title == "Título revisado"
+    assert article.excerpt == "Novo texto"
+    assert Article.query.count() == len(payload["data"])
+    assert SeedRun.query.one().content_hash != previous_hash
+
+
+def test_seed_invalidates_cached_results(client):
+    assert json_body(client.get("/articles/count_by_author")) == []
+
+    seed_bootstrap.bootstrap_seed_data()
+
+    counts = json_body(client.get("/articles/count_by_author"))
+    assert counts and counts[0]["articles_count"] > 0
@@ -0,0 +1,65 @@
+import threading
+import time
+
+import pytest
+
+from extensions import db
+from services import database_bootstrap
+from services.database_bootstrap import BootstrapLockTimeout, bootstrap_lock, bootstrap_on_startup
+
+
+@pytest.fixture()
+def recorded_bootstrap(app, monkeypatch, tmp_path):
+    events = []
+
+    def fake_upgrade():
+        events.append(("upgrade", "start"))
+        time.sleep(0.05)
+        events.append(("upgrade", "end"))
+
+    monkeypatch.setattr(database_bootstrap, "upgrade", fake_upgrade)
+    monkeypatch.setattr(database_bootstrap, "bootstrap_seed_data", lambda: events.append(("seed", "done")))
+    monkeypatch.setitem(app.config, "DB_BOOTSTRAP_LOCK_FILE", tmp_path / "bootstrap.lock")
+    return events
+
+
+def test_file_lock_excludes_a_second_holder(app, tmp_path):
+    lock_file = tmp_path / "bootstrap.lock"
+
+    with bootstrap_lock(db.engine, lock_file, timeout_seconds=1):
+        with pytest.raises(BootstrapLockTimeout):
+            with bootstrap_lock(db.engine, lock_file, timeout_seconds=0.1):
+                pass
+
+    with bootstrap_lock(db.engine, lock_file, timeout_seconds=0.1):
+        pass
+
+
+def test_concurrent_bootstraps_run_one_after_the_other(app, recorded_bootstrap):
+    def bootstrap():
+        with app.app_context():
+            database_bootstrap.run_database_bootstrap()
+
+    threads = [threading.Thread(target=bootstrap) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert recorded_bootstrap == [("upgrade", "start"), ("upgrade", "end"), ("seed", "done")] * 3
+
+
+def test_bootstrap_cli_command(app, recorded_bootstrap):
+    result = app.test_cli_runner().invoke(args=["bootstrap-db"])
+
+    assert result.exit_code == 0, result.output
+    assert recorded_bootstrap == [("upgrade", "start"), ("upgrade", "end"), ("seed", "done")]
+
+
+def test_bootstrap_cli_command_skips_the_bootstrap_on_app_import():
+    config = {"TESTING": False, "DB_BOOTSTRAP": "auto"}
+
+    assert bootstrap_on_startup(config, ["gunicorn", "-w", "4", "app:app"])
+    assert bootstrap_on_startup(config, ["flask", "db", "upgrade"])
+    assert not bootstrap_on_startup(config, ["flask", "--app", "app.py", "bootstrap-db"])
+    assert not bootstrap_on_startup({**config, "DB_BOOTSTRAP": "skip"}, ["gunicorn", "app:app"])
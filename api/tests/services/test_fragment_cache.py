@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import update
+
+from extensions import db
+from models import Article
+from services.fragment_cache import FragmentCache, prepend_members
+from tests.factories import ArticleFactory, AuthorFactory
+from tests.utils import json_body
+
+
+@pytest.fixture()
+def read_model_enabled(app, monkeypatch):
+    monkeypatch.setitem(app.config, "READ_MODEL_ENABLED", True)
+
+
+def _fill(cache, *ids, tags=lambda row_id: (("articles", row_id),)):
+    return cache.fragments(
+        [(("article", row_id), tags(row_id), {"id": row_id}) for row_id in ids],
+        lambda record: record,
+    )
+
+
+def test_fragment_cache_evicts_least_recently_used_past_the_byte_cap():
+    events = []
+    cache = FragmentCache(max_bytes=20, on_event=lambda *event: events.append(event))
+
+    assert _fill(cache, 1, 2) == [b'{"id":1}', b'{"id":2}']
+    _fill(cache, 1)
+    _fill(cache, 3)
+
+    assert cache.size_bytes == 16
+    assert _fill(cache, 1, 3) and ("hit", "default", 2) in events
+    assert ("eviction", "default", 1) in events
+    _fill(cache, 2)
+    assert events[-2][0] == "miss"
+
+
+def test_fragment_cache_skips_fragments_larger_than_the_cap():
+    cache = FragmentCache(max_bytes=4)
+
+    assert _fill(cache, 1) == [b'{"id":1}']
+    assert len(cache) == 0
+
+
+def test_fragment_cache_invalidates_by_row_and_by_table():
+    cache = FragmentCache()
+    _fill(cache, 1, 2, tags=lambda row_id: (("articles", row_id), ("authors", 9)))
+    _fill(cache, 3)
+
+    assert cache.invalidate([("articles", 1)]) == 1
+    assert cache.invalidate([("authors", 9)]) == 1
+    assert cache.invalidate([("articles", None)]) == 1
+    assert len(cache) == 0 and cache.size_bytes == 0
+
+
+def test_prepend_members_keeps_the_object_valid():
+    assert prepend_members(b'{"b":1}', {"a": b"[]"}) == b'{"a":[],"b":1}'
+    assert prepend_members(b"{}", {"a": b"2"}) == b'{"a":2}'
+
+
+def test_list_responses_reuse_fragments(client, read_model_enabled):
+    ArticleFactory.create_batch(3)
+    cache = client.application.extensions["fragment_cache"]
+
+    first = client.get("/articles")
+    second = client.get("/articles", headers={"If-None-Match": "stale"})
+
+    assert second.data == first.data
+    assert len(cache) == 3
+    body = client.get("/metrics").data.decode("utf-8")
+    assert 'cache_hits_total{cache="fragment",endpoint="articles.list_articles"' in body
+
+
+def test_committed_writes_drop_the_fragments_of_changed_rows(client, read_model_enabled):
+    author = AuthorFactory(name="Antes")
+    article = ArticleFactory(author=author)
+    ArticleFactory()
+    db.session.commit()
+    cache = client.application.extensions["fragment_cache"]
+    client.get("/articles")
+    assert len(cache) == 2
+
+    client.patch(f"/authors/{author.id}", json={"author": {"name": "Depois"}})
+
+    assert len(cache) == 1
+    payload = json_body(client.get(f"/articles/{article.id}"))
+    assert payload["author"]["name"] == "Depois"
+
+
+def test_an_edit_that_keeps_updated_at_misses_the_fragment(client, read_model_enabled):
+    # Another worker's edit in the same second leaves updated_at as it was on MySQL
+    stamp = datetime(2025, 12, 1, 12, 0, 0)
+    article = ArticleFactory(title="one", updated_at=stamp)
+    client.get("/articles")
+
+    db.session.execute(
+        update(Article).where(Article.id == article.id).values(title="EDITED", updated_at=stamp)
+    )
+
+    assert [item["title"] for item in json_body(client.get("/articles"))] == ["EDITED"]
@@ -0,0 +1,79 @@
+import threading
+
+from services.jwks_key_ring import JwksKeyRing
+from tests.keycloak_stub import generate_signing_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_key_ring_refreshes_in_background_before_expiry():
+    _, public_jwk = generate_signing_key("ring-key")
+    fetched = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        fetched.set()
+        return {"keys": [public_jwk, {"kid": "enc-key", "use": "enc", "kty": "RSA"}]}
+
+    clock = FakeClock()
+    ring = JwksKeyRing(fetch, ttl_seconds=100, refresh_ahead_ratio=0.8, clock=clock)
+    key = ring.get("ring-key")
+    assert key is not None
+    assert ring.get("ring-key") is key
+    assert "enc-key" not in ring._keys
+    assert len(calls) == 1
+
+    fetched.clear()
+    clock.now = 85
+    assert ring.get("ring-key") is key
+    assert fetched.wait(timeout=2)
+    ring._background_refresh.join(timeout=2)
+
+    assert len(calls) == 2
+    assert ring.get("ring-key") is not key
+
+
+def test_key_ring_refetches_an_unknown_kid_at_most_once_per_interval():
+    _, public_jwk = generate_signing_key("ring-key")
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"keys": [public_jwk]}
+
+    clock = FakeClock()
+    ring = JwksKeyRing(fetch, ttl_seconds=300, unknown_kid_min_interval=30, clock=clock)
+    ring.get("ring-key")
+
+    assert ring.get("rotated-key") is None
+    assert ring.get("other-key") is None
+    clock.now = 29
+    assert ring.get("rotated-key") is None
+    assert len(calls) == 2
+
+    clock.now = 31
+    assert ring.get("rotated-key") is None
+    assert len(calls) == 3
+
+
+def test_key_ring_initial_load_counts_as_the_unknown_kid_refetch():
+    _, public_jwk = generate_signing_key("ring-key")
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        return {"keys": [public_jwk]}
+
+    clock = FakeClock()
+    ring = JwksKeyRing(fetch, ttl_seconds=300, unknown_kid_min_interval=30, clock=clock)
+
+    assert ring.get("rotated-key") is None
+    assert ring.get("rotated-key") is None
+    assert len(calls) == 1
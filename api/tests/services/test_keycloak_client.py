@@ -0,0 +1,115 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from jose import jwt
+
+from services.keycloak_client import KeycloakClient, KeycloakError
+from tests.keycloak_stub import StubKeycloakServer, generate_signing_key, sign_token
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+        self.ok = True
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self, jwks):
+        self.jwks = jwks
+        self.calls = []
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        if url.endswith("openid-configuration"):
+            return FakeResponse({"jwks_uri": "http://keycloak/certs", "token_endpoint": "http://keycloak/token"})
+        return FakeResponse(self.jwks)
+
+
+@pytest.fixture(scope="module")
+def signing_key():
+    private_pem, public_jwk = generate_signing_key("test-key")
+    return private_pem, {"keys": [public_jwk]}
+
+
+def _token(private_pem, **claims):
+    return sign_token(private_pem, "test-key", **claims)
+
+
+def test_decode_token_reuses_verified_claims(signing_key, monkeypatch):
+    private_pem, jwks = signing_key
+    client = KeycloakClient("http://keycloak", "demo", "api", session=FakeSession(jwks))
+    token = _token(private_pem, exp=int(time.time()) + 300)
+
+    first = client.decode_token(token)
+    monkeypatch.setattr(jwt, "decode", lambda *args, **kwargs: pytest.fail("signature re-verified"))
+    second = client.decode_token(token)
+
+    assert second == first
+    second["realm_access"]["roles"].append("tampered")
+    assert client.decode_token(token)["realm_access"]["roles"] == ["admin"]
+
+
+def test_decode_token_drops_cached_claims_after_expiry(signing_key, monkeypatch):
+    private_pem, jwks = signing_key
+    client = KeycloakClient("http://keycloak", "demo", "api", session=FakeSession(jwks))
+    now = time.time()
+    token = _token(private_pem, exp=int(now) + 60)
+    client.decode_token(token)
+
+    verifications = []
+    original_decode = jwt.decode
+    monkeypatch.setattr(
+        jwt, "decode", lambda *args, **kwargs: verifications.append(1) or original_decode(*args, **kwargs)
+    )
+    monkeypatch.setattr(time, "time", lambda: now + 120)
+    client.decode_token(token)
+
+    assert verifications == [1]
+
+
+def test_claims_cache_is_bounded(signing_key):
+    private_pem, jwks = signing_key
+    client = KeycloakClient("http://keycloak", "demo", "api", session=FakeSession(jwks), claims_cache_size=2)
+    exp = int(time.time()) + 300
+
+    for index in range(3):
+        client.decode_token(_token(private_pem, exp=exp, sub=str(index)))
+
+    assert len(client._claims_cache) == 2
+
+
+def test_concurrent_cold_decodes_fetch_jwks_once(signing_key):
+    private_pem, jwks = signing_key
+    exp = int(time.time()) + 300
+    tokens = [_token(private_pem, exp=exp, sub=str(index)) for index in range(8)]
+
+    with StubKeycloakServer(keys=jwks["keys"], delay_seconds=0.2) as server:
+        client = KeycloakClient(server.base_url, server.realm, "api")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(client.decode_token, tokens))
+
+    assert len(results) == 8
+    assert server.jwks_requests == 1
+
+
+def test_unknown_kid_triggers_rate_limited_refetch(signing_key):
+    private_pem, jwks = signing_key
+    rotated_pem, rotated_jwk = generate_signing_key("rotated-key")
+    exp = int(time.time()) + 300
+
+    with StubKeycloakServer(keys=jwks["keys"]) as server:
+        client = KeycloakClient(server.base_url, server.realm, "api")
+        client.decode_token(_token(private_pem, exp=exp))
+
+        server.keys.append(rotated_jwk)
+        claims = client.decode_token(sign_token(rotated_pem, "rotated-key", exp=exp))
+        assert claims["preferred_username"] == "admin"
+        assert server.jwks_requests == 2
+
+        with pytest.raises(KeycloakError):
+            client.decode_token(sign_token(rotated_pem, "unknown-key", exp=exp))
+        assert server.jwks_requests == 2
@@ -0,0 +1,202 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import delete, insert, select, update
+
+from extensions import db
+from models import data_version
+from models import Article, DataChange
+from tests.factories import ArticleFactory, AuthorFactory, SocialFactory
+from tests.utils import assert_max_queries, json_body
+
+
+@pytest.fixture(autouse=True)
+def read_model_enabled(app, monkeypatch):
+    monkeypatch.setitem(app.config, "READ_MODEL_ENABLED", True)
+
+
+@pytest.fixture()
+def catalog_data():
+    author = AuthorFactory(name="Zoë Ñandú")
+    SocialFactory.create_batch(2, author=author)
+    ArticleFactory.create_batch(3, author=author, tags=["dev", "blog"])
+    ArticleFactory(title="Ação – “aspas”", tags=[])
+    AuthorFactory()
+    return author
+
+
+def _read_model(client):
+    return client.application.extensions["read_model"]
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/articles",
+        "/articles?view=summary",
+        "/articles?limit=2",
+        "/authors",
+        "/authors/{author}",
+        "/authors/{author}/articles?view=summary&limit=2",
+        "/articles/{article}",
+    ],
+)
+def test_read_model_responses_match_the_database_path(client, monkeypatch, catalog_data, path):
+    path = path.format(author=catalog_data.id, article=catalog_data.articles[0].id)
+
+    from_memory = client.get(path)
+    monkeypatch.setitem(client.application.config, "READ_MODEL_ENABLED", False)
+    from_database = client.get(path)
+
+    assert from_memory.status_code == from_database.status_code == 200
+    assert from_memory.data == from_database.data
+
+
+def test_read_model_pages_follow_the_cursor(client, catalog_data):
+    first = json_body(client.get("/articles", query_string={"limit": 3}))
+    rest = json_body(
+        client.get("/articles", query_string={"limit": 3, "cursor": first["next_cursor"]})
+    )
+
+    assert len(first["data"]) == 3
+    assert len(rest["data"]) == 1
+    assert rest["next_cursor"] is None
+
+
+def test_read_model_serves_unchanged_data_with_the_etag_query_only(client, catalog_data):
+    client.get("/authors")
+
+    with assert_max_queries(1):
+        response = client.get("/authors")
+
+    assert len(json_body(response)) == 3
+
+
+def test_read_model_refresh_selects_only_the_changed_rows(client, catalog_data):
+    client.get("/articles")
+    before = dict(_read_model(client).current().records("articles"))
+    refreshes = _read_model(client).refreshes.copy()
+    article, other = catalog_data.articles[:2]
+    article.title = "Revisado"
+    db.session.flush()
+
+    with assert_max_queries(2):
+        payload = json_body(client.get(f"/articles/{article.id}"))
+
+    after = _read_model(client).current().records("articles")
+    assert payload["title"] == "Revisado"
+    assert after[other.id] is before[other.id]
+    assert after[article.id].version != before[article.id].version
+    assert _read_model(client).refreshes - refreshes == {("articles", "changes"): 1}
+
+
+def test_read_model_rereads_the_table_after_a_core_insert(client, catalog_data):
+    client.get("/articles")
+    before = dict(_read_model(client).current().records("articles"))
+    refreshes = _read_model(client).refreshes.copy()
+
+    # The log cannot name the rows of a Core INSERT
+    db.session.execute(
+        insert(Article),
+        [
+            {
+                "title": "Nova",
+                "slug": "nova",
+                "published_label": "Hoje",
+                "post_entry": "x",
+                "tags": [],
+                "author_id": catalog_data.id,
+            }
+        ],
+    )
+    payload = json_body(client.get("/articles"))
+
+    after = _read_model(client).current().records("articles")
+    assert "Nova" in [item["title"] for item in payload]
+    assert all(after[article_id] is record for article_id, record in before.items())
+    assert _read_model(client).refreshes - refreshes == {("articles", "refresh"): 1}
+
+
+def test_read_model_rereads_the_table_when_the_log_was_pruned(client, catalog_data):
+    client.get("/articles")
+    refreshes = _read_model(client).refreshes.copy()
+    article = catalog_data.articles[0]
+    article.title = "Revisado"
+    db.session.flush()
+    db.session.execute(delete(DataChange).where(DataChange.table_name == "articles"))
+
+    payload = json_body(client.get(f"/articles/{article.id}"))
+
+    assert payload["title"] == "Revisado"
+    assert _read_model(client).refreshes - refreshes == {("articles", "refresh"): 1}
+
+
+def test_read_model_keeps_the_database_order_of_authors(client, monkeypatch, catalog_data):
+    client.get("/authors")
+    refreshes = _read_model(client).refreshes.copy()
+    catalog_data.name = "Aaron"
+    db.session.flush()
+
+    from_memory = client.get("/authors")
+    monkeypatch.setitem(client.application.config, "READ_MODEL_ENABLED", False)
+    from_database = client.get("/authors")
+
+    assert json_body(from_memory)[0]["name"] == "Aaron"
+    assert from_memory.data == from_database.data
+    assert _read_model(client).refreshes - refreshes == {("authors", "changes"): 1}
+
+
+def test_read_model_sees_an_edit_that_keeps_updated_at(client):
+    # MySQL's whole-second DATETIME stores the same updated_at for two edits in one second
+    stamp = datetime(2025, 12, 1, 12, 0, 0)
+    article = ArticleFactory(title="one", updated_at=stamp)
+    ArticleFactory(updated_at=stamp)
+    client.get("/articles")
+
+    db.session.execute(
+        update(Article).where(Article.id == article.id).values(title="EDITED", updated_at=stamp)
+    )
+
+    client.get(f"/articles/{article.id}")
+
+    assert _read_model(client).current().article(article.id).title == "EDITED"
+
+
+def test_read_model_drops_deleted_rows(client, catalog_data):
+    client.get("/articles")
+    article = catalog_data.articles[0]
+    db.session.delete(article)
+    db.session.flush()
+
+    assert client.get(f"/articles/{article.id}").status_code == 404
+    assert len(json_body(client.get("/articles"))) == 3
+
+
+def test_change_log_keeps_the_last_versions_of_each_table(monkeypatch):
+    monkeypatch.setattr(data_version, "CHANGE_LOG_RETENTION", 2)
+    for _ in range(4):
+        data_version.bump_versions(db.session, ["articles"])
+        db.session.commit()
+
+    assert db.session.scalars(
+        select(DataChange.version).where(DataChange.table_name == "articles").order_by(DataChange.version)
+    ).all() == [3, 4]
+
+
+def test_read_model_interns_tags(client, catalog_data):
+    client.get("/articles")
+    records = list(_read_model(client).current().records("articles").values())
+
+    tags = [record.tags for record in records if record.tags]
+    assert tags[0][0] is tags[1][0]
+
+
+def test_metrics_report_read_model_memory(client, catalog_data):
+    client.get("/authors/%d" % catalog_data.id)
+
+    body = client.get("/metrics").data.decode("utf-8")
+
+    assert "read_model_memory_bytes{" in body
+    assert "read_model_memory_bytes_per_10k_articles{" in body
+    assert 'read_model_rows{' in body and 'table="articles"' in body
+    assert 'read_model_refreshes_total{' in body and 'mode="full"' in body
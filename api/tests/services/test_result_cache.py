@@ -0,0 +1,66 @@
+from sqlalchemy import insert
+
+from extensions import db
+from models import Social
+from services.result_cache import ResultCache
+from tests.factories import AuthorFactory
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_result_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = ResultCache(ttl_seconds=10, clock=clock)
+    cache.set(("key",), "value", ["articles"])
+
+    clock.now = 9
+    assert cache.get(("key",)) == "value"
+
+    clock.now = 10
+    assert cache.get(("key",)) is None
+
+
+def test_result_cache_evicts_least_recently_used():
+    events = []
+    cache = ResultCache(max_entries=2, on_event=lambda outcome, name: events.append(outcome))
+    cache.set(("a",), 1, ["articles"])
+    cache.set(("b",), 2, ["articles"])
+    cache.get(("a",))
+    cache.set(("c",), 3, ["articles"])
+
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) == 1
+    assert events == ["hit", "eviction", "miss", "hit"]
+
+
+def test_result_cache_invalidates_only_dependent_entries():
+    cache = ResultCache()
+    cache.set(("counts",), 1, ["articles", "authors"])
+    cache.set(("socials",), 2, ["socials"])
+
+    assert cache.invalidate_tables(["articles"]) == 1
+    assert cache.get(("counts",)) is None
+    assert cache.get(("socials",)) == 2
+
+
+def test_bulk_statements_invalidate_on_commit(app):
+    cache = app.extensions["result_cache"]
+    cache.set(("socials",), 1, ["socials"])
+    cache.set(("counts",), 2, ["articles"])
+    author = AuthorFactory()
+
+    db.session.execute(
+        insert(Social),
+        [{"slug": "bulk", "profile_link": "https://example.com", "description": "x", "author_id": author.id}],
+    )
+    assert cache.get(("socials",)) == 1
+    db.session.commit()
+
+    assert cache.get(("socials",)) is None
+    assert cache.get(("counts",)) == 2
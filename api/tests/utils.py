@@ -1,6 +1,29 @@
 import json
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
 
 
 def json_body(response):
     return json.loads(response.data.decode("utf-8"))
 
+
+@contextmanager
+def assert_max_queries(budget: int):
+    """Fail when the block runs more SQL statements than ``budget`` (catches N+1 regressions)."""
+
+    statements = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", count_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(Engine, "before_cursor_execute", count_statement)
+
+    assert len(statements) <= budget, (
+        f"Expected at most {budget} queries, got {len(statements)}:\n" + "\n".join(statements)
+    )